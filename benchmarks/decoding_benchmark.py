@@ -0,0 +1,99 @@
+# IMPORTING STANDARD PACKAGES
+import argparse
+import json
+import tracemalloc
+
+from time import perf_counter
+
+# IMPORTING LOCAL PACKAGES
+from benchmarks.stub_server import messages, relation
+from unipile_integration.data import MessageChat, RelationData
+from unipile_integration.decoding import JSON, STREAM, ORJSON, orjson
+from unipile_integration.parsing import parse_page
+
+
+class _PageResponse:
+
+    status_code = 200
+
+    def __init__(self, content: bytes):
+
+        self.content = content
+
+    def json(self) -> dict:
+
+        return json.loads(self.content)
+
+
+def _message_page(page_size: int) -> bytes:
+
+    items = messages("chat-ACouser-0", page_size)
+    for item in items:
+        item["attachments"] = [{
+            "id": f"{item['id']}-attachment",
+            "type": "file",
+            "file_name": "resume.pdf",
+            "file_size": 123456,
+            "mimetype": "application/pdf",
+            "url": f"https://example.com/{item['id']}/resume.pdf"
+        }]
+        item["reactions"] = [{"value": "+1", "sender_id": item["sender_id"], "is_sender": False}]
+    return json.dumps({
+        "object": "MessageList",
+        "items": items,
+        "cursor": "next-page"
+    }, separators=(",", ":")).encode()
+
+
+def _relation_page(page_size: int) -> bytes:
+
+    return json.dumps({
+        "object": "UserRelationsList",
+        "items": [relation(index) for index in range(page_size)],
+        "cursor": "next-page"
+    }, separators=(",", ":")).encode()
+
+
+def _measure(content: bytes, item_type: type, decoder: str, pages: int) -> dict:
+
+    response = _PageResponse(content)
+    start = perf_counter()
+    for _ in range(pages):
+        parse_page(response, item_type, decoder=decoder)
+    elapsed = perf_counter() - start
+
+    tracemalloc.start()
+    _, items, cursor = parse_page(response, item_type, decoder=decoder)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert cursor == "next-page"
+    return {
+        "pages_per_second": round(pages / elapsed, 1),
+        "items_per_second": round(pages * len(items) / elapsed),
+        "peak_bytes_per_page": peak
+    }
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description="Compare the JSON decoders used for paginated responses")
+    parser.add_argument("--page-size", type=int, default=250)
+    parser.add_argument("--pages", type=int, default=200)
+    args = parser.parse_args()
+
+    decoders = [JSON, STREAM] + ([ORJSON] if orjson is not None else [])
+    pages = {
+        "chat_messages": (_message_page(args.page_size), MessageChat),
+        "relations": (_relation_page(args.page_size), RelationData)
+    }
+    results = {
+        name: {
+            "page_bytes": len(content),
+            **{decoder: _measure(content, item_type, decoder, args.pages) for decoder in decoders}
+        } for name, (content, item_type) in pages.items()
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
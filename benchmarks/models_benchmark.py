@@ -0,0 +1,118 @@
+# IMPORTING STANDARD PACKAGES
+import argparse
+import json
+import tracemalloc
+
+from datetime import datetime
+from time import perf_counter
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import MessageChat, RelationData
+
+
+class LegacyMessageChat:
+
+    def __init__(self, **kwargs):
+        self.id = kwargs.get("id")
+        self.attachments = kwargs.get("attachments")
+        self.timestamp = datetime.strptime(kwargs.get('timestamp').split('.')[0], "%Y-%m-%dT%H:%M:%S")
+        self.chat_id = kwargs.get("chat_id")
+        self.chat_provider_id = kwargs.get("chat_provider_id")
+        self.sender_id = kwargs.get("sender_id")
+        self.message_text = kwargs.get("text")
+        self.seen = kwargs.get("seen") == 1
+        self.deleted = kwargs.get("deleted") == 1
+        self.delivered = kwargs.get("delivered") == 1
+        self.edited = kwargs.get("edited") == 1
+        self.hidden = kwargs.get("hidden") == 1
+
+
+class LegacyRelationData:
+
+    def __init__(self, **kwargs):
+
+        (self.created_at, self.first_name, self.last_name,
+         self.member_id, self.public_identifier, self.headline) = (kwargs.get("created_at"), kwargs.get("first_name"),
+                                                                   kwargs.get("last_name"), kwargs.get("member_id"),
+                                                                   kwargs.get("public_identifier"),
+                                                                   kwargs.get("headline"))
+
+
+def _message_payloads(count: int) -> list:
+
+    return [{
+        "id": f"msg-{index}",
+        "attachments": [],
+        "timestamp": f"2024-03-{1 + index % 28:02d}T10:{index % 60:02d}:{index % 60:02d}.000Z",
+        "chat_id": "chat",
+        "chat_provider_id": "provider",
+        "sender_id": f"sender-{index % 2}",
+        "text": f"message {index}",
+        "seen": 1,
+        "deleted": 0,
+        "delivered": 1,
+        "edited": 0,
+        "hidden": 0
+    } for index in range(count)]
+
+
+def _relation_payloads(count: int) -> list:
+
+    return [{
+        "created_at": 1700000000000 - index,
+        "first_name": "First",
+        "last_name": "Last",
+        "member_id": f"member-{index}",
+        "public_identifier": f"user-{index}",
+        "headline": "Recruiter"
+    } for index in range(count)]
+
+
+def _measure(build, payloads: list, read_timestamps: bool = False) -> dict:
+
+    start = perf_counter()
+    records = build(payloads)
+    if read_timestamps:
+        for record in records:
+            _ = record.timestamp
+    elapsed = perf_counter() - start
+    del records
+
+    tracemalloc.start()
+    records = build(payloads)
+    if read_timestamps:
+        for record in records:
+            _ = record.timestamp
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return {
+        "objects_per_second": round(len(payloads) / elapsed),
+        "bytes_per_100k": round(size / len(payloads) * 100000)
+    }
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description="Compare legacy data models against the slotted records")
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    messages = _message_payloads(args.count)
+    relations = _relation_payloads(args.count)
+    results = {
+        "message_chat": {
+            "legacy": _measure(lambda items: [LegacyMessageChat(**item) for item in items], messages),
+            "slotted_lazy_timestamp": _measure(MessageChat.from_items, messages),
+            "slotted_timestamp_read": _measure(MessageChat.from_items, messages, read_timestamps=True),
+        },
+        "relation_data": {
+            "legacy": _measure(lambda items: [LegacyRelationData(**item) for item in items], relations),
+            "slotted": _measure(RelationData.from_items, relations),
+        }
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# IMPORTING STANDARD PACKAGES
+import argparse
+import json
+
+from concurrent.futures import ThreadPoolExecutor
+from statistics import mean
+from time import perf_counter, sleep
+from typing import List, Tuple
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.scheduler import AccountScheduler
+
+
+def _workload(heavy_accounts: int, heavy_items: int, light_accounts: int, light_items: int) -> List[str]:
+
+    # heavy accounts submit their whole backlog first, as a big send_message or list_all_relations would
+    return [f"heavy-{index}" for index in range(heavy_accounts) for _ in range(heavy_items)] + \
+        [f"light-{index}" for index in range(light_accounts) for _ in range(light_items)]
+
+
+def _fifo(owners: List[str], workers: int, call_latency: float) -> Tuple[float, dict]:
+
+    submitted_at = perf_counter()
+    waits = {}
+
+    def call(owner_id: str) -> None:
+        waits.setdefault(owner_id, []).append(perf_counter() - submitted_at)
+        sleep(call_latency)
+
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(call, owners))
+    return perf_counter() - start, waits
+
+
+def _scheduled(owners: List[str], workers: int, call_latency: float, account_concurrency: int) -> Tuple[float, dict]:
+
+    waits = {}
+    start = perf_counter()
+    with AccountScheduler(workers=workers, account_concurrency=account_concurrency) as scheduler:
+        futures = [scheduler.submit(owner_id, sleep, call_latency) for owner_id in owners]
+        for future in futures:
+            result = future.result()
+            waits.setdefault(result.owner_id, []).append(result.waited)
+    return perf_counter() - start, waits
+
+
+def _summary(elapsed: float, waits: dict, total: int) -> dict:
+
+    heavy = [wait for owner_id, values in waits.items() if owner_id.startswith("heavy") for wait in values]
+    light = [wait for owner_id, values in waits.items() if owner_id.startswith("light") for wait in values]
+    return {
+        "calls_per_second": round(total / elapsed, 1),
+        "heavy_mean_wait_seconds": round(mean(heavy), 4),
+        "light_mean_wait_seconds": round(mean(light), 4),
+        "light_max_wait_seconds": round(max(light), 4)
+    }
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description="Compare FIFO execution against the fair account scheduler")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 4, 16])
+    parser.add_argument("--heavy-accounts", type=int, default=4)
+    parser.add_argument("--heavy-items", type=int, default=100)
+    parser.add_argument("--light-accounts", type=int, default=20)
+    parser.add_argument("--light-items", type=int, default=5)
+    parser.add_argument("--account-concurrency", type=int, default=4)
+    parser.add_argument("--call-latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    owners = _workload(args.heavy_accounts, args.heavy_items, args.light_accounts, args.light_items)
+    results = {}
+    for workers in args.workers:
+        results[f"workers_{workers}"] = {
+            "fifo": _summary(*_fifo(owners, workers, args.call_latency), len(owners)),
+            "fair": _summary(*_scheduled(owners, workers, args.call_latency, args.account_concurrency), len(owners))
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
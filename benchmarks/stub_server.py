@@ -0,0 +1,381 @@
+# IMPORTING STANDARD PACKAGES
+import json
+import zlib
+
+from datetime import datetime, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from threading import Thread, Lock
+from time import sleep
+from typing import Optional, List, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+OWNER_PROVIDER_ID = "ACoOWNER"
+STUB_MESSAGE_TEXT = "Hello from the benchmark"
+LATEST_TIMESTAMP = datetime(2024, 6, 1, 12, 0, 0)
+
+
+class StubConfig:
+    latency: float
+    page_size: int
+    chats: int
+    messages_per_chat: int
+    relations: int
+    search_results: int
+    throttle_every: int
+    retry_after: float
+
+    def __init__(self, latency: float = 0, page_size: int = 100, chats: int = 200, messages_per_chat: int = 20,
+                 relations: int = 1000, search_results: int = 200, throttle_every: int = 0,
+                 retry_after: float = 0):
+
+        self.latency = latency
+        self.page_size = page_size
+        self.chats = chats
+        self.messages_per_chat = messages_per_chat
+        self.relations = relations
+        self.search_results = search_results
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+
+    def to_dict(self) -> dict:
+
+        return dict(vars(self))
+
+
+class StubStats:
+    requests: int
+    throttled: int
+    _lock: Lock
+
+    def __init__(self):
+
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+
+        with self._lock:
+            self.requests = 0
+            self.throttled = 0
+
+    def count(self, throttle_every: int) -> bool:
+
+        with self._lock:
+            self.requests += 1
+            throttled = throttle_every > 0 and self.requests % throttle_every == 0
+            if throttled:
+                self.throttled += 1
+            return throttled
+
+    def to_dict(self) -> dict:
+
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled
+        }
+
+
+def _bucket(value: str, modulo: int) -> int:
+
+    return zlib.crc32(value.encode()) % modulo
+
+
+def _timestamp(index: int) -> str:
+
+    return (LATEST_TIMESTAMP - timedelta(minutes=index)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _page(items: List[dict], query: dict, page_size: int) -> dict:
+
+    offset = int(query.get("cursor", ["0"])[0])
+    limit = min(int(query.get("limit", [str(page_size)])[0]), page_size)
+    next_offset = offset + limit
+    return {
+        "object": "ItemList",
+        "items": items[offset:next_offset],
+        "cursor": str(next_offset) if next_offset < len(items) else None
+    }
+
+
+def profile(identifier: str) -> dict:
+
+    provider_id = identifier if identifier.startswith("ACo") else f"ACo{identifier}"
+    return {
+        "object": "UserProfile",
+        "provider_id": provider_id,
+        "public_identifier": identifier,
+        "first_name": "Stub",
+        "last_name": identifier,
+        "is_relationship": _bucket(provider_id, 2) == 0
+    }
+
+
+def has_conversation(provider_id: str) -> bool:
+
+    return _bucket(provider_id, 3) == 0
+
+
+def chat(index: int, account_id: str) -> dict:
+
+    return {
+        "object": "Chat",
+        "id": f"chat-{index}",
+        "account_id": account_id,
+        "attendee_provider_id": f"ACouser-{index}",
+        "provider_id": f"2-{index}",
+        "timestamp": _timestamp(index),
+        "folder": ["INBOX"]
+    }
+
+
+def messages(chat_id: str, count: int) -> List[dict]:
+
+    attendee = chat_id[len("chat-"):]
+    items = []
+    for index in range(count):
+        # the oldest message is ours, the attendee answers every other message after it
+        sender = OWNER_PROVIDER_ID if index % 2 == 0 else attendee
+        items.append({
+            "object": "Message",
+            "id": f"{chat_id}-msg-{index}",
+            "chat_id": chat_id,
+            "chat_provider_id": f"2-{chat_id}",
+            "sender_id": sender,
+            "text": STUB_MESSAGE_TEXT if index == 0 else f"message {index}",
+            "attachments": [],
+            "timestamp": _timestamp(count - index),
+            "seen": 1,
+            "delivered": 1
+        })
+    items.reverse()
+    return items
+
+
+def relation(index: int) -> dict:
+
+    return {
+        "object": "UserRelation",
+        "member_id": f"ACouser-{index}",
+        "public_identifier": f"user-{index}",
+        "first_name": "Stub",
+        "last_name": f"User {index}",
+        "headline": "Benchmark relation",
+        "created_at": 1700000000000 - index * 1000
+    }
+
+
+def search_result(keywords: str, index: int) -> dict:
+
+    # queries share most of their candidates so deduplication across queries has work to do
+    candidate = _bucket(keywords, 10) + index
+    return {
+        "object": "SearchResult",
+        "type": "PEOPLE",
+        "id": f"ACocandidate-{candidate}",
+        "public_identifier": f"candidate-{candidate}",
+        "first_name": "Candidate",
+        "last_name": str(candidate),
+        "headline": f"Stub candidate for {keywords}",
+        "location": "Milan, Italy",
+        "network_distance": "DISTANCE_3",
+        "public_profile_url": f"https://www.linkedin.com/in/candidate-{candidate}",
+        "current_positions": [{"company": "Stub Company", "role": "Engineer"}]
+    }
+
+
+def job_posting(job_post_id: str) -> dict:
+
+    return {
+        "data": {
+            "jobPostingId": job_post_id,
+            "title": f"Job {job_post_id}",
+            "companyDetails": {
+                "com.linkedin.voyager.jobs.JobPostingCompany": {
+                    "companyResolutionResult": {
+                        "entityUrn": "urn:li:fs_normalized_company:1",
+                        "name": "Stub Company",
+                        "url": "https://www.linkedin.com/company/stub"
+                    }
+                }
+            },
+            "workplaceTypes": ["urn:li:fs_workplaceType:2"],
+            "description": {"text": "A job posting served by the benchmark stub."},
+            "formattedLocation": "Milan, Italy",
+            "listedAt": 1700000000000,
+            "employmentStatusResolutionResult": {"entityUrn": "urn:li:fs_employmentStatus:FULL_TIME"}
+        }
+    }
+
+
+def job_post_skills(job_post_id: str) -> dict:
+
+    return {
+        "data": {
+            "skillMatchStatuses": [
+                {"localizedSkillDisplayName": f"Skill {index}"} for index in range(5)
+            ]
+        }
+    }
+
+
+class StubUnipileHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    config: StubConfig = StubConfig()
+    stats: StubStats = StubStats()
+
+    def _send_json(self, status: int, payload: Optional[dict], headers: dict = None) -> None:
+
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        for name, value in (headers if headers is not None else {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self) -> Tuple[List[str], dict]:
+
+        url = urlsplit(self.path)
+        path = url.path
+        if path.startswith("/api/v1"):
+            path = path[len("/api/v1"):]
+        return [segment for segment in path.split("/") if segment != ""], parse_qs(url.query)
+
+    def _before(self) -> bool:
+
+        if self.config.latency > 0:
+            sleep(self.config.latency)
+        if self.stats.count(self.config.throttle_every):
+            self._send_json(429, {"status": 429, "type": "errors/too_many_requests"}, {
+                "Retry-After": str(self.config.retry_after)
+            })
+            return False
+        return True
+
+    def _read_body(self) -> dict:
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        try:
+            return json.loads(body) if body else {}
+        except ValueError:
+            return {}
+
+    def do_GET(self) -> None:
+
+        if not self._before():
+            return
+        segments, query = self._route()
+        account_id = query.get("account_id", ["account"])[0]
+        config = self.config
+        if segments == ["users", "me"]:
+            return self._send_json(200, {**profile(OWNER_PROVIDER_ID), "object": "AccountOwnerProfile"})
+        if segments == ["users", "relations"]:
+            return self._send_json(200, _page([relation(index) for index in range(config.relations)], query,
+                                              config.page_size))
+        if len(segments) == 2 and segments[0] == "users":
+            return self._send_json(200, profile(segments[1]))
+        if segments == ["chats"]:
+            return self._send_json(200, _page([chat(index, account_id) for index in range(config.chats)], query,
+                                              config.page_size))
+        if len(segments) == 2 and segments[0] == "chats":
+            return self._send_json(200, {**chat(0, account_id), "id": segments[1]})
+        if len(segments) == 3 and segments[0] == "chats" and segments[2] == "messages":
+            return self._send_json(200, _page(messages(segments[1], config.messages_per_chat), query,
+                                              config.page_size))
+        if len(segments) == 3 and segments[0] == "chat_attendees" and segments[2] == "chats":
+            if not has_conversation(segments[1]):
+                return self._send_json(404, {"status": 404, "type": "errors/resource_not_found"})
+            return self._send_json(200, {
+                "object": "ChatList",
+                "items": [{**chat(0, account_id), "id": f"chat-{segments[1]}",
+                           "attendee_provider_id": segments[1]}],
+                "cursor": None
+            })
+        self._send_json(404, {"status": 404, "type": "errors/resource_not_found"})
+
+    def do_POST(self) -> None:
+
+        body = self._read_body()
+        if not self._before():
+            return
+        segments, query = self._route()
+        if segments == ["accounts"]:
+            return self._send_json(201, {"object": "AccountCreated", "account_id": "stub-account"})
+        if segments == ["chats"]:
+            return self._send_json(201, {"object": "ChatStarted", "chat_id": f"chat-{body.get('attendees_ids')}"})
+        if len(segments) == 3 and segments[0] == "chats" and segments[2] == "messages":
+            return self._send_json(201, {"object": "MessageSent", "message_id": "message"})
+        if segments == ["users", "invite"]:
+            return self._send_json(201, {"object": "UserInvitationSent", "invitation_id": "invitation"})
+        if segments == ["linkedin", "search"]:
+            keywords = str(body.get("keywords", ""))
+            return self._send_json(200, {
+                **_page([search_result(keywords, index) for index in range(self.config.search_results)], query,
+                        self.config.page_size),
+                "object": "LinkedinSearch"
+            })
+        if segments == ["linkedin"]:
+            request_url = body.get("request_url", "")
+            job_post_id = request_url.rstrip("/").split("/")[-1].split(":")[-1]
+            if "voyagerAssessmentsDashJobSkillMatchInsight" in request_url:
+                return self._send_json(200, job_post_skills(job_post_id))
+            return self._send_json(200, job_posting(job_post_id))
+        self._send_json(404, {"status": 404, "type": "errors/resource_not_found"})
+
+    def do_DELETE(self) -> None:
+
+        if not self._before():
+            return
+        self._send_json(200, {"object": "AccountDeleted"})
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    # concurrent clients open many connections at once, the default backlog of 5 stalls them on SYN retries
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class StubUnipileServer:
+    config: StubConfig
+    stats: StubStats
+    _server: _StubHTTPServer
+    _thread: Thread
+
+    def __init__(self, handler: type = StubUnipileHandler, host: str = "127.0.0.1", port: int = 0,
+                 config: StubConfig = None):
+
+        self.config = config if config is not None else StubConfig()
+        self.stats = StubStats()
+        handler = type(handler.__name__, (handler,), {"config": self.config, "stats": self.stats})
+        self._server = _StubHTTPServer((host, port), handler)
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    def start(self) -> "StubUnipileServer":
+
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubUnipileServer":
+
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+
+        self.stop()
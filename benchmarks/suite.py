@@ -0,0 +1,205 @@
+# IMPORTING STANDARD PACKAGES
+import argparse
+import json
+import platform
+
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+# IMPORTING LOCAL PACKAGES
+from benchmarks.stub_server import StubUnipileServer, StubConfig, STUB_MESSAGE_TEXT, OWNER_PROVIDER_ID
+from unipile_integration import __version__
+from unipile_integration.data import MessageCheck, IntegrationAccountData
+from unipile_integration.instrumentation import MetricsRecorder
+from unipile_integration.linkedin import LinkedinUniPileIntegration
+from unipile_integration.linkedin_recruiter import RecruiterSearchClient
+
+OWNER_ID = "bench-account"
+
+
+def _usernames(batch_size: int) -> List[str]:
+
+    return [f"user-{index}" for index in range(batch_size)]
+
+
+def _check_replies(client: LinkedinUniPileIntegration, batch_size: int) -> int:
+
+    messages = [MessageCheck(**{
+        "username": username,
+        "message_text": STUB_MESSAGE_TEXT
+    }) for username in _usernames(batch_size)]
+    return len(client.check_replies(OWNER_ID, messages))
+
+
+def _check_connections(client: LinkedinUniPileIntegration, batch_size: int) -> int:
+
+    return len(client.check_connections(OWNER_ID, _usernames(batch_size)))
+
+
+def _send_message(client: LinkedinUniPileIntegration, batch_size: int) -> int:
+
+    client.send_message(_usernames(batch_size), OWNER_ID, STUB_MESSAGE_TEXT)
+    return batch_size
+
+
+def _iter_send_messages(client: LinkedinUniPileIntegration, batch_size: int) -> int:
+
+    return sum(1 for _ in client.iter_send_messages(_usernames(batch_size), OWNER_ID, STUB_MESSAGE_TEXT))
+
+
+def _list_all_relations(client: LinkedinUniPileIntegration, batch_size: int) -> int:
+
+    return len(client.list_all_relations(OWNER_ID, max_number_of_relations=batch_size))
+
+
+def _read_full_chat(client: LinkedinUniPileIntegration, batch_size: int) -> int:
+
+    return len(client.read_full_chat("chat-ACouser-0", max_number_of_messages=batch_size))
+
+
+def _scrape_job_posts(client: LinkedinUniPileIntegration, batch_size: int) -> int:
+
+    return len(client.scrape_job_posts(OWNER_ID, [str(index) for index in range(batch_size)]))
+
+
+def _recruiter_search(client: LinkedinUniPileIntegration, batch_size: int) -> int:
+
+    account = IntegrationAccountData(**{
+        "provider_id": OWNER_PROVIDER_ID,
+        "owner_id": OWNER_ID,
+        "recruiter": {"contract_id": "stub-contract", "owner_seat_id": "stub-seat"}
+    })
+    search = RecruiterSearchClient.from_integration(client, account, page_size=100)
+    return sum(1 for _ in search.search(["engineer", "designer", "product manager"]))
+
+
+# scenarios whose batch size is the number of items served by the stub rather than the number of calls
+COLLECTION_SCENARIOS = {
+    "list_all_relations": "relations",
+    "read_full_chat": "messages_per_chat",
+    "recruiter_search": "search_results"
+}
+
+SCENARIOS: Dict[str, Callable[[LinkedinUniPileIntegration, int], int]] = {
+    "check_replies": _check_replies,
+    "check_connections": _check_connections,
+    "send_message": _send_message,
+    "iter_send_messages": _iter_send_messages,
+    "list_all_relations": _list_all_relations,
+    "read_full_chat": _read_full_chat,
+    "scrape_job_posts": _scrape_job_posts,
+    "recruiter_search": _recruiter_search
+}
+
+
+def _latency_summary(recorder: MetricsRecorder) -> dict:
+
+    return {
+        endpoint: {
+            "requests": metrics["latency"]["count"],
+            "mean_seconds": metrics["latency"]["sum"] / metrics["latency"]["count"],
+            "p50_seconds": metrics["latency"]["p50"],
+            "p99_seconds": metrics["latency"]["p99"],
+            "status_codes": metrics["status_codes"],
+            "retries": metrics["retries"]
+        } for endpoint, metrics in recorder.snapshot()["endpoints"].items()
+    }
+
+
+def run_scenario(server: StubUnipileServer, name: str, batch_size: int, repeat: int,
+                 max_concurrency: int) -> dict:
+
+    if name in COLLECTION_SCENARIOS:
+        setattr(server.config, COLLECTION_SCENARIOS[name], batch_size)
+    server.stats.reset()
+    recorder = MetricsRecorder()
+    timings, items = [], 0
+    for _ in range(repeat):
+        with LinkedinUniPileIntegration("bench", server.base_url, max_concurrency=max_concurrency,
+                                        pool_size=max_concurrency, instrumentation=recorder) as client:
+            start = perf_counter()
+            items = SCENARIOS[name](client, batch_size)
+            timings.append(perf_counter() - start)
+    elapsed = median(timings)
+    return {
+        "scenario": name,
+        "batch_size": batch_size,
+        "items": items,
+        "repeat": repeat,
+        "median_seconds": elapsed,
+        "min_seconds": min(timings),
+        "items_per_second": items / elapsed if elapsed > 0 else None,
+        "server": server.stats.to_dict(),
+        "endpoints": _latency_summary(recorder)
+    }
+
+
+def compare(results: dict, baseline: dict) -> List[dict]:
+
+    baseline_runs = {(run["scenario"], run["batch_size"]): run for run in baseline.get("results", [])}
+    comparison = []
+    for run in results["results"]:
+        previous = baseline_runs.get((run["scenario"], run["batch_size"]))
+        if previous is None:
+            continue
+        comparison.append({
+            "scenario": run["scenario"],
+            "batch_size": run["batch_size"],
+            "baseline_seconds": previous["median_seconds"],
+            "current_seconds": run["median_seconds"],
+            "speedup": previous["median_seconds"] / run["median_seconds"] if run["median_seconds"] > 0 else None
+        })
+    return comparison
+
+
+def run_suite(config: StubConfig, scenarios: List[str], batch_sizes: List[int], repeat: int = 3,
+              max_concurrency: int = 10) -> dict:
+
+    results = []
+    with StubUnipileServer(config=config) as server:
+        for name in scenarios:
+            for batch_size in batch_sizes:
+                results.append(run_scenario(server, name, batch_size, repeat, max_concurrency))
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "max_concurrency": max_concurrency,
+        "stub": config.to_dict(),
+        "results": results
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+
+    parser = argparse.ArgumentParser(description="Benchmark LinkedinUniPileIntegration against a local Unipile stub")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=[10, 50, 200])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-concurrency", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds the stub waits before every response")
+    parser.add_argument("--page-size", type=int, default=100, help="maximum items the stub returns per page")
+    parser.add_argument("--throttle-every", type=int, default=0, help="answer every Nth request with a 429")
+    parser.add_argument("--retry-after", type=float, default=0, help="Retry-After sent with injected 429s")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare against")
+    args = parser.parse_args(argv)
+
+    config = StubConfig(latency=args.latency, page_size=args.page_size, throttle_every=args.throttle_every,
+                        retry_after=args.retry_after)
+    results = run_suite(config, args.scenarios, args.batch_sizes, repeat=args.repeat,
+                        max_concurrency=args.max_concurrency)
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            results["comparison"] = compare(results, json.load(f))
+    output = json.dumps(results, indent=2)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# IMPORTING STANDARD PACKAGES
+import argparse
+import json
+
+from time import perf_counter
+
+# IMPORTING THIRD PARTY PACKAGES
+import requests
+
+# IMPORTING LOCAL PACKAGES
+from benchmarks.stub_server import StubUnipileServer
+from unipile_integration.linkedin import LinkedinUniPileIntegration
+
+
+def _unpooled_calls(base_url: str, number_of_calls: int) -> float:
+
+    start = perf_counter()
+    for index in range(number_of_calls):
+        requests.get(f"{base_url}/users/user-{index}?account_id=bench", headers={
+            "X-API-KEY": "bench"
+        })
+    return number_of_calls / (perf_counter() - start)
+
+
+def _pooled_calls(base_url: str, number_of_calls: int) -> float:
+
+    with LinkedinUniPileIntegration("bench", base_url) as client:
+        start = perf_counter()
+        for index in range(number_of_calls):
+            client._base_call(f"users/user-{index}?account_id=bench", {}, method_name="get")
+        return number_of_calls / (perf_counter() - start)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description="Compare per-call connections against the pooled transport")
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    with StubUnipileServer() as server:
+        unpooled = _unpooled_calls(server.base_url, args.calls)
+        pooled = _pooled_calls(server.base_url, args.calls)
+    print(json.dumps({
+        "calls": args.calls,
+        "unpooled_requests_per_second": round(unpooled, 1),
+        "pooled_requests_per_second": round(pooled, 1),
+        "speedup": round(pooled / unpooled, 2)
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# IMPORTING STANDARD PACKAGES
+import argparse
+import json
+import os
+import sys
+
+from collections import Counter
+from time import perf_counter
+from typing import List
+
+# IMPORTING THIRD PARTY PACKAGES
+import requests
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.readiness import AccountReadiness
+from unipile_integration.webhooks import WebhookDispatcher, WebhookReceiver, ANY_EVENT, ACCOUNT_STATUS_EVENT, \
+    load_recorded_events, replay_events, replay_events_http, parse_event
+
+DEFAULT_RECORDING = os.path.join(os.path.dirname(__file__), "data", "webhook_events.ndjson")
+REPLAY_TOKEN = "replay-token"
+
+
+def expected_effects(payloads: List[dict]) -> dict:
+
+    events = [event for event in (parse_event(payload) for payload in payloads) if event is not None]
+    statuses = {}
+    for event in events:
+        if event.event == ACCOUNT_STATUS_EVENT and event.account_id is not None:
+            statuses[event.account_id] = event.status
+    return {
+        "received": dict(Counter(event.event for event in events)),
+        "dispatched": len(events),
+        "messages": sorted({event.message.id for event in events if event.message is not None}),
+        "statuses": statuses
+    }
+
+
+def rejections(url: str, max_body_size: int) -> dict:
+
+    with requests.Session() as session:
+        return {
+            "unauthorized": session.post(url, json={}, headers={"Unipile-Auth": "wrong"}).status_code,
+            "too_large": session.post(url, data=b" " * (max_body_size + 1),
+                                      headers={"Unipile-Auth": REPLAY_TOKEN}).status_code,
+            "unknown_path": session.post(url + "/unknown", json={},
+                                         headers={"Unipile-Auth": REPLAY_TOKEN}).status_code
+        }
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description="Replay recorded Unipile webhook payloads through the receiver")
+    parser.add_argument("recording", nargs="?", default=DEFAULT_RECORDING)
+    parser.add_argument("--repeat", type=int, default=1000)
+    parser.add_argument("--http", action="store_true", help="post the payloads to a local WebhookReceiver")
+    args = parser.parse_args()
+
+    payloads = load_recorded_events(args.recording) * args.repeat
+    expected = expected_effects(payloads)
+    received, messages = Counter(), set()
+    readiness = AccountReadiness()
+    rejected = None
+    with WebhookDispatcher() as dispatcher:
+        dispatcher.register(ANY_EVENT, lambda event: received.update([event.event]))
+        dispatcher.on_message(lambda event: messages.add(event.message.id))
+        readiness.attach(dispatcher)
+        start = perf_counter()
+        if args.http:
+            with WebhookReceiver(dispatcher, host="127.0.0.1", port=0, auth_token=REPLAY_TOKEN) as receiver:
+                status_codes = replay_events_http(payloads, receiver.url, headers={"Unipile-Auth": REPLAY_TOKEN})
+                dispatcher.join()
+                elapsed = perf_counter() - start
+                rejected = rejections(receiver.url, receiver.max_body_size)
+        else:
+            status_codes = {"replayed": replay_events(payloads, dispatcher)}
+            elapsed = perf_counter() - start
+
+    # the replay is only a valid measurement when every event reached its handlers with the expected effect
+    checks = {
+        "received": dict(received) == expected["received"],
+        "dispatched": dispatcher.dispatched == expected["dispatched"],
+        "handler_failures": dispatcher.failed == 0,
+        "messages": sorted(messages) == expected["messages"],
+        "statuses": all(readiness.status(account_id) == status
+                        for account_id, status in expected["statuses"].items()),
+        "status_codes": status_codes == ({200: len(payloads)} if args.http else {"replayed": expected["dispatched"]})
+    }
+    if rejected is not None:
+        checks["rejections"] = rejected == {"unauthorized": 401, "too_large": 413, "unknown_path": 404}
+    print(json.dumps({
+        "payloads": len(payloads),
+        "events_per_second": round(len(payloads) / elapsed, 1),
+        "status_codes": status_codes,
+        "received": dict(received),
+        "handler_failures": dispatcher.failed,
+        "rejections": rejected,
+        "checks": checks
+    }, indent=2))
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
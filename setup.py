@@ -12,7 +12,12 @@ setuptools.setup(
     author=__author__,
     author_email=__email__,
     description="Python package to add integration with unipile",
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=["benchmarks", "benchmarks.*"]),
     package_dir={"unipile_integration": "./unipile_integration"},
     install_requires=requirements,
+    extras_require={
+        "async": ["httpx"],
+        "fast": ["orjson"],
+        "export": ["pyarrow"],
+    },
 )
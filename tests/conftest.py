@@ -0,0 +1,81 @@
+# IMPORTING STANDARD PACKAGES
+from typing import Callable, Dict, List, Tuple
+
+# IMPORTING THIRD PARTY PACKAGES
+import pytest
+
+# IMPORTING LOCAL PACKAGES
+from benchmarks.stub_server import StubUnipileServer, StubUnipileHandler, StubConfig
+from unipile_integration.linkedin import LinkedinUniPileIntegration
+from unipile_integration.rate_limit import RetryPolicy
+from unipile_integration.transport import HttpTransport
+
+NO_RETRIES = RetryPolicy(max_retries=0)
+
+
+class RecordingHandler(StubUnipileHandler):
+    # both are replaced per server, tests switch faults on and off while the server runs
+    log: List[Tuple[str, str]] = []
+    faults: Dict[str, int] = {}
+
+    def _before(self) -> bool:
+
+        self.log.append((self.command, self.path))
+        for fragment, status in list(self.faults.items()):
+            if fragment in self.path:
+                self._send_json(status, {"status": status, "type": "errors/stub_fault"})
+                return False
+        return super()._before()
+
+
+def requests_to(server: StubUnipileServer, fragment: str, method: str = "GET") -> int:
+
+    return sum(1 for command, path in server.log if command == method and fragment in path)
+
+
+@pytest.fixture
+def stub() -> Callable[..., StubUnipileServer]:
+
+    servers = []
+
+    def start(handler: type = RecordingHandler, **config) -> StubUnipileServer:
+        log, faults = [], {}
+        handler = type(handler.__name__, (handler,), {"log": log, "faults": faults})
+        server = StubUnipileServer(handler, config=StubConfig(**config)).start()
+        server.log, server.faults = log, faults
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def transport_for() -> Callable[..., HttpTransport]:
+
+    transports = []
+
+    def create(server: StubUnipileServer, **kwargs) -> HttpTransport:
+        transport = HttpTransport("token", server.base_url, **kwargs)
+        transports.append(transport)
+        return transport
+
+    yield create
+    for transport in transports:
+        transport.close()
+
+
+@pytest.fixture
+def client_for() -> Callable[..., LinkedinUniPileIntegration]:
+
+    clients = []
+
+    def create(server: StubUnipileServer, **kwargs) -> LinkedinUniPileIntegration:
+        client = LinkedinUniPileIntegration("token", server.base_url, **kwargs)
+        clients.append(client)
+        return client
+
+    yield create
+    for client in clients:
+        client.close()
@@ -0,0 +1,39 @@
+# IMPORTING LOCAL PACKAGES
+from benchmarks.stub_server import STUB_MESSAGE_TEXT
+from conftest import NO_RETRIES, requests_to
+from unipile_integration.chat_index import ChatIndex
+from unipile_integration.data import MessageCheck
+from unipile_integration.instrumentation import MetricsRecorder
+
+RECIPIENTS = ["user-3", "user-20"]
+
+
+def indexed_client(stub, client_for):
+
+    server = stub(chats=10, page_size=5)
+    recorder = MetricsRecorder()
+    client = client_for(server, chat_index=ChatIndex(), instrumentation=recorder, retry_policy=NO_RETRIES)
+    client.refresh_chat_index("account")
+    return server, client, recorder
+
+
+def test_a_fresh_index_answers_the_conversation_checks(stub, client_for):
+
+    server, client, recorder = indexed_client(stub, client_for)
+    sent = client.send_message(RECIPIENTS, "account", "hello")
+    assert [item.linkedin_id for item in sent] == ["ACouser-20"]
+    assert requests_to(server, "chat_attendees") == 0
+    assert recorder.snapshot()["fallbacks"] == {}
+
+
+def test_a_failed_refresh_is_counted_and_skips_the_stale_index(stub, client_for):
+
+    server, client, recorder = indexed_client(stub, client_for)
+    server.faults["chats?limit"] = 500
+    client.send_message(RECIPIENTS, "account", "hello")
+    assert requests_to(server, "chat_attendees") == len(RECIPIENTS)
+    checks = client.check_replies("account", [MessageCheck(username=username, message_text=STUB_MESSAGE_TEXT)
+                                              for username in RECIPIENTS])
+    assert all(check.error is None for check in checks)
+    assert requests_to(server, "chat_attendees") > len(RECIPIENTS)
+    assert recorder.snapshot()["fallbacks"] == {"refresh_chat_index": {"PageError": 2}}
@@ -0,0 +1,46 @@
+# IMPORTING STANDARD PACKAGES
+import json
+
+# IMPORTING THIRD PARTY PACKAGES
+import pytest
+import requests
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.decoding import JSON, STREAM, iter_page_items
+
+
+def _decode(content, decoder: str) -> tuple:
+
+    meta = {}
+    items = list(iter_page_items(content, meta, decoder=decoder))
+    return items, meta
+
+
+def test_stream_decoder_matches_json_on_a_stub_page(stub):
+
+    server = stub(messages_per_chat=30, page_size=10)
+    content = requests.get(f"{server.base_url}/chats/chat-1/messages", params={"limit": 10}).content
+    page = json.loads(content)
+    items, meta = _decode(content, STREAM)
+    assert len(items) == 10 and items == page.pop("items")
+    assert meta == page and meta["cursor"] is not None
+    assert _decode(content, STREAM) == _decode(content, JSON)
+
+
+def test_stream_decoder_matches_json_on_formatted_bodies():
+
+    page = {"object": "MessageList", "cursor": None,
+            "items": [{"id": "msg-1", "text": "café ☕", "nested": {"list": [1, 2.5, None, True]}},
+                      {"id": "msg-2", "text": "a \"quoted\" ] } , value"}],
+            "after": {"total": 2}}
+    for content in (json.dumps(page), json.dumps(page, indent=2), json.dumps(page, ensure_ascii=False).encode()):
+        assert _decode(content, STREAM) == _decode(content, JSON)
+    assert _decode(b' {"items" : [ ] , "cursor" : "c"} ', STREAM) == ([], {"cursor": "c"})
+    assert _decode(b'{}', STREAM) == ([], {})
+
+
+def test_stream_decoder_rejects_malformed_bodies():
+
+    for content in (b'[]', b'{"items": [{"id": 1} {"id": 2}]}', b'{"items": [1,', b'{"cursor": "c"'):
+        with pytest.raises(json.JSONDecodeError):
+            _decode(content, STREAM)
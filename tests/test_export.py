@@ -0,0 +1,60 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+import glob
+import json
+import os
+
+# IMPORTING LOCAL PACKAGES
+from conftest import NO_RETRIES, requests_to
+from unipile_integration.async_linkedin import AsyncLinkedinUniPileIntegration
+from unipile_integration.export import ChatExportWriter, InMemoryExportCheckpointStore, SQLiteExportCheckpointStore
+
+ACCOUNT_ID = "account"
+
+
+def exported_rows(directory: str) -> list:
+
+    rows = []
+    for path in glob.glob(os.path.join(directory, "**", "*.ndjson"), recursive=True):
+        with open(path, encoding="utf-8") as file:
+            rows.extend(json.loads(line) for line in file)
+    return rows
+
+
+def test_export_resumes_only_the_failed_chats(stub, client_for, tmp_path):
+
+    server = stub(chats=6, messages_per_chat=5)
+    client = client_for(server, retry_policy=NO_RETRIES)
+    checkpoint = SQLiteExportCheckpointStore(str(tmp_path / "checkpoint.db"))
+    server.faults["chats/chat-3/messages"] = 500
+    first = client.export_chats(ACCOUNT_ID, ChatExportWriter(str(tmp_path), export_format="ndjson"),
+                                checkpoint=checkpoint, max_concurrency=2)
+    assert (first.chats, first.messages, first.skipped) == (5, 25, 0)
+    assert list(first.failed) == ["chat-3"]
+    server.faults.clear()
+    second = client.export_chats(ACCOUNT_ID, ChatExportWriter(str(tmp_path), export_format="ndjson"),
+                                 checkpoint=checkpoint, max_concurrency=2)
+    assert (second.chats, second.messages, second.skipped, second.failed) == (1, 5, 5, {})
+    assert requests_to(server, "chats/chat-3/messages") == 2
+    assert requests_to(server, "chats/chat-1/messages") == 1
+    rows = exported_rows(str(tmp_path))
+    assert sorted(row["message_id"] for row in rows) == \
+        sorted(f"chat-{chat}-msg-{index}" for chat in range(6) for index in range(5))
+    checkpoint.close()
+
+
+def test_async_export_skips_checkpointed_chats(stub, tmp_path):
+
+    server = stub(chats=6, messages_per_chat=5)
+    checkpoint = InMemoryExportCheckpointStore()
+    checkpoint.mark_completed(ACCOUNT_ID, ["chat-0", "chat-1"])
+
+    async def export():
+        async with AsyncLinkedinUniPileIntegration("token", server.base_url) as client:
+            return await client.export_chats(ACCOUNT_ID, ChatExportWriter(str(tmp_path), export_format="ndjson"),
+                                             checkpoint=checkpoint)
+
+    result = asyncio.run(export())
+    assert (result.chats, result.messages, result.skipped) == (4, 20, 2)
+    assert checkpoint.completed_chats(ACCOUNT_ID) == {f"chat-{index}" for index in range(6)}
+    assert len(exported_rows(str(tmp_path))) == 20
@@ -0,0 +1,109 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+from threading import Lock
+from time import sleep
+
+# IMPORTING LOCAL PACKAGES
+from benchmarks.stub_server import STUB_MESSAGE_TEXT
+from conftest import RecordingHandler
+from unipile_integration.async_linkedin import AsyncLinkedinUniPileIntegration
+from unipile_integration.data import MessageCheck
+
+USERNAMES = [f"user-{index}" for index in range(12)]
+BROKEN_USERNAME = "user-5"
+
+
+class Gauge:
+    current: int
+    peak: int
+    _lock: Lock
+
+    def __init__(self):
+
+        self.current = 0
+        self.peak = 0
+        self._lock = Lock()
+
+    def __enter__(self) -> "Gauge":
+
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+
+        with self._lock:
+            self.current -= 1
+
+
+class GaugeHandler(RecordingHandler):
+    gauge: Gauge = Gauge()
+
+    def do_GET(self) -> None:
+
+        with self.gauge:
+            sleep(0.05)
+            if f"users/{BROKEN_USERNAME}?" in self.path:
+                body = b"not json"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            super().do_GET()
+
+
+def gauge_server(stub):
+
+    gauge = Gauge()
+    server = stub(type("GaugeHandler", (GaugeHandler,), {"gauge": gauge}))
+    return server, gauge
+
+
+def test_check_connections_fans_out_within_the_bound_and_keeps_the_order(stub, client_for):
+
+    server, gauge = gauge_server(stub)
+    client = client_for(server)
+    sequential = client.check_connections("account", USERNAMES, max_concurrency=1)
+    assert gauge.peak == 1
+    parallel = client.check_connections("account", USERNAMES, max_concurrency=4)
+    assert gauge.peak == 4
+    assert [check.username for check in parallel] == USERNAMES
+    assert [(check.has_accepted, check.error) for check in parallel] == \
+        [(check.has_accepted, check.error) for check in sequential]
+    broken = parallel[USERNAMES.index(BROKEN_USERNAME)]
+    assert broken.has_accepted is False and broken.error is not None
+    assert sum(1 for check in parallel if check.error is None) == len(USERNAMES) - 1
+
+
+def test_check_replies_fans_out_and_isolates_failures(stub, client_for):
+
+    server, gauge = gauge_server(stub)
+    client = client_for(server)
+    messages = [MessageCheck(username=username, message_text=STUB_MESSAGE_TEXT) for username in USERNAMES]
+    sequential = client.check_replies("account", messages, max_concurrency=1)
+    parallel = client.check_replies("account", messages, max_concurrency=4)
+    assert 1 < gauge.peak <= 4
+    assert [check.username for check in parallel] == USERNAMES
+    assert [(check.reply_text, check.chat_id, check.error) for check in parallel] == \
+        [(check.reply_text, check.chat_id, check.error) for check in sequential]
+    assert any(check.reply_text for check in parallel)
+    assert parallel[USERNAMES.index(BROKEN_USERNAME)].error is not None
+
+
+def test_async_check_connections_matches_the_sync_client(stub, client_for):
+
+    server, gauge = gauge_server(stub)
+    expected = client_for(server).check_connections("account", USERNAMES, max_concurrency=1)
+    gauge.peak = 0
+
+    async def check() -> list:
+        async with AsyncLinkedinUniPileIntegration("token", server.base_url) as client:
+            return await client.check_connections("account", USERNAMES, max_concurrency=3)
+
+    checks = asyncio.run(check())
+    assert gauge.peak == 3
+    assert [(check.username, check.has_accepted, check.error is None) for check in checks] == \
+        [(check.username, check.has_accepted, check.error is None) for check in expected]
@@ -0,0 +1,31 @@
+# IMPORTING THIRD PARTY PACKAGES
+import pytest
+
+# IMPORTING LOCAL PACKAGES
+from conftest import NO_RETRIES, requests_to
+from unipile_integration.data import InvitationResult
+from unipile_integration.pagination import PageError
+
+USERNAMES = ["user-2", "user-12", "stranger-1", "user-2"]
+
+
+def test_known_relations_are_answered_without_a_profile_lookup(stub, client_for):
+
+    server = stub(relations=15, page_size=5)
+    client = client_for(server)
+    results = client.send_connections("account", USERNAMES)
+    assert [result.username for result in results] == ["user-2", "user-12", "stranger-1"]
+    assert [result.status for result in results[:2]] == [InvitationResult.ALREADY_CONNECTED] * 2
+    assert requests_to(server, "users/user-") == 0
+    assert requests_to(server, "users/stranger-1") == 1
+
+
+def test_a_failed_relations_page_raises_instead_of_inviting_known_relations(stub, client_for):
+
+    server = stub(relations=15, page_size=5)
+    server.faults["cursor=10"] = 500
+    client = client_for(server, retry_policy=NO_RETRIES)
+    with pytest.raises(PageError):
+        client.send_connections("account", USERNAMES)
+    assert requests_to(server, "users/invite", method="POST") == 0
+    assert requests_to(server, "users/user-12") == 0
@@ -0,0 +1,73 @@
+# IMPORTING LOCAL PACKAGES
+from benchmarks.stub_server import job_posting
+from conftest import NO_RETRIES, RecordingHandler, requests_to
+from unipile_integration.cache import JobPostCache
+from unipile_integration.parsing import parse_job_post
+
+
+class _JobPostResponse:
+
+    status_code = 200
+
+    def __init__(self, payload: dict):
+
+        self._payload = payload
+
+    def json(self) -> dict:
+
+        return self._payload
+
+
+class JobPostHandler(RecordingHandler):
+
+    def _read_body(self) -> dict:
+
+        self.body = super()._read_body()
+        return self.body
+
+    def _before(self) -> bool:
+
+        request_url = getattr(self, "body", {}).get("request_url", "")
+        if "unavailable" in request_url:
+            self.log.append((self.command, self.path))
+            self._send_json(503, {"status": 503, "type": "errors/provider_unavailable"})
+            return False
+        if "broken" in request_url:
+            self.log.append((self.command, self.path))
+            self._send_json(200, {"data": {}})
+            return False
+        return super()._before()
+
+
+def test_parse_job_post_reads_the_workplace_type():
+
+    def work_mode(workplace_types: list) -> str:
+        payload = job_posting("1")
+        payload["data"]["workplaceTypes"] = workplace_types
+        return parse_job_post(_JobPostResponse(payload))["work_mode_type"]
+
+    # a stray trailing comma used to turn the workplace type into a tuple, reporting every posting as physical
+    assert work_mode(["urn:li:fs_workplaceType:1"]) == "physical"
+    assert work_mode(["urn:li:fs_workplaceType:2"]) == "fully_remote"
+    assert work_mode(["urn:li:fs_workplaceType:3"]) == "hybrid"
+    assert work_mode([]) is None
+
+
+def test_scrape_job_posts_records_errors_per_job_post(stub, client_for):
+
+    server = stub(JobPostHandler)
+    cache = JobPostCache()
+    client = client_for(server, retry_policy=NO_RETRIES, job_post_cache=cache)
+    results = client.scrape_job_posts("account", ["1", "unavailable", "1", "broken", "2"])
+    assert [result.job_post_id for result in results] == ["1", "unavailable", "broken", "2"]
+    good, unavailable, broken, other = results
+    assert good.succeeded and good.job_post["job_title"] == "Job 1" and len(good.skills) == 5
+    assert other.succeeded and other.job_post["work_mode_type"] == "fully_remote"
+    assert unavailable.error == "job_post: unexpected status code 503; skills: unexpected status code 503"
+    assert unavailable.job_post is None and unavailable.skills is None
+    assert broken.error.startswith("job_post: AttributeError") and "skills: KeyError" in broken.error
+    assert requests_to(server, "linkedin", "POST") == 8
+    server.log.clear()
+    again = client.scrape_job_posts("account", ["1", "2", "broken"])
+    assert [result.cached for result in again] == [True, True, False]
+    assert requests_to(server, "linkedin", "POST") == 2
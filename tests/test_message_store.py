@@ -0,0 +1,55 @@
+# IMPORTING THIRD PARTY PACKAGES
+import pytest
+
+# IMPORTING LOCAL PACKAGES
+from conftest import NO_RETRIES
+from unipile_integration.data import MessageChat
+from unipile_integration.message_store import MessageStore
+from unipile_integration.pagination import PageError
+
+
+def test_message_sync_stores_nothing_from_a_failed_walk(stub, client_for):
+
+    server = stub(messages_per_chat=30, page_size=10)
+    store = MessageStore()
+    client = client_for(server, retry_policy=NO_RETRIES, message_store=store)
+    server.faults["cursor="] = 500
+    with pytest.raises(PageError):
+        client.sync_chat_messages("chat-1", page_size=10)
+    assert store.latest_message_timestamp("chat-1") is None
+    server.faults.clear()
+    assert len(client.sync_chat_messages("chat-1", page_size=10)) == 30
+    assert all(store.has_message(f"chat-1-msg-{index}") for index in range(30))
+    assert client.sync_chat_messages("chat-1", page_size=10) == []
+    store.close()
+
+
+def test_read_full_chat_stores_only_complete_histories(stub, client_for):
+
+    server = stub(messages_per_chat=30, page_size=10)
+    store = MessageStore()
+    client = client_for(server, retry_policy=NO_RETRIES, message_store=store)
+    assert len(client.read_full_chat("chat-1", max_number_of_messages=10)) == 10
+    assert not store.has_message("chat-1-msg-29")
+    server.faults["cursor="] = 500
+    assert len(client.read_full_chat("chat-1")) == 10
+    assert not store.has_message("chat-1-msg-29")
+    server.faults.clear()
+    assert len(client.read_full_chat("chat-1")) == 30
+    assert store.has_message("chat-1-msg-29") and store.has_message("chat-1-msg-0")
+    store.close()
+
+
+def test_find_reply_keeps_replies_sharing_the_sent_timestamp():
+
+    store = MessageStore()
+    store.add_messages(MessageChat.from_items([
+        {"id": "sent", "sender_id": "owner", "text": " hello ", "timestamp": "2024-01-01T10:00:00.000Z"},
+        {"id": "quick", "sender_id": "attendee", "text": "hi", "timestamp": "2024-01-01T10:00:00.000Z"},
+        {"id": "later", "sender_id": "attendee", "text": "how are you?", "timestamp": "2024-01-01T10:01:00.000Z"},
+        {"id": "ours", "sender_id": "owner", "text": "fine", "timestamp": "2024-01-01T10:02:00.000Z"},
+        {"id": "after", "sender_id": "attendee", "text": "good", "timestamp": "2024-01-01T10:03:00.000Z"}
+    ]), "chat")
+    assert store.find_reply("chat", "hello", "attendee") == "hi\nhow are you?"
+    assert store.find_reply("chat", "unknown", "attendee") == ""
+    store.close()
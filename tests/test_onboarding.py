@@ -0,0 +1,70 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+from typing import Dict
+
+# IMPORTING LOCAL PACKAGES
+from conftest import NO_RETRIES, RecordingHandler, requests_to
+from unipile_integration.async_linkedin import AsyncLinkedinUniPileIntegration
+from unipile_integration.readiness import ReadinessPolicy
+
+READINESS = ReadinessPolicy(initial_delay=0.05, multiplier=1, timeout=2)
+CREDENTIALS = [{"li_at_cookie": account, "user_agent": "agent"} for account in ("ready", "syncing", "revoked")]
+
+
+class OnboardingHandler(RecordingHandler):
+    # the li_at cookie names the account, syncing answers 503 until its countdown runs out
+    pending: Dict[str, int] = {}
+
+    def do_POST(self) -> None:
+
+        body = self._read_body()
+        if self._before():
+            self._send_json(201, {"object": "AccountCreated", "account_id": body.get("access_token")})
+
+    def _before(self) -> bool:
+
+        if not super()._before():
+            return False
+        if self.command != "GET":
+            return True
+        account_id = self._route()[1].get("account_id", [""])[0]
+        if account_id == "revoked":
+            self._send_json(401, {"status": 401, "type": "errors/invalid_credentials"})
+            return False
+        if self.pending.get(account_id, 0) > 0:
+            self.pending[account_id] -= 1
+            self._send_json(503, {"status": 503, "type": "errors/account_not_ready"})
+            return False
+        return True
+
+
+def onboarding_server(stub):
+
+    return stub(type("OnboardingHandler", (OnboardingHandler,), {"pending": {"syncing": 3}}))
+
+
+def test_auth_users_polls_syncing_accounts_and_fails_rejected_ones_fast(stub, client_for):
+
+    server = onboarding_server(stub)
+    client = client_for(server, retry_policy=NO_RETRIES)
+    results = sorted(client.auth_users(CREDENTIALS, readiness=READINESS), key=lambda result: result.index)
+    assert [result.account is not None for result in results] == [True, True, False]
+    assert [result.account.owner_id for result in results[:2]] == ["ready", "syncing"]
+    assert results[2].error == "account not ready"
+    assert results[2].elapsed < 0.5
+    assert requests_to(server, "users/me?account_id=syncing") == 4
+    assert requests_to(server, "users/me?account_id=revoked") == 1
+
+
+def test_async_auth_user_fails_rejected_accounts_fast(stub):
+
+    server = onboarding_server(stub)
+
+    async def onboard() -> list:
+        async with AsyncLinkedinUniPileIntegration("token", server.base_url, retry_policy=NO_RETRIES) as client:
+            return [result async for result in client.auth_users(CREDENTIALS, readiness=READINESS)]
+
+    results = sorted(asyncio.run(onboard()), key=lambda result: result.index)
+    assert [result.account is not None for result in results] == [True, True, False]
+    assert requests_to(server, "users/me?account_id=revoked") == 1
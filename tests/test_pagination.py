@@ -0,0 +1,89 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+# IMPORTING THIRD PARTY PACKAGES
+import pytest
+
+# IMPORTING LOCAL PACKAGES
+from conftest import NO_RETRIES, requests_to
+from unipile_integration.data import RelationData
+from unipile_integration.pagination import PageError, with_cursor, page_limit, iter_items, aiter_items
+from unipile_integration.transport import AsyncHttpTransport
+
+RELATIONS_URL = "users/relations?account_id=account&limit=10"
+
+
+def test_with_cursor_quotes_the_cursor_and_picks_the_separator():
+
+    assert with_cursor("users/relations", None) == "users/relations"
+    assert with_cursor("users/relations", "20") == "users/relations?cursor=20"
+    assert with_cursor("users/relations?limit=10", "a b&c=/d") == "users/relations?limit=10&cursor=a%20b%26c%3D%2Fd"
+
+
+def test_page_limit_only_shrinks_pages_for_small_maximums():
+
+    assert page_limit(None, 100) == 100
+    assert page_limit(25, 100) == 25
+    assert page_limit(0, 100) == 100
+    assert page_limit(1000, 100) == 100
+
+
+def test_iter_items_walks_every_page_once(stub, transport_for):
+
+    server = stub(relations=95, page_size=10)
+    transport = transport_for(server)
+    items = list(iter_items(lambda url: transport.request(url, {}, method_name="get"), RELATIONS_URL, RelationData))
+    assert [item.member_id for item in items] == [f"ACouser-{index}" for index in range(95)]
+    assert requests_to(server, "users/relations") == 10
+
+
+def test_iter_items_stops_fetching_at_max_items(stub, transport_for):
+
+    server = stub(relations=95, page_size=10)
+    transport = transport_for(server)
+    items = list(iter_items(lambda url: transport.request(url, {}, method_name="get"), RELATIONS_URL, RelationData,
+                            max_items=25))
+    assert len(items) == 25
+    assert requests_to(server, "users/relations") == 3
+
+
+def test_iter_items_with_prefetch_returns_the_same_items(stub, transport_for):
+
+    server = stub(relations=95, page_size=10)
+    transport = transport_for(server)
+    fetch = lambda url: transport.request(url, {}, method_name="get")
+    sequential = [item.member_id for item in iter_items(fetch, RELATIONS_URL, RelationData)]
+    prefetched = [item.member_id for item in iter_items(fetch, RELATIONS_URL, RelationData, prefetch=True)]
+    assert prefetched == sequential
+
+
+def test_failed_page_ends_silently_unless_strict(stub, transport_for):
+
+    server = stub(relations=95, page_size=10)
+    server.faults["cursor=20"] = 500
+    transport = transport_for(server, retry_policy=NO_RETRIES)
+    fetch = lambda url: transport.request(url, {}, method_name="get")
+    assert len(list(iter_items(fetch, RELATIONS_URL, RelationData))) == 20
+    items = []
+    with pytest.raises(PageError) as error:
+        for item in iter_items(fetch, RELATIONS_URL, RelationData, strict=True):
+            items.append(item)
+    assert error.value.status_code == 500
+    assert len(items) == 20
+
+
+def test_aiter_items_matches_the_sync_walk(stub):
+
+    server = stub(relations=95, page_size=10)
+
+    async def walk(**kwargs) -> list:
+        async with AsyncHttpTransport("token", server.base_url, retry_policy=NO_RETRIES) as transport:
+            fetch = lambda url: transport.request(url, {}, method_name="get")
+            return [item.member_id async for item in aiter_items(fetch, RELATIONS_URL, RelationData, **kwargs)]
+
+    assert asyncio.run(walk()) == [f"ACouser-{index}" for index in range(95)]
+    assert asyncio.run(walk(prefetch=True, max_items=25)) == [f"ACouser-{index}" for index in range(25)]
+    server.faults["cursor=20"] = 500
+    assert len(asyncio.run(walk())) == 20
+    with pytest.raises(PageError):
+        asyncio.run(walk(strict=True))
@@ -0,0 +1,126 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+from time import sleep
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.pipeline import iter_pipeline, aiter_pipeline, unique
+
+
+def on_error(item, error: BaseException) -> tuple:
+
+    return "error", item, str(error)
+
+
+def test_single_workers_keep_the_input_order():
+
+    stages = [(lambda item: (False, item * 2), 1), (lambda item: (True, item + 1), 1)]
+    assert list(iter_pipeline(range(50), stages, on_error)) == [item * 2 + 1 for item in range(50)]
+
+
+def test_finished_items_skip_the_later_stages_and_errors_are_mapped():
+
+    def first(item: int) -> tuple:
+        if item == 3:
+            raise ValueError("boom")
+        return item % 2 == 1, item
+
+    second_calls = []
+
+    def second(item: int) -> tuple:
+        second_calls.append(item)
+        return True, -item
+
+    results = list(iter_pipeline(range(8), [(first, 2), (second, 2)], on_error))
+    assert sorted(second_calls) == [0, 2, 4, 6]
+    assert sorted(results, key=str) == sorted([0, -2, -4, -6, 1, 5, 7, ("error", 3, "boom")], key=str)
+
+
+def test_closing_the_pipeline_stops_pulling_input():
+
+    pulled, calls = [], []
+
+    def items():
+        for item in range(10000):
+            pulled.append(item)
+            yield item
+
+    def stage(item: int) -> tuple:
+        calls.append(item)
+        return True, item
+
+    results = iter_pipeline(items(), [(stage, 4)], on_error, queue_size=2)
+    next(results)
+    results.close()
+    sleep(0.3)
+    pulled_after_close, calls_after_close = len(pulled), len(calls)
+    sleep(0.3)
+    assert pulled_after_close < 20
+    assert (len(pulled), len(calls)) == (pulled_after_close, calls_after_close)
+
+
+def test_max_pending_bounds_the_last_stage_ahead_of_the_consumer():
+
+    calls = []
+
+    def stage(item: int) -> tuple:
+        calls.append(item)
+        return True, item
+
+    results = iter_pipeline(range(100), [(lambda item: (False, item), 2), (stage, 4)], on_error, max_pending=2)
+    received = [next(results)]
+    sleep(0.3)
+    assert len(calls) == 2
+    received.extend(next(results) for _ in range(10))
+    sleep(0.3)
+    assert len(calls) == len(received) + 1
+    results.close()
+    sleep(0.3)
+    assert len(calls) == len(received) + 1
+    assert set(received) <= set(calls)
+
+
+def test_async_pipeline_keeps_order_and_bounds_the_last_stage():
+
+    calls = []
+
+    async def double(item: int) -> tuple:
+        return False, item * 2
+
+    async def send(item: int) -> tuple:
+        calls.append(item)
+        if item == 6:
+            raise ValueError("boom")
+        return True, item + 1
+
+    async def consume(max_pending=None, take=None) -> list:
+        results = []
+        pipeline = aiter_pipeline(range(20), [(double, 1), (send, 1)], on_error, max_pending=max_pending)
+        async for result in pipeline:
+            results.append(result)
+            if take is not None and len(results) == take:
+                await asyncio.sleep(0.1)
+                break
+        await pipeline.aclose()
+        return results
+
+    expected = [("error", 6, "boom") if item == 3 else item * 2 + 1 for item in range(20)]
+    assert asyncio.run(consume()) == expected
+    calls.clear()
+    assert asyncio.run(consume(max_pending=2, take=1)) == [1]
+    assert len(calls) == 2
+
+
+def test_unique_is_lazy_and_keeps_the_first_occurrence():
+
+    pulled = []
+
+    def items():
+        for item in ["bob", "alice", "bob", "carol", "alice"]:
+            pulled.append(item)
+            yield item
+
+    deduplicated = unique(items())
+    assert next(deduplicated) == "bob"
+    assert pulled == ["bob"]
+    assert list(deduplicated) == ["alice", "carol"]
@@ -0,0 +1,64 @@
+# IMPORTING STANDARD PACKAGES
+from concurrent.futures import ThreadPoolExecutor
+
+# IMPORTING THIRD PARTY PACKAGES
+import pytest
+
+# IMPORTING LOCAL PACKAGES
+import unipile_integration.cache as cache_module
+
+from unipile_integration.cache import ProfileCache, InMemoryProfileCacheBackend
+
+PAYLOAD = {"provider_id": "ACoAda", "public_identifier": "ada", "is_relationship": True}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, "time", lambda: now[0])
+    return now
+
+
+def test_profiles_expire_after_the_ttl(clock):
+
+    cache = ProfileCache(ttl=60, connection_ttl=10)
+    cache.set("owner", "ada", PAYLOAD)
+    assert cache.get("owner", "ada").user_id == "ACoAda"
+    assert cache.get("other", "ada") is None
+    clock[0] += 60
+    assert cache.get("owner", "ada") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_connection_checks_need_a_fresher_profile(clock):
+
+    cache = ProfileCache(ttl=60, connection_ttl=10)
+    cache.set("owner", "ada", PAYLOAD)
+    clock[0] += 10
+    assert cache.get("owner", "ada", require_connection=True) is None
+    assert cache.get("owner", "ada").has_connection is True
+    cache.set("owner", "ada", PAYLOAD)
+    assert cache.get("owner", "ada", require_connection=True) is not None
+
+
+def test_invalidate_drops_every_linkedin_api(clock):
+
+    backend = InMemoryProfileCacheBackend()
+    cache = ProfileCache(backend)
+    for linkedin_api in ProfileCache.LINKEDIN_APIS:
+        cache.set("owner", "ada", PAYLOAD, linkedin_api)
+    cache.set("owner", "grace", PAYLOAD)
+    cache.invalidate("owner", "ada")
+    assert len(backend) == 1
+    assert all(cache.get("owner", "ada", linkedin_api) is None for linkedin_api in ProfileCache.LINKEDIN_APIS)
+    assert cache.get("owner", "grace") is not None
+
+
+def test_counters_are_exact_under_concurrent_reads():
+
+    cache = ProfileCache()
+    cache.set("owner", "ada", PAYLOAD)
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda index: cache.get("owner", "ada" if index % 2 == 0 else "grace"), range(4000)))
+    assert (cache.hits, cache.misses) == (2000, 2000)
@@ -0,0 +1,76 @@
+# IMPORTING STANDARD PACKAGES
+import sqlite3
+
+from concurrent.futures import ThreadPoolExecutor
+from time import time, sleep
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import MessageData
+from unipile_integration.quota import Quota, QuotaTracker, SQLiteQuotaBackend, INVITATION, MESSAGE, INMAIL, DAY
+
+USERNAMES = ["stranger-1", "stranger-2", "stranger-3"]
+
+
+def test_sqlite_usage_survives_reopening_the_database(tmp_path):
+
+    path = str(tmp_path / "quota.db")
+    backend = SQLiteQuotaBackend(path)
+    quota = QuotaTracker({INVITATION: Quota(3)}, backend)
+    assert quota.try_acquire("owner", INVITATION) and quota.try_acquire("owner", INVITATION)
+    quota.record("owner", INVITATION, time() - 2 * DAY)
+    backend.close()
+    backend = SQLiteQuotaBackend(path)
+    quota = QuotaTracker({INVITATION: Quota(3)}, backend)
+    assert quota.remaining("owner", INVITATION) == 1
+    assert quota.remaining("other", INVITATION) == 3
+    assert quota.try_acquire("owner", INVITATION) and not quota.try_acquire("owner", INVITATION)
+    quota.release("owner", INVITATION)
+    assert quota.remaining("owner", INVITATION) == 1
+    backend.close()
+
+
+def test_sqlite_backends_sharing_a_file_never_overshoot_the_limit(tmp_path):
+
+    path = str(tmp_path / "quota.db")
+    backends = [SQLiteQuotaBackend(path) for _ in range(4)]
+    trackers = [QuotaTracker({MESSAGE: Quota(10)}, backend) for backend in backends]
+    with ThreadPoolExecutor(8) as executor:
+        acquired = list(executor.map(lambda index: trackers[index % 4].try_acquire("owner", MESSAGE), range(60)))
+    assert sum(acquired) == 10
+    assert trackers[0].remaining("owner", MESSAGE) == 0
+    for backend in backends:
+        backend.close()
+
+
+def test_sqlite_acquire_waits_for_another_writer(tmp_path):
+
+    path = str(tmp_path / "quota.db")
+    backend = SQLiteQuotaBackend(path)
+    quota = QuotaTracker({MESSAGE: Quota(1)}, backend)
+    # another process takes the last slot while the acquire below is waiting for the write lock
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    writer.execute("INSERT INTO quota_usage (owner_id, action, timestamp) VALUES (?, ?, ?)", ("owner", MESSAGE, time()))
+    with ThreadPoolExecutor(1) as executor:
+        acquired = executor.submit(quota.try_acquire, "owner", MESSAGE)
+        sleep(0.2)
+        assert not acquired.done()
+        writer.execute("COMMIT")
+        assert acquired.result() is False
+    writer.close()
+    backend.close()
+
+
+def test_messages_and_inmails_draw_from_their_own_quota(stub, client_for):
+
+    server = stub()
+    client = client_for(server)
+    quota = QuotaTracker({MESSAGE: Quota(2), INMAIL: Quota(1)})
+
+    def statuses(inmail_message: bool) -> list:
+        return sorted(result.status for result in client.iter_send_messages(
+            USERNAMES, "account", "hello", check_message_not_sent=False, inmail_message=inmail_message, quota=quota))
+
+    assert statuses(False) == [MessageData.DEFERRED, MessageData.SENT, MessageData.SENT]
+    assert statuses(True) == [MessageData.DEFERRED, MessageData.DEFERRED, MessageData.SENT]
+    assert quota.remaining("account", MESSAGE) == 0 and quota.remaining("account", INMAIL) == 0
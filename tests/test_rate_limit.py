@@ -0,0 +1,115 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+from time import perf_counter
+from typing import List
+
+# IMPORTING THIRD PARTY PACKAGES
+import httpx
+import pytest
+
+# IMPORTING LOCAL PACKAGES
+from conftest import RecordingHandler, requests_to
+from unipile_integration.rate_limit import TokenBucket, RateLimiter, RetryPolicy, parse_retry_after
+from unipile_integration.transport import AsyncHttpTransport
+
+
+def test_token_bucket_spaces_reservations_by_rate():
+
+    bucket = TokenBucket(rate=10, capacity=1)
+    assert bucket.reserve() == 0
+    assert 0.05 < bucket.reserve() <= 0.1
+
+
+def test_token_bucket_penalize_halves_the_rate_and_reward_restores_it():
+
+    bucket = TokenBucket(rate=10)
+    bucket.penalize()
+    assert bucket.rate == 5
+    for _ in range(10):
+        bucket.penalize()
+    assert bucket.rate == 1
+    for _ in range(100):
+        bucket.reward()
+    assert bucket.rate == 10
+
+
+def test_retry_after_blocks_the_bucket_without_a_rate():
+
+    limiter = RateLimiter()
+    assert limiter.reserve("account") == 0
+    limiter.penalize("account", retry_after=0.5)
+    assert 0.4 < limiter.reserve("account") <= 0.5
+    assert limiter.reserve("other") == 0
+    assert parse_retry_after("2") == 2
+    assert parse_retry_after("soon") is None
+
+
+def test_throttled_requests_wait_for_retry_after_and_slow_down(stub, transport_for):
+
+    server = stub(throttle_every=2, retry_after=0.3)
+    transport = transport_for(server, rate_limiter=RateLimiter(global_rate=100))
+    start = perf_counter()
+    status_codes = [transport.request("users/me", {}, method_name="get").status_code for _ in range(2)]
+    assert status_codes == [200, 200]
+    assert perf_counter() - start >= 0.3
+    assert server.stats.throttled == 1
+    assert server.stats.requests == 3
+    assert 50 <= transport.rate_limiter.bucket(None).rate < 100
+
+
+def test_retry_policy_gates_server_errors_by_method():
+
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry("get", 500, 0)
+    assert policy.should_retry("delete", 503, 1)
+    assert not policy.should_retry("get", 500, 2)
+    assert not policy.should_retry("post", 500, 0)
+    assert policy.should_retry("post", 429, 0)
+    assert not policy.should_retry("get", 404, 0)
+    assert not policy.should_retry_error("post", 0)
+
+
+def test_transport_retries_gets_but_not_posts_on_server_errors(stub, transport_for):
+
+    server = stub()
+    server.faults.update({"users/me": 500, "users/invite": 500, "chats": 429})
+    transport = transport_for(server, retry_policy=RetryPolicy(max_retries=2, backoff_factor=0))
+    assert transport.request("users/me", {}, method_name="get").status_code == 500
+    assert requests_to(server, "users/me") == 3
+    assert transport.request("users/invite", {"provider_id": "id", "account_id": "account"}).status_code == 500
+    assert requests_to(server, "users/invite", method="POST") == 1
+    assert transport.request("chats", {"attendees_ids": "id", "account_id": "account"}).status_code == 429
+    assert requests_to(server, "chats", method="POST") == 3
+
+
+
+class DroppingHandler(RecordingHandler):
+    drops: List[int] = [0]
+
+    def _before(self) -> bool:
+
+        # the connection is closed without a response, httpx reports it as a RemoteProtocolError
+        if self.drops[0] > 0 and self.command == "GET":
+            self.drops[0] -= 1
+            self.log.append((self.command, self.path))
+            self.close_connection = True
+            return False
+        return super()._before()
+
+
+def test_async_transport_retries_dropped_connections(stub):
+
+    drops = [2]
+    server = stub(type("DroppingHandler", (DroppingHandler,), {"drops": drops}))
+
+    async def request(max_retries: int):
+        policy = RetryPolicy(max_retries=max_retries, backoff_factor=0)
+        async with AsyncHttpTransport("token", server.base_url, retry_policy=policy) as transport:
+            return await transport.request("users/me", {}, method_name="get")
+
+    assert asyncio.run(request(2)).status_code == 200
+    assert requests_to(server, "users/me") == 3
+    drops[0] = 1
+    with pytest.raises(httpx.TransportError):
+        asyncio.run(request(0))
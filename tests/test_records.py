@@ -0,0 +1,56 @@
+# IMPORTING STANDARD PACKAGES
+import pickle
+
+from datetime import datetime
+
+# IMPORTING THIRD PARTY PACKAGES
+import pytest
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import MessageChat, RelationSyncState
+from unipile_integration.data.record import parse_timestamp
+
+MESSAGE = {"id": "msg-1", "chat_id": "chat-1", "sender_id": "ACoSender", "text": "hello", "seen": 1,
+           "timestamp": "2024-01-01T10:00:00.000Z"}
+
+
+def test_parse_timestamp_returns_naive_utc():
+
+    assert parse_timestamp("2024-01-01T10:00:00.000Z") == datetime(2024, 1, 1, 10)
+    assert parse_timestamp("2024-01-01T10:00:00Z") == datetime(2024, 1, 1, 10)
+    assert parse_timestamp("2024-01-01T12:00:00+02:00") == datetime(2024, 1, 1, 10)
+    assert parse_timestamp(None) is None
+
+
+def test_records_are_immutable():
+
+    message = MessageChat(**MESSAGE)
+    bulk = MessageChat.from_items([MESSAGE])[0]
+    for record in (message, bulk):
+        assert record.message_text == "hello" and record.seen and record.timestamp == datetime(2024, 1, 1, 10)
+        with pytest.raises(AttributeError):
+            record.message_text = "changed"
+        with pytest.raises(AttributeError):
+            del record.id
+        assert record.message_text == "hello"
+
+
+def test_replace_builds_a_modified_copy():
+
+    state = RelationSyncState(account_id="account", created_at=20, member_id="ACoA")
+    replaced = state.replace(created_at=30, member_ids=("ACoA", "ACoB"))
+    assert (replaced.created_at, replaced.member_ids) == (30, ("ACoA", "ACoB"))
+    assert (state.created_at, state.member_ids) == (20, ("ACoA",))
+    with pytest.raises(AttributeError):
+        replaced.created_at = 40
+
+
+def test_records_survive_pickling():
+
+    message = MessageChat(**MESSAGE)
+    assert message.timestamp is not None
+    restored = pickle.loads(pickle.dumps(message))
+    assert type(restored) is MessageChat and repr(restored) == repr(message)
+    assert restored.timestamp == message.timestamp and restored.chat_id == "chat-1"
+    with pytest.raises(AttributeError):
+        restored.chat_id = "chat-2"
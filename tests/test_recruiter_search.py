@@ -0,0 +1,111 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+from time import sleep, perf_counter
+
+# IMPORTING THIRD PARTY PACKAGES
+import pytest
+
+# IMPORTING LOCAL PACKAGES
+from benchmarks.stub_server import search_result
+from conftest import NO_RETRIES, requests_to
+from unipile_integration.data import IntegrationAccountData
+from unipile_integration.linkedin_recruiter import RecruiterSearchClient, AsyncRecruiterSearchClient, RECRUITER, \
+    SALES_NAVIGATOR
+from unipile_integration.pagination import PageError
+from unipile_integration.transport import AsyncHttpTransport
+
+QUERIES = ["python", "golang"]
+RECRUITER_ACCOUNT = IntegrationAccountData(provider_id="ACoOwner", owner_id="account",
+                                           recruiter={"contract_id": "contract", "owner_seat_id": "seat"})
+
+
+def _expected(queries: list, results: int, exclude: tuple = ()) -> list:
+
+    keys = []
+    for query in queries:
+        for index in range(results):
+            key = search_result(query, index)["id"]
+            if key not in keys and key not in exclude:
+                keys.append(key)
+    return keys
+
+
+def _wait_for(condition, timeout: float = 2) -> bool:
+
+    deadline = perf_counter() + timeout
+    while not condition():
+        if perf_counter() > deadline:
+            return False
+        sleep(0.01)
+    return True
+
+
+def test_search_pages_through_queries_and_deduplicates(stub, transport_for):
+
+    server = stub(search_results=30, page_size=10)
+    search = RecruiterSearchClient(transport_for(server), RECRUITER_ACCOUNT, page_size=10)
+    assert search.api == RECRUITER
+    candidates = list(search.search(QUERIES))
+    expected = _expected(QUERIES, 30)
+    assert len(expected) < 60
+    assert [candidate.key for candidate in candidates] == expected
+    assert requests_to(server, "linkedin/search", "POST") == 6
+    excluded = tuple(expected[:5])
+    assert [candidate.key for candidate in search.search(QUERIES, exclude=excluded)] == expected[5:]
+    assert [candidate.key for candidate in search.search(QUERIES, max_results=12, max_results_per_query=8)] == \
+        _expected(QUERIES, 8)[:12]
+
+
+def test_search_raises_on_a_failed_page(stub, transport_for):
+
+    server = stub(search_results=30, page_size=10)
+    search = RecruiterSearchClient(transport_for(server, retry_policy=NO_RETRIES), RECRUITER_ACCOUNT, page_size=10)
+    server.faults["cursor=20"] = 500
+    candidates = []
+    with pytest.raises(PageError):
+        for candidate in search.search("python", prefetch=False):
+            candidates.append(candidate)
+    assert len(candidates) == 20
+
+
+def test_search_prefetches_the_next_page(stub, transport_for):
+
+    server = stub(search_results=30, page_size=10)
+    search = RecruiterSearchClient(transport_for(server), RECRUITER_ACCOUNT, page_size=10)
+    candidates = search.search("python", prefetch=True)
+    next(candidates)
+    assert _wait_for(lambda: requests_to(server, "linkedin/search", "POST") == 2)
+    candidates.close()
+    server.log.clear()
+    candidates = search.search("python", prefetch=False)
+    next(candidates)
+    sleep(0.05)
+    assert requests_to(server, "linkedin/search", "POST") == 1
+    candidates.close()
+
+
+def test_search_requires_a_premium_contract():
+
+    with pytest.raises(ValueError):
+        RecruiterSearchClient(None, IntegrationAccountData(provider_id="ACoOwner", owner_id="account"))
+    account = IntegrationAccountData(provider_id="ACoOwner", owner_id="account",
+                                     sales_navigator={"contract_id": "contract"})
+    assert RecruiterSearchClient(None, account).api == SALES_NAVIGATOR
+
+
+def test_async_search_matches_the_sync_client(stub):
+
+    server = stub(search_results=30, page_size=10)
+
+    async def search(**kwargs) -> list:
+        async with AsyncHttpTransport("token", server.base_url, retry_policy=NO_RETRIES) as transport:
+            client = AsyncRecruiterSearchClient(transport, RECRUITER_ACCOUNT, page_size=10)
+            return [candidate.key async for candidate in client.search(QUERIES, **kwargs)]
+
+    expected = _expected(QUERIES, 30)
+    assert asyncio.run(search()) == expected
+    assert asyncio.run(search(prefetch=False, exclude=expected[:5])) == expected[5:]
+    server.faults["cursor=20"] = 500
+    with pytest.raises(PageError):
+        asyncio.run(search())
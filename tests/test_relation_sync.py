@@ -0,0 +1,106 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+import sqlite3
+
+# IMPORTING THIRD PARTY PACKAGES
+import pytest
+
+# IMPORTING LOCAL PACKAGES
+from benchmarks.stub_server import relation
+from conftest import NO_RETRIES, requests_to
+from unipile_integration.async_linkedin import AsyncLinkedinUniPileIntegration
+from unipile_integration.data import RelationData, RelationSyncState
+from unipile_integration.pagination import PageError
+from unipile_integration.relation_sync import InMemoryRelationSyncStateStore, SQLiteRelationSyncStateStore, \
+    RelationSyncRun
+
+ACCOUNT_ID = "account"
+
+
+def test_relation_sync_keeps_the_mark_until_a_walk_completes(stub, client_for, tmp_path):
+
+    server = stub(relations=50, page_size=10)
+    client = client_for(server, retry_policy=NO_RETRIES)
+    state_store = SQLiteRelationSyncStateStore(str(tmp_path / "relations.db"))
+    server.faults["cursor=20"] = 500
+    with pytest.raises(PageError):
+        client.sync_relations(ACCOUNT_ID, state_store, page_size=10)
+    assert state_store.get(ACCOUNT_ID) is None
+    server.faults.clear()
+    assert sorted(client.sync_relations(ACCOUNT_ID, state_store, page_size=10)) == \
+        sorted(f"ACouser-{index}" for index in range(50))
+    assert state_store.get(ACCOUNT_ID).member_id == "ACouser-0"
+    server.log.clear()
+    assert client.sync_relations(ACCOUNT_ID, state_store, page_size=10) == {}
+    assert requests_to(server, "users/relations") == 1
+    state_store.close()
+
+
+def test_relation_sync_resumes_from_the_stored_mark(stub, client_for):
+
+    server = stub(relations=50, page_size=10)
+    client = client_for(server)
+    state_store = InMemoryRelationSyncStateStore()
+    newest = relation(5)
+    state_store.set(RelationSyncState(account_id=ACCOUNT_ID, created_at=newest["created_at"],
+                                      member_id=newest["member_id"]))
+    assert sorted(client.sync_relations(ACCOUNT_ID, state_store, page_size=10)) == \
+        [f"ACouser-{index}" for index in range(5)]
+    assert state_store.get(ACCOUNT_ID).member_id == "ACouser-0"
+
+
+def test_async_relation_sync_keeps_the_mark_on_a_failed_page(stub):
+
+    server = stub(relations=50, page_size=10)
+    server.faults["cursor=20"] = 500
+    state_store = InMemoryRelationSyncStateStore()
+
+    async def sync() -> dict:
+        async with AsyncLinkedinUniPileIntegration("token", server.base_url, retry_policy=NO_RETRIES) as client:
+            return await client.sync_relations(ACCOUNT_ID, state_store, page_size=10)
+
+    with pytest.raises(PageError):
+        asyncio.run(sync())
+    assert state_store.get(ACCOUNT_ID) is None
+    server.faults.clear()
+    assert len(asyncio.run(sync())) == 50
+
+
+def _sync(state_store, relations: list) -> list:
+
+    sync_run = RelationSyncRun(ACCOUNT_ID, state_store.get(ACCOUNT_ID))
+    for item in relations:
+        if not sync_run.add(item):
+            break
+    if sync_run.state() is not None:
+        state_store.set(sync_run.state())
+    return list(sync_run.added)
+
+
+def test_relations_tied_with_the_mark_are_reported_once(tmp_path):
+
+    state_store = SQLiteRelationSyncStateStore(str(tmp_path / "relations.db"))
+    tied = [RelationData(member_id=member_id, created_at=created_at)
+            for member_id, created_at in (("ACoA", 20), ("ACoB", 20), ("ACoC", 10))]
+    assert _sync(state_store, tied) == ["ACoA", "ACoB", "ACoC"]
+    # the API does not order relations that share a timestamp
+    assert _sync(state_store, [tied[1], tied[0], tied[2]]) == []
+    newer = [RelationData(member_id="ACoD", created_at=30)] + tied
+    assert _sync(state_store, newer) == ["ACoD"]
+    assert _sync(state_store, [RelationData(member_id="ACoE", created_at=30)] + newer) == ["ACoE"]
+    assert state_store.get(ACCOUNT_ID).member_ids == ("ACoD", "ACoE")
+    state_store.close()
+
+
+def test_sqlite_state_store_upgrades_a_table_without_member_ids(tmp_path):
+
+    path = str(tmp_path / "relations.db")
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("CREATE TABLE relation_sync_state (account_id TEXT PRIMARY KEY, created_at INTEGER, "
+                           "member_id TEXT)")
+        connection.execute("INSERT INTO relation_sync_state VALUES (?, ?, ?)", (ACCOUNT_ID, 20, "ACoA"))
+    connection.close()
+    state_store = SQLiteRelationSyncStateStore(path)
+    assert state_store.get(ACCOUNT_ID).member_ids == ("ACoA",)
+    state_store.close()
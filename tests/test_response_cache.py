@@ -0,0 +1,41 @@
+# IMPORTING STANDARD PACKAGES
+from time import sleep
+
+# IMPORTING LOCAL PACKAGES
+from benchmarks.stub_server import profile, OWNER_PROVIDER_ID
+from conftest import RecordingHandler, requests_to
+from unipile_integration.response_cache import ResponseCache, CachePolicy
+
+ETAG = '"v1"'
+
+
+class ETagHandler(RecordingHandler):
+
+    def do_GET(self) -> None:
+
+        if not self.path.endswith("/users/me"):
+            return super().do_GET()
+        if not self._before():
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            return self._send_json(304, None, {"ETag": ETAG})
+        self._send_json(200, profile(OWNER_PROVIDER_ID), {"ETag": ETAG})
+
+
+def test_response_cache_hits_then_revalidates_with_the_etag(stub, transport_for):
+
+    server = stub(ETagHandler)
+    cache = ResponseCache(policies={"GET users/me": CachePolicy(0.2)})
+    transport = transport_for(server, response_cache=cache)
+    first = transport.request("users/me", {}, method_name="get")
+    assert transport.request("users/me", {}, method_name="get").json() == first.json()
+    assert requests_to(server, "users/me") == 1
+    sleep(0.25)
+    revalidated = transport.request("users/me", {}, method_name="get")
+    assert revalidated.status_code == 200
+    assert revalidated.json() == first.json()
+    assert requests_to(server, "users/me") == 2
+    stats = cache.stats()
+    assert (stats["hit"], stats["stored"], stats["revalidated"]) == (1, 1, 1)
+    assert transport.request("users/me", {}, method_name="get").json() == first.json()
+    assert requests_to(server, "users/me") == 2
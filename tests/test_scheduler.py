@@ -0,0 +1,74 @@
+# IMPORTING STANDARD PACKAGES
+from threading import Lock
+from time import sleep
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import WorkResult
+from unipile_integration.quota import Quota, QuotaTracker, INVITATION
+from unipile_integration.scheduler import AccountScheduler
+
+
+def _order(scheduler: AccountScheduler, submissions: list) -> list:
+
+    order = []
+    futures = [scheduler.submit(owner_id, order.append, f"{owner_id}{index}", priority=priority)
+               for owner_id, index, priority in submissions]
+    with scheduler:
+        scheduler.join()
+    assert all(future.result().status == WorkResult.DONE for future in futures)
+    return order
+
+
+def test_scheduler_gives_accounts_turns_by_weight():
+
+    scheduler = AccountScheduler(workers=1, account_concurrency=1, weights={"a": 2})
+    submissions = [("a", index, 0) for index in range(4)] + [("b", index, 0) for index in range(4)]
+    assert _order(scheduler, submissions) == ["a0", "a1", "b0", "a2", "a3", "b1", "b2", "b3"]
+
+
+def test_scheduler_applies_priority_within_an_account_only():
+
+    scheduler = AccountScheduler(workers=1, account_concurrency=1)
+    submissions = [("a", 0, 0), ("a", 1, 0), ("a", 2, 5)] + [("b", index, 9) for index in range(3)]
+    assert _order(scheduler, submissions) == ["a2", "b0", "a0", "b1", "a1", "b2"]
+
+
+def test_scheduler_caps_concurrency_per_account():
+
+    lock = Lock()
+    running, peaks = {"a": 0, "b": 0}, {"a": 0, "b": 0}
+
+    def task(owner_id: str) -> None:
+        with lock:
+            running[owner_id] += 1
+            peaks[owner_id] = max(peaks[owner_id], running[owner_id])
+        sleep(0.02)
+        with lock:
+            running[owner_id] -= 1
+
+    with AccountScheduler(workers=6, account_concurrency=2) as scheduler:
+        for _ in range(6):
+            scheduler.submit("a", task, "a")
+            scheduler.submit("b", task, "b")
+        scheduler.join()
+    assert peaks == {"a": 2, "b": 2}
+    assert scheduler.stats()["completed"] == {"a": 6, "b": 6}
+
+
+def test_scheduler_defers_work_over_quota_and_refunds_failures():
+
+    quota = QuotaTracker({INVITATION: Quota(2)})
+
+    def fail() -> None:
+        raise ValueError("boom")
+
+    with AccountScheduler(workers=1, quota=quota) as scheduler:
+        failed = scheduler.submit("a", fail, action=INVITATION)
+        sent = [scheduler.submit("a", lambda: "sent", action=INVITATION) for _ in range(3)]
+        untracked = scheduler.submit("a", lambda: "read")
+        scheduler.join()
+    assert failed.result().status == WorkResult.FAILED
+    assert [future.result().status for future in sent] == [WorkResult.DONE, WorkResult.DONE, WorkResult.DEFERRED]
+    assert untracked.result().value == "read"
+    assert quota.remaining("a", INVITATION) == 0
+    assert scheduler.stats()["failed"] == 1 and scheduler.stats()["deferred"] == 1
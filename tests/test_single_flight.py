@@ -0,0 +1,70 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+from threading import Barrier, Thread
+
+# IMPORTING LOCAL PACKAGES
+from conftest import requests_to
+from unipile_integration.transport import AsyncHttpTransport
+
+
+def _concurrent_gets(transport, path: str, workers: int, timeouts: list = None) -> list:
+
+    barrier, responses = Barrier(workers), []
+    timeouts = timeouts if timeouts is not None else [None] * workers
+
+    def get(timeout):
+        barrier.wait()
+        responses.append(transport.request(path, {}, method_name="get", timeout=timeout))
+
+    threads = [Thread(target=get, args=(timeout,)) for timeout in timeouts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return responses
+
+
+def test_concurrent_gets_are_coalesced(stub, transport_for):
+
+    server = stub(latency=0.3)
+    transport = transport_for(server)
+    assert [response.status_code for response in _concurrent_gets(transport, "users/me", 5)] == [200] * 5
+    assert requests_to(server, "users/me") == 1
+    assert transport.single_flight.stats() == {"executed": 1, "saved": 4}
+    uncoalesced = transport_for(server, coalesce_gets=False)
+    assert [response.status_code for response in _concurrent_gets(uncoalesced, "users/me", 5)] == [200] * 5
+    assert requests_to(server, "users/me") == 6
+
+
+def test_every_waiter_gets_its_own_response(stub, transport_for):
+
+    server = stub(latency=0.3)
+    responses = _concurrent_gets(transport_for(server), "users/me", 4)
+    assert len({id(response) for response in responses}) == 4
+    assert len({response.content for response in responses}) == 1
+    responses[0].headers["X-Changed"] = "1"
+    assert all("X-Changed" not in response.headers for response in responses[1:])
+    assert all(response.json()["object"] == "AccountOwnerProfile" for response in responses)
+
+
+def test_calls_with_different_timeouts_are_not_coalesced(stub, transport_for):
+
+    server = stub(latency=0.3)
+    transport = transport_for(server)
+    _concurrent_gets(transport, "users/me", 4, timeouts=[5, 5, 10, 10])
+    assert requests_to(server, "users/me") == 2
+
+
+def test_async_waiters_get_their_own_response(stub):
+
+    server = stub(latency=0.3)
+
+    async def gets() -> list:
+        async with AsyncHttpTransport("token", server.base_url) as transport:
+            return await asyncio.gather(*[transport.request("users/me", {}, method_name="get") for _ in range(3)])
+
+    responses = asyncio.run(gets())
+    assert requests_to(server, "users/me") == 1
+    assert len({id(response) for response in responses}) == 3
+    assert all(response.json()["object"] == "AccountOwnerProfile" for response in responses)
@@ -0,0 +1,90 @@
+# IMPORTING STANDARD PACKAGES
+from threading import Thread
+
+# IMPORTING THIRD PARTY PACKAGES
+import pytest
+import requests
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.webhooks import WebhookDispatcher, WebhookReceiver, ANY_EVENT, ACCOUNT_STATUS_EVENT, \
+    is_loopback, parse_event
+
+TOKEN = "webhook-token"
+MESSAGE_PAYLOAD = {
+    "event": "message_received",
+    "account_id": "account",
+    "message_id": "msg-1",
+    "chat_id": "chat-1",
+    "message": "hello",
+    "timestamp": "2024-01-01T10:00:00.000Z",
+    "sender": {"attendee_provider_id": "ACoSender"}
+}
+
+
+def test_parse_event_reads_messages_relations_and_account_statuses():
+
+    message = parse_event(MESSAGE_PAYLOAD)
+    assert message.event == "message_received" and message.account_id == "account"
+    assert message.message.id == "msg-1" and message.message.sender_id == "ACoSender"
+    assert message.message.message_text == "hello" and message.relation is None
+    relation = parse_event({"event": "new_relation", "account_id": "account", "user_full_name": " Ada Lovelace ",
+                            "user_provider_id": "ACoAda", "user_public_identifier": "ada"})
+    assert relation.relation.first_name == "Ada" and relation.relation.last_name == "Lovelace"
+    assert relation.relation.member_id == "ACoAda" and relation.message is None
+    status = parse_event({"AccountStatus": {"account_id": "account", "message": "OK"}})
+    assert status.event == ACCOUNT_STATUS_EVENT and status.account_id == "account" and status.status == "OK"
+    assert parse_event({"account_id": "account"}) is None
+    assert parse_event(["message_received"]) is None
+
+
+def test_dispatcher_runs_handlers_and_counts_failures():
+
+    received = []
+    dispatcher = WebhookDispatcher(workers=2)
+    dispatcher.on_message(lambda event: received.append(event.message.id))
+    dispatcher.register(ANY_EVENT, lambda event: received.append(event.event))
+    dispatcher.on_relation(lambda event: 1 / 0)
+    with dispatcher:
+        assert dispatcher.submit_payload(MESSAGE_PAYLOAD) is True
+        assert dispatcher.submit_payload({"event": "new_relation", "user_provider_id": "ACoAda"}) is True
+        assert dispatcher.submit_payload({"account_id": "account"}) is None
+        dispatcher.join()
+    assert sorted(received) == ["message_received", "msg-1", "new_relation"]
+    assert dispatcher.dispatched == 2 and dispatcher.failed == 1
+
+
+def test_dispatcher_rejects_events_on_a_full_queue_and_stops_without_workers():
+
+    dispatcher = WebhookDispatcher(queue_size=1)
+    assert dispatcher.submit_payload(MESSAGE_PAYLOAD, timeout=0) is True
+    assert dispatcher.submit_payload(MESSAGE_PAYLOAD, timeout=0) is False
+    assert dispatcher.rejected == 1
+    stopping = Thread(target=dispatcher.stop, daemon=True)
+    stopping.start()
+    stopping.join(timeout=2)
+    assert not stopping.is_alive()
+
+
+def test_receiver_checks_path_auth_and_body_size():
+
+    received = []
+    dispatcher = WebhookDispatcher()
+    dispatcher.on_message(lambda event: received.append(event.message.id))
+    with dispatcher, WebhookReceiver(dispatcher, port=0, auth_token=TOKEN, max_body_size=1024) as receiver:
+        headers = {"Unipile-Auth": TOKEN}
+        assert requests.post(receiver.url, json=MESSAGE_PAYLOAD).status_code == 401
+        assert requests.post(receiver.url, json=MESSAGE_PAYLOAD, headers={"Unipile-Auth": "wrong"}).status_code == 401
+        assert requests.post(receiver.url + "/other", json=MESSAGE_PAYLOAD, headers=headers).status_code == 404
+        assert requests.post(receiver.url, json={"message": "x" * 2048}, headers=headers).status_code == 413
+        assert requests.post(receiver.url, data=b"{not json", headers=headers).status_code == 400
+        assert requests.post(receiver.url, json=MESSAGE_PAYLOAD, headers=headers).status_code == 200
+        dispatcher.join()
+    assert received == ["msg-1"]
+
+
+def test_receiver_requires_a_token_off_loopback():
+
+    assert is_loopback("localhost") and is_loopback("127.0.0.1") and is_loopback("::1")
+    assert not is_loopback("0.0.0.0") and not is_loopback("10.0.0.1") and not is_loopback("example.com")
+    with pytest.raises(ValueError):
+        WebhookReceiver(WebhookDispatcher(), host="0.0.0.0", port=0)
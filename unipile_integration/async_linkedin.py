@@ -0,0 +1,276 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+from typing import Optional, List, Tuple, Dict, Iterable, AsyncIterator, Any
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.base_linkedin import BaseLinkedinIntegration, Flow, Request, Walk, FanOut, Pipeline, \
+    Poll, step
+from unipile_integration.data import IntegrationAccountData, MessageData, MessageCheck, ConnectionCheck, ChatItem, \
+    MessageChat, RelationData, JobPostResult, OnboardingResult, ExportResult, InvitationResult
+from unipile_integration.cache import ProfileCache, JobPostCache
+from unipile_integration.chat_index import ChatIndex
+from unipile_integration.concurrency import gather_bounded
+from unipile_integration.decoding import JSON
+from unipile_integration.export import ChatExportWriter, ExportCheckpointStore
+from unipile_integration.instrumentation import Instrumentation
+from unipile_integration.message_store import MessageStore
+from unipile_integration.pagination import aiter_items
+from unipile_integration.pipeline import aiter_pipeline
+from unipile_integration.quota import QuotaTracker
+from unipile_integration.readiness import ReadinessPolicy, AccountReadiness, apoll_until
+from unipile_integration.rate_limit import RateLimiter, RetryPolicy
+from unipile_integration.relation_sync import RelationSyncStateStore
+from unipile_integration.response_cache import ResponseCache
+from unipile_integration.transport import AsyncHttpTransport
+
+
+class AsyncLinkedinUniPileIntegration(BaseLinkedinIntegration):
+    _transport: AsyncHttpTransport
+
+    def __init__(self, auth_token: str, base_endpoint_path: str, transport: AsyncHttpTransport = None,
+                 pool_size: int = 10, timeout: Optional[float] = 30, max_concurrency: int = 10,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None,
+                 profile_cache: ProfileCache = None, message_store: MessageStore = None,
+                 instrumentation: Instrumentation = None, job_post_cache: JobPostCache = None,
+                 json_decoder: str = JSON, chat_index: ChatIndex = None, response_cache: ResponseCache = None):
+
+        super().__init__(
+            auth_token, base_endpoint_path, transport if transport is not None else AsyncHttpTransport(
+                auth_token, base_endpoint_path, pool_size=pool_size, timeout=timeout, rate_limiter=rate_limiter,
+                retry_policy=retry_policy, instrumentation=instrumentation, response_cache=response_cache
+            ), transport is None, max_concurrency=max_concurrency, profile_cache=profile_cache,
+            message_store=message_store, job_post_cache=job_post_cache, json_decoder=json_decoder,
+            chat_index=chat_index
+        )
+
+    async def _base_call(self, path: str, data: dict, method_name: str = "post", body_type: str = "json",
+                         timeout: Optional[float] = None):
+
+        return await self._transport.request(path, data, method_name=method_name, body_type=body_type,
+                                             timeout=timeout)
+
+    async def aclose(self) -> None:
+
+        if self._owns_transport:
+            await self._transport.aclose()
+
+    async def __aenter__(self) -> "AsyncLinkedinUniPileIntegration":
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+
+        await self.aclose()
+
+    async def _fetch(self, url: str):
+
+        return await self._base_call(url, {}, method_name="get")
+
+    def _iter_items(self, url: str, item_type: type, max_items: Optional[int] = None,
+                    prefetch: bool = False, strict: bool = False) -> AsyncIterator:
+
+        return aiter_items(self._fetch, url, item_type, max_items=max_items, prefetch=prefetch,
+                           instrumentation=self._transport.instrumentation, decoder=self._json_decoder,
+                           strict=strict)
+
+    async def _run(self, flow: Flow) -> Any:
+
+        done, effect = step(flow)
+        while not done:
+            try:
+                value, error = await self._perform(effect), None
+            except Exception as e:
+                value, error = None, e
+            done, effect = step(flow, value, error)
+        return effect
+
+    async def _perform(self, effect: Any) -> Any:
+
+        if isinstance(effect, Request):
+            return await self._base_call(effect.path, effect.data, method_name=effect.method_name,
+                                         body_type=effect.body_type)
+        if isinstance(effect, Walk):
+            pages = effect.iterate()
+            try:
+                async for item in pages:
+                    if effect.add(item) is False:
+                        break
+            finally:
+                await pages.aclose()
+            return None
+        if isinstance(effect, FanOut):
+            return await gather_bounded(lambda item: self._run(effect.flow(item)), effect.items,
+                                        effect.max_concurrency)
+        if isinstance(effect, Pipeline):
+            results = self._stream(effect)
+            try:
+                async for result in results:
+                    effect.consume(result)
+            finally:
+                await results.aclose()
+            return None
+        if isinstance(effect, Poll):
+            return await self._poll(effect)
+        raise TypeError(f"unknown effect {type(effect).__name__}")
+
+    async def _stream(self, pipeline: Pipeline) -> AsyncIterator:
+
+        if pipeline.prepare is not None:
+            await self._run(pipeline.prepare)
+        stages = [(lambda item, flow=flow: self._run(flow(item)), workers) for flow, workers in pipeline.stages]
+        results = aiter_pipeline(pipeline.items, stages, pipeline.on_error, queue_size=pipeline.queue_size,
+                                 max_pending=pipeline.max_pending)
+        try:
+            async for result in results:
+                yield result
+        finally:
+            await results.aclose()
+
+    async def _poll(self, effect: Poll) -> Any:
+
+        account_readiness, owner_id = effect.account_readiness, effect.owner_id
+        check = lambda: self._run(effect.check())
+        if account_readiness is None:
+            return await apoll_until(check, effect.readiness, failed=effect.failed)
+        return await apoll_until(check, effect.readiness,
+                                 wait=lambda delay: account_readiness.async_wait(owner_id, delay),
+                                 failed=effect.failed)
+
+    async def read_all_chats(self, account_id: str, max_number_of_chats: int = 100) -> List[ChatItem]:
+
+        return await self._run(self._read_all_chats_flow(account_id, max_number_of_chats))
+
+    async def refresh_chat_index(self, account_id: str, page_size: int = 100) -> List[ChatItem]:
+
+        return await self._run(self._refresh_chat_index_flow(account_id, page_size))
+
+    async def read_full_chat(self, chat_id: str, max_number_of_messages: int = None) -> List[MessageChat]:
+
+        return await self._run(self._read_full_chat_flow(chat_id, max_number_of_messages))
+
+    async def sync_chat_messages(self, chat_id: str, page_size: int = 100) -> List[MessageChat]:
+
+        return await self._run(self._sync_chat_messages_flow(chat_id, page_size))
+
+    async def export_chats(self, account_id: str, writer: ChatExportWriter,
+                           checkpoint: ExportCheckpointStore = None, max_concurrency: int = None,
+                           page_size: int = 100, commit_every: int = 100) -> ExportResult:
+
+        return await self._run(self._export_chats_flow(account_id, writer, checkpoint=checkpoint,
+                                                       max_concurrency=max_concurrency, page_size=page_size,
+                                                       commit_every=commit_every))
+
+    async def list_all_chats_between(self, owner_id: str, public_attendee_slug: str) -> List[ChatItem]:
+
+        return await self._run(self._list_all_chats_between_flow(owner_id, public_attendee_slug))
+
+    async def has_accepted_connection(self, linkedin_username: str, owner_id: str) -> Tuple[bool, Optional[str]]:
+
+        return await self._run(self._has_accepted_connection_flow(linkedin_username, owner_id))
+
+    async def send_connection(self, linkedin_username: str, owner_id: str) -> bool:
+
+        return await self._run(self._send_connection_flow(linkedin_username, owner_id))
+
+    async def send_connections(self, owner_id: str, usernames: Iterable[str],
+                               relations: Iterable[RelationData] = None, quota: QuotaTracker = None,
+                               max_concurrency: int = None) -> List[InvitationResult]:
+
+        return await self._run(self._send_connections_flow(owner_id, usernames, relations=relations, quota=quota,
+                                                           max_concurrency=max_concurrency))
+
+    async def get_chat_url(self, chat_id: str) -> str:
+
+        return await self._run(self._get_chat_url_flow(chat_id))
+
+    async def send_message_to_chat(self, chat_id: str, message: str) -> bool:
+
+        return await self._run(self._send_message_to_chat_flow(chat_id, message))
+
+    async def send_message(self, attendees_username: list, owner_id: str, message: str,
+                           check_message_not_sent: bool = True, inmail_message: bool = False,
+                           subject: str = None, is_sales: bool = False) -> List[MessageData]:
+
+        return await self._run(self._send_message_flow(attendees_username, owner_id, message,
+                                                       check_message_not_sent=check_message_not_sent,
+                                                       inmail_message=inmail_message, subject=subject,
+                                                       is_sales=is_sales))
+
+    def iter_send_messages(self, attendees_username: Iterable[str], owner_id: str, message: str,
+                           check_message_not_sent: bool = True, inmail_message: bool = False, subject: str = None,
+                           is_sales: bool = False, quota: QuotaTracker = None, max_concurrency: int = None,
+                           queue_size: int = 100) -> AsyncIterator[MessageData]:
+
+        return self._stream(self._send_messages_pipeline(
+            attendees_username, owner_id, message, check_message_not_sent=check_message_not_sent,
+            inmail_message=inmail_message, subject=subject, is_sales=is_sales, quota=quota,
+            max_concurrency=max_concurrency, queue_size=queue_size
+        ))
+
+    async def auth_user(self, li_at_cookie: str, user_agent: str, li_a_cookie: str = None,
+                        recruiter_contract_id: str = None, readiness: ReadinessPolicy = None,
+                        account_readiness: AccountReadiness = None) -> Optional[IntegrationAccountData]:
+
+        return await self._run(self._auth_user_flow(li_at_cookie, user_agent, li_a_cookie=li_a_cookie,
+                                                    recruiter_contract_id=recruiter_contract_id, readiness=readiness,
+                                                    account_readiness=account_readiness))
+
+    async def auth_users(self, credentials: Iterable[dict], max_concurrency: int = None,
+                         readiness: ReadinessPolicy = None,
+                         account_readiness: AccountReadiness = None) -> AsyncIterator[OnboardingResult]:
+
+        semaphore = asyncio.Semaphore(max(self._workers(max_concurrency), 1))
+
+        async def onboard(index: int, item: dict) -> OnboardingResult:
+            async with semaphore:
+                return await self._run(self._onboard_flow(index, item, readiness, account_readiness))
+
+        tasks = [asyncio.ensure_future(onboard(index, item)) for index, item in enumerate(credentials)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def delete_linkedin_connection(self, owner_id: str) -> bool:
+
+        return await self._run(self._delete_linkedin_connection_flow(owner_id))
+
+    async def check_replies(self, owner_id: str, messages_data: List[MessageCheck],
+                            max_concurrency: int = None) -> List[MessageCheck]:
+
+        return await self._run(self._check_replies_flow(owner_id, messages_data, max_concurrency=max_concurrency))
+
+    async def check_connections(self, owner_id: str, usernames: list,
+                                max_concurrency: int = None) -> List[ConnectionCheck]:
+
+        return await self._run(self._check_connections_flow(owner_id, usernames, max_concurrency=max_concurrency))
+
+    async def scrape_job_post_skills(self, account_id: str, job_post_id: str) -> list:
+
+        return await self._run(self._scrape_job_post_skills_flow(account_id, job_post_id))
+
+    async def scrape_job_post_by_linkedin(self, account_id: str, job_post_id: str):
+
+        return await self._run(self._scrape_job_post_by_linkedin_flow(account_id, job_post_id))
+
+    async def scrape_job_posts(self, account_id: str, job_post_ids: Iterable[str], include_skills: bool = True,
+                               max_concurrency: int = None) -> List[JobPostResult]:
+
+        return await self._run(self._scrape_job_posts_flow(account_id, job_post_ids, include_skills=include_skills,
+                                                           max_concurrency=max_concurrency))
+
+    async def list_all_relations(self, account_id: str, prefetch: bool = False,
+                                 max_number_of_relations: Optional[int] = None, strict: bool = False) -> dict:
+
+        return await self._run(self._list_all_relations_flow(account_id, prefetch=prefetch,
+                                                             max_number_of_relations=max_number_of_relations,
+                                                             strict=strict))
+
+    async def sync_relations(self, account_id: str, state_store: RelationSyncStateStore, page_size: int = 250,
+                             prefetch: bool = False) -> Dict[str, RelationData]:
+
+        return await self._run(self._sync_relations_flow(account_id, state_store, page_size=page_size,
+                                                         prefetch=prefetch))
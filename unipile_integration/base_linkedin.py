@@ -0,0 +1,708 @@
+# IMPORTING STANDARD PACKAGES
+from time import perf_counter
+from typing import Optional, List, Tuple, Iterable, Iterator, AsyncIterator, Callable, Generator, Union, Any
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import MessageData, AccountData, MessageCheck, ConnectionCheck, ChatItem, \
+    MessageChat, RelationData, OnboardingResult, InvitationResult
+from unipile_integration.cache import ProfileCache, JobPostCache
+from unipile_integration.chat_index import ChatIndex
+from unipile_integration.concurrency import describe_error
+from unipile_integration.decoding import resolve_decoder
+from unipile_integration.export import ChatExport, ChatExportWriter, ExportCheckpointStore, MessageColumns
+from unipile_integration.invitations import InvitationBatch, InvitationAttempt
+from unipile_integration.job_posts import JobPostBatch
+from unipile_integration.message_store import MessageStore
+from unipile_integration.messaging import MessageRecipients, MessageAttempt
+from unipile_integration.pagination import page_limit, PageError
+from unipile_integration.pipeline import unique
+from unipile_integration.parsing import linkedin_integration_payload, user_info_path, chat_payload, \
+    job_post_skills_payload, job_post_payload, parse_account_id, parse_current_user, parse_user_info_payload, \
+    parse_chat_items, parse_first_chat_id, parse_reply, parse_chat_url, message_result, parse_started_chat_id, \
+    parse_job_post_skills, parse_job_post, get_timing_mode, job_post_part_payload, parse_job_post_part, \
+    invitation_payload
+from unipile_integration.quota import QuotaTracker, MESSAGE, INMAIL
+from unipile_integration.readiness import ReadinessPolicy, AccountReadiness, REJECTED_STATUS_CODES
+from unipile_integration.relation_sync import RelationSyncStateStore, RelationSyncRun
+
+# every operation is written once as a flow: a generator that yields the I/O it needs and receives its outcome.
+# the sync and async clients only differ in how they perform these effects.
+Flow = Generator[Any, Any, Any]
+FlowFactory = Callable[[Any], Flow]
+PageStream = Union[Iterator, AsyncIterator]
+
+
+class Request:
+    path: str
+    data: dict
+    method_name: str
+    body_type: str
+
+    def __init__(self, path: str, data: dict = None, method_name: str = "post", body_type: str = "json"):
+
+        self.path = path
+        self.data = data if data is not None else {}
+        self.method_name = method_name
+        self.body_type = body_type
+
+
+class Walk:
+    # consumes a page stream of the client, `add` returning False stops the walk early
+    iterate: Callable[[], PageStream]
+    add: Callable[[Any], Optional[bool]]
+
+    def __init__(self, iterate: Callable[[], PageStream], add: Callable[[Any], Optional[bool]]):
+
+        self.iterate = iterate
+        self.add = add
+
+
+class FanOut:
+    flow: FlowFactory
+    items: List[Any]
+    max_concurrency: int
+
+    def __init__(self, flow: FlowFactory, items: Iterable, max_concurrency: int):
+
+        self.flow = flow
+        self.items = list(items)
+        self.max_concurrency = max_concurrency
+
+
+class Pipeline:
+    items: Iterable
+    stages: List[Tuple[FlowFactory, int]]
+    on_error: Callable[[Any, BaseException], Any]
+    queue_size: int
+    max_pending: Optional[int]
+    prepare: Optional[Flow]
+    consume: Optional[Callable[[Any], None]]
+
+    def __init__(self, items: Iterable, stages: List[Tuple[FlowFactory, int]],
+                 on_error: Callable[[Any, BaseException], Any], queue_size: int = 100, max_pending: int = None,
+                 prepare: Flow = None, consume: Callable[[Any], None] = None):
+
+        self.items = items
+        self.stages = stages
+        self.on_error = on_error
+        self.queue_size = queue_size
+        self.max_pending = max_pending
+        self.prepare = prepare
+        self.consume = consume
+
+
+class Poll:
+    check: Callable[[], Flow]
+    owner_id: str
+    readiness: ReadinessPolicy
+    account_readiness: Optional[AccountReadiness]
+    rejected: Callable[[], bool]
+
+    def __init__(self, check: Callable[[], Flow], owner_id: str, readiness: ReadinessPolicy,
+                 account_readiness: AccountReadiness = None, rejected: Callable[[], bool] = None):
+
+        self.check = check
+        self.owner_id = owner_id
+        self.readiness = readiness
+        self.account_readiness = account_readiness
+        self.rejected = rejected if rejected is not None else lambda: False
+
+    def failed(self) -> bool:
+
+        return self.rejected() or (self.account_readiness is not None
+                                   and self.account_readiness.has_failed(self.owner_id))
+
+
+def step(flow: Flow, value: Any = None, error: BaseException = None) -> Tuple[bool, Any]:
+
+    # resumes a flow with the outcome of its last effect, returns (finished, result or next effect)
+    try:
+        effect = flow.throw(error) if error is not None else flow.send(value)
+    except StopIteration as stop:
+        return True, stop.value
+    return False, effect
+
+
+class BaseLinkedinIntegration:
+    _auth_token: str
+    _base_endpoint_path: str
+    _transport: Any
+    _owns_transport: bool
+    _max_concurrency: int
+    _profile_cache: Optional[ProfileCache]
+    _message_store: Optional[MessageStore]
+    _job_post_cache: Optional[JobPostCache]
+    _json_decoder: str
+    _chat_index: Optional[ChatIndex]
+
+    def __init__(self, auth_token: str, base_endpoint_path: str, transport: Any, owns_transport: bool,
+                 max_concurrency: int = 10, profile_cache: ProfileCache = None, message_store: MessageStore = None,
+                 job_post_cache: JobPostCache = None, json_decoder: str = None, chat_index: ChatIndex = None):
+
+        self._auth_token = auth_token
+        self._base_endpoint_path = base_endpoint_path
+        self._transport = transport
+        self._owns_transport = owns_transport
+        self._max_concurrency = max_concurrency
+        self._profile_cache = profile_cache
+        self._message_store = message_store
+        self._job_post_cache = job_post_cache
+        self._json_decoder = resolve_decoder(json_decoder)
+        self._chat_index = chat_index
+
+    @property
+    def transport(self) -> Any:
+
+        return self._transport
+
+    @property
+    def profile_cache(self) -> Optional[ProfileCache]:
+
+        return self._profile_cache
+
+    @property
+    def message_store(self) -> Optional[MessageStore]:
+
+        return self._message_store
+
+    @property
+    def job_post_cache(self) -> Optional[JobPostCache]:
+
+        return self._job_post_cache
+
+    @property
+    def json_decoder(self) -> str:
+
+        return self._json_decoder
+
+    @property
+    def chat_index(self) -> Optional[ChatIndex]:
+
+        return self._chat_index
+
+    @staticmethod
+    def get_timing_mode(timing_urn: str) -> str:
+
+        return get_timing_mode(timing_urn)
+
+    def _iter_items(self, url: str, item_type: type, max_items: Optional[int] = None,
+                    prefetch: bool = False, strict: bool = False) -> PageStream:
+        raise NotImplementedError
+
+    def iter_chats(self, account_id: str, max_number_of_chats: Optional[int] = None, page_size: int = 100,
+                   prefetch: bool = False, strict: bool = False) -> PageStream:
+
+        limit = page_limit(max_number_of_chats, page_size)
+        url = f"chats?limit={limit}&account_type=LINKEDIN&account_id={account_id}"
+        return self._iter_items(url, ChatItem, max_items=max_number_of_chats, prefetch=prefetch, strict=strict)
+
+    def iter_chat_messages(self, chat_id: str, max_number_of_messages: Optional[int] = None, page_size: int = 100,
+                           prefetch: bool = False, strict: bool = False) -> PageStream:
+
+        limit = page_limit(max_number_of_messages, page_size)
+        url = f"chats/{chat_id}/messages?limit={limit}"
+        return self._iter_items(url, MessageChat, max_items=max_number_of_messages, prefetch=prefetch, strict=strict)
+
+    def iter_relations(self, account_id: str, max_number_of_relations: Optional[int] = None, page_size: int = 250,
+                       prefetch: bool = False, strict: bool = False) -> PageStream:
+
+        limit = page_limit(max_number_of_relations, page_size)
+        url = f"users/relations?account_id={account_id}&limit={limit}"
+        return self._iter_items(url, RelationData, max_items=max_number_of_relations, prefetch=prefetch,
+                                strict=strict)
+
+    def _workers(self, max_concurrency: Optional[int]) -> int:
+
+        return self._max_concurrency if max_concurrency is None else max_concurrency
+
+    def _require_chat_index(self) -> ChatIndex:
+
+        if self._chat_index is None:
+            raise ValueError("a ChatIndex is required, pass chat_index to the client")
+        return self._chat_index
+
+    def _indexed(self, owner_id: str) -> Optional[ChatIndex]:
+
+        if self._chat_index is not None and self._chat_index.is_indexed(owner_id):
+            return self._chat_index
+        return None
+
+    def _require_message_store(self) -> MessageStore:
+
+        if self._message_store is None:
+            raise ValueError("a MessageStore is required, pass message_store to the client")
+        return self._message_store
+
+    def _add_linkedin_integration_flow(self, li_at_cookie: str, user_agent: str, li_a_cookie: str = None,
+                                       recruiter_contract_id: str = None) -> Flow:
+
+        payload = linkedin_integration_payload(li_at_cookie, user_agent, li_a_cookie=li_a_cookie,
+                                               recruiter_contract_id=recruiter_contract_id)
+        response = yield Request("accounts", payload)
+        return parse_account_id(response)
+
+    def _read_all_chats_flow(self, account_id: str, max_number_of_chats: int = 100) -> Flow:
+
+        chats = []
+        yield Walk(lambda: self.iter_chats(account_id, max_number_of_chats), chats.append)
+        if self._message_store is not None:
+            self._message_store.add_chats(chats, account_id)
+        if self._chat_index is not None:
+            self._chat_index.add_chats(account_id, chats)
+        return chats
+
+    def _refresh_chat_index_flow(self, account_id: str, page_size: int = 100) -> Flow:
+
+        index = self._require_chat_index()
+        latest_timestamp = index.latest_timestamp(account_id)
+        chats = []
+
+        def add(item: ChatItem) -> bool:
+            if latest_timestamp is not None and item.raw_timestamp is not None \
+                    and item.raw_timestamp < latest_timestamp:
+                return False
+            chats.append(item)
+            return True
+
+        # strict paging: a failed sweep must not mark the account as indexed with missing chats
+        yield Walk(lambda: self.iter_chats(account_id, page_size=page_size, strict=True), add)
+        index.add_chats(account_id, chats)
+        index.mark_refreshed(account_id, max((item.raw_timestamp for item in chats if item.raw_timestamp is not None),
+                                             default=None))
+        return chats
+
+    def _try_refresh_chat_index_flow(self, account_id: str) -> Flow:
+
+        # a failed sweep is counted and the batch falls back to the store and the chat_attendees lookups,
+        # an index left from an earlier sweep may already be missing chats
+        if self._chat_index is None:
+            return False
+        try:
+            yield from self._refresh_chat_index_flow(account_id)
+        except (PageError,) + self._transport.transport_errors as e:
+            instrumentation = self._transport.instrumentation
+            if instrumentation.enabled:
+                instrumentation.on_fallback("refresh_chat_index", account_id, e)
+            return False
+        return True
+
+    def _read_full_chat_flow(self, chat_id: str, max_number_of_messages: int = None) -> Flow:
+
+        messages = []
+        if self._message_store is None:
+            yield Walk(lambda: self.iter_chat_messages(chat_id, max_number_of_messages), messages.append)
+            return messages
+        try:
+            yield Walk(lambda: self.iter_chat_messages(chat_id, max_number_of_messages, strict=True), messages.append)
+        except PageError:
+            # the caller still gets what was read, the store only takes complete histories
+            return messages
+        if max_number_of_messages is None or len(messages) < max_number_of_messages:
+            self._message_store.add_messages(messages, chat_id)
+        return messages
+
+    def _sync_chat_messages_flow(self, chat_id: str, page_size: int = 100) -> Flow:
+
+        store = self._require_message_store()
+        latest_timestamp = store.latest_message_timestamp(chat_id)
+        messages = []
+
+        def add(item: MessageChat) -> bool:
+            if store.has_message(item.id) or (latest_timestamp is not None and item.raw_timestamp is not None
+                                              and item.raw_timestamp < latest_timestamp):
+                return False
+            messages.append(item)
+            return True
+
+        # a failed page raises before anything is stored, a stored prefix would hide the older messages
+        yield Walk(lambda: self.iter_chat_messages(chat_id, page_size=page_size, strict=True), add)
+        store.add_messages(messages, chat_id)
+        return messages
+
+    def _export_chat_flow(self, account_id: str, chat: ChatItem, page_size: int) -> Flow:
+
+        # strict paging: a chat whose history could not be read completely is reported as failed, not exported
+        columns = MessageColumns(account_id, chat)
+        yield Walk(lambda: self.iter_chat_messages(chat.chat_id, page_size=page_size, strict=True), columns.add)
+        return True, columns
+
+    def _export_chats_flow(self, account_id: str, writer: ChatExportWriter, checkpoint: ExportCheckpointStore = None,
+                           max_concurrency: int = None, page_size: int = 100, commit_every: int = 100) -> Flow:
+
+        start = perf_counter()
+        export = ChatExport(account_id, writer, checkpoint=checkpoint, commit_every=commit_every)
+        workers = self._workers(max_concurrency)
+        # the chat list is small, it is read up front so a listing failure raises before anything is written
+        yield Walk(lambda: self.iter_chats(account_id, page_size=page_size, prefetch=True, strict=True), export.select)
+        stages = [(lambda chat: self._export_chat_flow(account_id, chat, page_size), workers)]
+        yield Pipeline(export.pending, stages, export.on_error, queue_size=max(workers, 1) * 2, consume=export.handle)
+        export.commit()
+        return export.result(perf_counter() - start)
+
+    def _user_info_flow(self, linkedin_username: str, owner_id: str, custom_api: str = None,
+                        require_connection: bool = False) -> Flow:
+
+        linkedin_api = custom_api if custom_api is not None and custom_api.strip() != "" else None
+        if self._profile_cache is not None:
+            account_data = self._profile_cache.get(owner_id, linkedin_username, linkedin_api,
+                                                   require_connection=require_connection)
+            if account_data is not None:
+                return account_data
+        response = yield Request(user_info_path(linkedin_username, owner_id, linkedin_api), method_name="get")
+        data = parse_user_info_payload(response)
+        if data is None:
+            return None
+        if self._profile_cache is not None:
+            self._profile_cache.set(owner_id, linkedin_username, data, linkedin_api)
+        account_data = AccountData(**data)
+        if self._chat_index is not None and linkedin_api is None:
+            self._chat_index.add_username(owner_id, linkedin_username, account_data.user_id)
+        return account_data
+
+    def _resolve_provider_id_flow(self, linkedin_username: str, owner_id: str) -> Flow:
+
+        if self._chat_index is not None:
+            provider_id = self._chat_index.provider_id(owner_id, linkedin_username)
+            if provider_id is not None:
+                return provider_id
+        account_data = yield from self._user_info_flow(linkedin_username, owner_id)
+        return account_data.user_id if account_data is not None else None
+
+    def _has_conversation_started_flow(self, owner_id: str, provider_id: str, use_index: bool = True) -> Flow:
+
+        index = self._indexed(owner_id) if use_index else None
+        if index is not None:
+            return index.has_chat(owner_id, provider_id)
+        # the store only holds the chats read so far, a hit is final but a miss still asks the API
+        if self._message_store is not None and \
+                len(self._message_store.chat_ids_for_attendee(provider_id, owner_id)) > 0:
+            return True
+        response = yield Request(f"chat_attendees/{provider_id}/chats?account_id={owner_id}", method_name="get")
+        return response.status_code == 200
+
+    def _list_all_chats_between_flow(self, owner_id: str, public_attendee_slug: str) -> Flow:
+
+        attendee: Optional[AccountData] = yield from self._user_info_flow(public_attendee_slug, owner_id)
+        if attendee is None:
+            return []
+        index = self._indexed(owner_id)
+        if index is not None:
+            return index.chats(owner_id, attendee.user_id)
+        response = yield Request(f"chat_attendees/{attendee.user_id}/chats?account_id={owner_id}", method_name="get")
+        return parse_chat_items(response)
+
+    def _reply_to_message_id_flow(self, chat_id: str, owner_id: str, message_text: str, receiver_id: str) -> Flow:
+
+        response = yield Request(f"chats/{chat_id}/messages?sender_id={owner_id}", method_name="get")
+        return parse_reply(response, message_text, receiver_id)
+
+    def _chat_by_username_flow(self, linkedin_username: str, owner_id: str, message_text: str,
+                               use_index: bool = True) -> Flow:
+
+        account_data = yield from self._user_info_flow(linkedin_username, owner_id, require_connection=True)
+        if account_data is None:
+            return None, None
+        has_connection, user_id = account_data.has_connection, account_data.user_id
+        if has_connection and user_id is not None:
+            index = self._indexed(owner_id) if use_index else None
+            if index is not None:
+                chat_ids = index.chat_ids(owner_id, user_id)
+                chat_id = chat_ids[0] if len(chat_ids) > 0 else None
+            else:
+                response = yield Request(f"chat_attendees/{user_id}/chats?account_id={owner_id}", method_name="get")
+                chat_id = parse_first_chat_id(response)
+            if chat_id is not None and self._message_store is not None:
+                yield from self._sync_chat_messages_flow(chat_id)
+                return self._message_store.find_reply(chat_id, message_text, user_id), chat_id
+            if chat_id is not None:
+                reply = yield from self._reply_to_message_id_flow(chat_id, owner_id, message_text, user_id)
+                return reply, chat_id
+        return None, None
+
+    def _has_accepted_connection_flow(self, linkedin_username: str, owner_id: str) -> Flow:
+
+        account_data = yield from self._user_info_flow(linkedin_username, owner_id, require_connection=True)
+        return account_data is not None and account_data.has_connection, \
+            account_data.user_id if account_data is not None else None
+
+    def _send_connection_flow(self, linkedin_username: str, owner_id: str) -> Flow:
+
+        accepted_connection, user_id = yield from self._has_accepted_connection_flow(linkedin_username, owner_id)
+        if accepted_connection is False and user_id is not None:
+            response = yield Request("users/invite", invitation_payload(owner_id, user_id))
+            if self._profile_cache is not None:
+                self._profile_cache.invalidate(owner_id, linkedin_username)
+            return response.status_code == 201
+        return False
+
+    def _send_invitation_flow(self, owner_id: str, username: str, quota: Optional[QuotaTracker]) -> Flow:
+
+        attempt = InvitationAttempt(owner_id, username, quota)
+        try:
+            account_data = yield from self._user_info_flow(username, owner_id, require_connection=True)
+            result = attempt.resolve(account_data)
+            if result is not None:
+                return result
+            response = yield Request("users/invite", invitation_payload(owner_id, attempt.user_id))
+            result = attempt.sent(response.status_code)
+            if result.status == InvitationResult.INVITED and self._profile_cache is not None:
+                self._profile_cache.invalidate(owner_id, username)
+            return result
+        except Exception as e:
+            return attempt.failed(describe_error(e))
+
+    def _send_connections_flow(self, owner_id: str, usernames: Iterable[str], relations: Iterable[RelationData] = None,
+                               quota: QuotaTracker = None, max_concurrency: int = None) -> Flow:
+
+        if relations is None:
+            # a partial network would invite known relations again, a failed page raises a PageError instead
+            relations = yield from self._list_all_relations_flow(owner_id, prefetch=True, strict=True)
+        batch = InvitationBatch(owner_id, usernames, relations)
+        results = yield FanOut(lambda username: self._send_invitation_flow(owner_id, username, quota), batch.unknown,
+                               self._workers(max_concurrency))
+        return batch.complete(results)
+
+    def _get_chat_url_flow(self, chat_id: str) -> Flow:
+
+        response = yield Request(f"chats/{chat_id}", method_name="get")
+        return parse_chat_url(response)
+
+    def _send_message_to_chat_flow(self, chat_id: str, message: str) -> Flow:
+
+        if message is not None and message.strip() != "":
+            response = yield Request(f"chats/{chat_id}/messages/", {"text": message})
+            return response.status_code == 201
+        return False
+
+    def _send_message_flow(self, attendees_username: list, owner_id: str, message: str,
+                           check_message_not_sent: bool = True, inmail_message: bool = False, subject: str = None,
+                           is_sales: bool = False) -> Flow:
+
+        codes_status = []
+        if message is None or message.strip() == "":
+            return codes_status
+        use_index = True
+        if check_message_not_sent:
+            use_index = yield from self._try_refresh_chat_index_flow(owner_id)
+        final_users = []
+        for item in attendees_username:
+            provider_id = yield from self._resolve_provider_id_flow(item, owner_id)
+            if provider_id is not None:
+                final_users.append(provider_id)
+        for attendee in final_users:
+            if check_message_not_sent:
+                started = yield from self._has_conversation_started_flow(owner_id, attendee, use_index=use_index)
+                if started:
+                    continue
+            response = yield Request("chats", chat_payload(attendee, owner_id, message, inmail_message=inmail_message,
+                                                           subject=subject, is_sales=is_sales))
+            chat_id = parse_started_chat_id(response)
+            if chat_id is not None and self._chat_index is not None:
+                self._chat_index.add_chat(owner_id, chat_id, attendee)
+            codes_status.append(MessageData(**{
+                "chat_id": chat_id,
+                "author_id": owner_id,
+                "linkedin_id": attendee
+            }))
+        return codes_status
+
+    def _send_messages_pipeline(self, attendees_username: Iterable[str], owner_id: str, message: str,
+                                check_message_not_sent: bool = True, inmail_message: bool = False,
+                                subject: str = None, is_sales: bool = False, quota: QuotaTracker = None,
+                                max_concurrency: int = None, queue_size: int = 100) -> Pipeline:
+
+        if message is None or message.strip() == "":
+            attendees_username = []
+        action = INMAIL if inmail_message else MESSAGE
+        workers = self._workers(max_concurrency)
+        recipients = MessageRecipients(owner_id)
+        use_index = True
+
+        def refresh() -> Flow:
+            nonlocal use_index
+            use_index = yield from self._try_refresh_chat_index_flow(owner_id)
+
+        def resolve(username: str) -> Flow:
+            user_id = yield from self._resolve_provider_id_flow(username, owner_id)
+            result = recipients.claim(username, user_id)
+            return (True, result) if result is not None else (False, (username, user_id))
+
+        def precheck(recipient: tuple) -> Flow:
+            username, user_id = recipient
+            started = yield from self._has_conversation_started_flow(owner_id, user_id, use_index=use_index)
+            if started:
+                return True, message_result(owner_id, username, user_id, MessageData.SKIPPED)
+            return False, recipient
+
+        def send(recipient: tuple) -> Flow:
+            attempt = MessageAttempt(owner_id, *recipient, quota=quota, action=action)
+            try:
+                result = attempt.reserve()
+                if result is not None:
+                    return True, result
+                response = yield Request("chats", chat_payload(
+                    attempt.user_id, owner_id, message, inmail_message=inmail_message, subject=subject,
+                    is_sales=is_sales
+                ))
+                chat_id = parse_started_chat_id(response)
+                if chat_id is not None and self._chat_index is not None:
+                    self._chat_index.add_chat(owner_id, chat_id, attempt.user_id)
+                return True, attempt.sent(chat_id, response.status_code)
+            except Exception as e:
+                return True, attempt.failed(describe_error(e))
+
+        def on_error(item, error: BaseException) -> MessageData:
+            username, user_id = item if isinstance(item, tuple) else (item, None)
+            return message_result(owner_id, username, user_id, error=describe_error(error))
+
+        stages = [(resolve, workers), (precheck, workers), (send, workers)] if check_message_not_sent \
+            else [(resolve, workers), (send, workers)]
+        # sends never run more than one batch of workers ahead of the consumer
+        return Pipeline(unique(attendees_username), stages, on_error, queue_size=queue_size, max_pending=workers,
+                        prepare=refresh() if check_message_not_sent else None)
+
+    def _find_personal_private_id_flow(self, is_sales_api: bool, provider_id: str, owner_id: str) -> Flow:
+
+        account_data = yield from self._user_info_flow(provider_id, owner_id,
+                                                       "sales_navigator" if is_sales_api else "recruiter")
+        if account_data is not None:
+            return account_data.user_id
+
+    def _auth_user_flow(self, li_at_cookie: str, user_agent: str, li_a_cookie: str = None,
+                        recruiter_contract_id: str = None, readiness: ReadinessPolicy = None,
+                        account_readiness: AccountReadiness = None) -> Flow:
+
+        owner_id = yield from self._add_linkedin_integration_flow(li_at_cookie, user_agent, li_a_cookie=li_a_cookie,
+                                                                  recruiter_contract_id=recruiter_contract_id)
+        if owner_id is None:
+            return None
+        rejected = []
+
+        def check() -> Flow:
+            response = yield Request(f"users/me?account_id={owner_id}", method_name="get")
+            if response.status_code in REJECTED_STATUS_CODES:
+                rejected.append(response.status_code)
+            return parse_current_user(response, owner_id)
+
+        account_data = yield Poll(check, owner_id, readiness if readiness is not None else ReadinessPolicy(),
+                                  account_readiness, rejected=lambda: len(rejected) > 0)
+        if account_data is not None and (account_data.is_recruiter or account_data.is_sales_navigator):
+            # only users/me tells readiness apart, the transport already retries a 429 or 5xx lookup
+            private_id = yield from self._find_personal_private_id_flow(account_data.is_sales_navigator,
+                                                                        account_data.account_id, owner_id)
+            account_data = account_data.replace(private_premium_id=private_id)
+        return account_data
+
+    def _onboard_flow(self, index: int, credentials: dict, readiness: Optional[ReadinessPolicy],
+                      account_readiness: Optional[AccountReadiness]) -> Flow:
+
+        start, account_data, error = perf_counter(), None, None
+        try:
+            account_data = yield from self._auth_user_flow(**credentials, readiness=readiness,
+                                                           account_readiness=account_readiness)
+            if account_data is None:
+                error = "account not ready"
+        except Exception as e:
+            error = describe_error(e)
+        return OnboardingResult(**{
+            "index": index,
+            "account": account_data,
+            "error": error,
+            "elapsed": perf_counter() - start
+        })
+
+    def _delete_linkedin_connection_flow(self, owner_id: str) -> Flow:
+
+        response = yield Request(f"accounts/{owner_id}", method_name="delete")
+        return response.status_code == 200
+
+    def _check_reply_flow(self, owner_id: str, message: MessageCheck, use_index: bool = True) -> Flow:
+
+        reply_text, chat_id, error = None, None, None
+        try:
+            reply_text, chat_id = yield from self._chat_by_username_flow(message.username, owner_id,
+                                                                         message.message_text, use_index=use_index)
+        except Exception as e:
+            error = describe_error(e)
+        return MessageCheck(**{
+            "username": message.username,
+            "message_text": message.message_text,
+            "reply_text": reply_text,
+            "chat_id": chat_id,
+            "error": error
+        })
+
+    def _check_replies_flow(self, owner_id: str, messages_data: List[MessageCheck],
+                            max_concurrency: int = None) -> Flow:
+
+        use_index = yield from self._try_refresh_chat_index_flow(owner_id)
+        return (yield FanOut(lambda message: self._check_reply_flow(owner_id, message, use_index=use_index),
+                             messages_data, self._workers(max_concurrency)))
+
+    def _check_connection_flow(self, owner_id: str, username: str) -> Flow:
+
+        check, error = False, None
+        try:
+            check, _ = yield from self._has_accepted_connection_flow(username, owner_id)
+        except Exception as e:
+            error = describe_error(e)
+        return ConnectionCheck(**{
+            "username": username,
+            "has_accepted": check,
+            "error": error
+        })
+
+    def _check_connections_flow(self, owner_id: str, usernames: list, max_concurrency: int = None) -> Flow:
+
+        return (yield FanOut(lambda username: self._check_connection_flow(owner_id, username), usernames,
+                             self._workers(max_concurrency)))
+
+    def _scrape_job_post_skills_flow(self, account_id: str, job_post_id: str) -> Flow:
+
+        response = yield Request("linkedin", job_post_skills_payload(account_id, job_post_id))
+        return parse_job_post_skills(response)
+
+    def _scrape_job_post_by_linkedin_flow(self, account_id: str, job_post_id: str) -> Flow:
+
+        response = yield Request("linkedin", job_post_payload(account_id, job_post_id))
+        return parse_job_post(response)
+
+    def _scrape_job_post_part_flow(self, account_id: str, job_post_id: str, part: str) -> Flow:
+
+        try:
+            response = yield Request("linkedin", job_post_part_payload(account_id, job_post_id, part))
+            if response.status_code != 200:
+                return None, f"unexpected status code {response.status_code}"
+            return parse_job_post_part(response, part), None
+        except Exception as e:
+            return None, describe_error(e)
+
+    def _scrape_job_posts_flow(self, account_id: str, job_post_ids: Iterable[str], include_skills: bool = True,
+                               max_concurrency: int = None) -> Flow:
+
+        batch = JobPostBatch(job_post_ids, include_skills=include_skills, cache=self._job_post_cache)
+        outcomes = yield FanOut(lambda call: self._scrape_job_post_part_flow(account_id, *call), batch.calls,
+                                self._workers(max_concurrency))
+        return batch.complete(outcomes)
+
+    def _list_all_relations_flow(self, account_id: str, prefetch: bool = False,
+                                 max_number_of_relations: Optional[int] = None, strict: bool = False) -> Flow:
+
+        relations = {}
+        yield Walk(lambda: self.iter_relations(account_id, max_number_of_relations, prefetch=prefetch, strict=strict),
+                   lambda item: relations.setdefault(item.member_id, item) and None)
+        if self._chat_index is not None:
+            self._chat_index.add_relations(account_id, relations.values())
+        return relations
+
+    def _sync_relations_flow(self, account_id: str, state_store: RelationSyncStateStore, page_size: int = 250,
+                             prefetch: bool = False) -> Flow:
+
+        sync_run = RelationSyncRun(account_id, state_store.get(account_id))
+        # a failed page raises before the high water mark moves, so the next run walks the gap again
+        yield Walk(lambda: self.iter_relations(account_id, page_size=page_size, prefetch=prefetch, strict=True),
+                   sync_run.add)
+        state = sync_run.state()
+        if state is not None:
+            state_store.set(state)
+        return sync_run.added
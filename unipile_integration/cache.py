@@ -0,0 +1,157 @@
+# IMPORTING STANDARD PACKAGES
+from collections import OrderedDict
+from threading import Lock
+from time import time
+from typing import Optional, Tuple
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import AccountData, JobPostResult
+
+
+class ProfileCacheBackend:
+
+    def get(self, key: str) -> Optional[dict]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: dict, ttl: float) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class InMemoryProfileCacheBackend(ProfileCacheBackend):
+    _max_size: int
+    _entries: "OrderedDict[str, Tuple[float, dict]]"
+    _lock: Lock
+
+    def __init__(self, max_size: int = 10000):
+
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict, ttl: float) -> None:
+
+        with self._lock:
+            self._entries[key] = (time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+
+class ProfileCache:
+    LINKEDIN_APIS = (None, "recruiter", "sales_navigator")
+
+    _backend: ProfileCacheBackend
+    _ttl: float
+    _connection_ttl: float
+    _lock: Lock
+    hits: int
+    misses: int
+
+    def __init__(self, backend: ProfileCacheBackend = None, ttl: float = 3600, connection_ttl: float = 300):
+
+        self._backend = backend if backend is not None else InMemoryProfileCacheBackend()
+        self._ttl = ttl
+        self._connection_ttl = connection_ttl
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(owner_id: str, username: str, linkedin_api: Optional[str] = None) -> str:
+
+        return f"{owner_id}:{linkedin_api if linkedin_api else ''}:{username}"
+
+    def get(self, owner_id: str, username: str, linkedin_api: Optional[str] = None,
+            require_connection: bool = False) -> Optional[AccountData]:
+
+        entry = self._backend.get(self.key(owner_id, username, linkedin_api))
+        if entry is None or (require_connection and entry["fetched_at"] + self._connection_ttl <= time()):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return AccountData(**entry["payload"])
+
+    def set(self, owner_id: str, username: str, payload: dict, linkedin_api: Optional[str] = None) -> None:
+
+        self._backend.set(self.key(owner_id, username, linkedin_api), {
+            "payload": payload,
+            "fetched_at": time()
+        }, self._ttl)
+
+    def invalidate(self, owner_id: str, username: str) -> None:
+
+        for linkedin_api in self.LINKEDIN_APIS:
+            self._backend.delete(self.key(owner_id, username, linkedin_api))
+
+
+class JobPostCache:
+    _backend: ProfileCacheBackend
+    _ttl: float
+    _lock: Lock
+    hits: int
+    misses: int
+
+    def __init__(self, backend: ProfileCacheBackend = None, ttl: float = 24 * 3600):
+
+        self._backend = backend if backend is not None else InMemoryProfileCacheBackend()
+        self._ttl = ttl
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(job_post_id: str) -> str:
+
+        return f"job_post:{job_post_id}"
+
+    def get(self, job_post_id: str) -> Optional[JobPostResult]:
+
+        entry = self._backend.get(self.key(job_post_id))
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return JobPostResult(**entry, **{
+            "job_post_id": job_post_id,
+            "cached": True
+        })
+
+    def set(self, result: JobPostResult) -> None:
+
+        self._backend.set(self.key(result.job_post_id), {
+            "job_post": result.job_post,
+            "skills": result.skills
+        }, self._ttl)
+
+    def invalidate(self, job_post_id: str) -> None:
+
+        self._backend.delete(self.key(job_post_id))
@@ -0,0 +1,183 @@
+# IMPORTING STANDARD PACKAGES
+import sqlite3
+
+from threading import Lock
+from typing import Optional, Iterable, List, Dict, Tuple
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import ChatItem, RelationData
+
+
+class ChatIndex:
+    _chats: Dict[str, ChatItem]
+    _by_attendee: Dict[Tuple[str, str], Dict[str, Optional[str]]]
+    _usernames: Dict[Tuple[str, str], str]
+    _latest: Dict[str, str]
+    _connection: Optional[sqlite3.Connection]
+    _lock: Lock
+
+    def __init__(self, path: str = None):
+
+        self._chats = {}
+        self._by_attendee = {}
+        self._usernames = {}
+        self._latest = {}
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False) if path is not None else None
+        if self._connection is not None:
+            self._load()
+
+    def _load(self) -> None:
+
+        with self._lock, self._connection:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS chat_index_chats (
+                    chat_id TEXT PRIMARY KEY,
+                    account_id TEXT NOT NULL,
+                    attendee_provider_id TEXT,
+                    provider_id TEXT,
+                    timestamp TEXT
+                );
+                CREATE TABLE IF NOT EXISTS chat_index_usernames (
+                    account_id TEXT NOT NULL,
+                    username TEXT NOT NULL,
+                    provider_id TEXT NOT NULL,
+                    PRIMARY KEY (account_id, username)
+                );
+                CREATE TABLE IF NOT EXISTS chat_index_accounts (
+                    account_id TEXT PRIMARY KEY,
+                    latest_timestamp TEXT
+                );
+                """
+            )
+            chats = self._connection.execute(
+                "SELECT chat_id, account_id, attendee_provider_id, provider_id, timestamp FROM chat_index_chats"
+            ).fetchall()
+            usernames = self._connection.execute(
+                "SELECT account_id, username, provider_id FROM chat_index_usernames"
+            ).fetchall()
+            accounts = self._connection.execute(
+                "SELECT account_id, latest_timestamp FROM chat_index_accounts"
+            ).fetchall()
+        for chat_id, account_id, attendee_provider_id, provider_id, timestamp in chats:
+            self._index_chat(account_id, ChatItem(**{
+                "id": chat_id,
+                "attendee_provider_id": attendee_provider_id,
+                "provider_id": provider_id,
+                "timestamp": timestamp
+            }))
+        for account_id, username, provider_id in usernames:
+            self._usernames[(account_id, username)] = provider_id
+        for account_id, latest_timestamp in accounts:
+            self._latest[account_id] = latest_timestamp
+
+    def _index_chat(self, account_id: str, chat: ChatItem) -> None:
+
+        self._chats[chat.chat_id] = chat
+        if chat.attendee_provider_id is not None:
+            self._by_attendee.setdefault((account_id, chat.attendee_provider_id), {})[chat.chat_id] = \
+                chat.raw_timestamp
+
+    def add_chats(self, account_id: str, chats: Iterable[ChatItem]) -> None:
+
+        chats = list(chats)
+        with self._lock:
+            for chat in chats:
+                self._index_chat(account_id, chat)
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO chat_index_chats "
+                        "(chat_id, account_id, attendee_provider_id, provider_id, timestamp) VALUES (?, ?, ?, ?, ?)",
+                        [(chat.chat_id, account_id, chat.attendee_provider_id, chat.provider_id, chat.raw_timestamp)
+                         for chat in chats]
+                    )
+
+    def add_chat(self, account_id: str, chat_id: str, attendee_provider_id: str, timestamp: str = None) -> None:
+
+        self.add_chats(account_id, [ChatItem(**{
+            "id": chat_id,
+            "attendee_provider_id": attendee_provider_id,
+            "timestamp": timestamp
+        })])
+
+    def add_username(self, account_id: str, username: str, provider_id: str) -> None:
+
+        self.add_usernames(account_id, [(username, provider_id)])
+
+    def add_usernames(self, account_id: str, usernames: Iterable[Tuple[str, str]]) -> None:
+
+        usernames = [(username, provider_id) for username, provider_id in usernames
+                     if username is not None and provider_id is not None]
+        with self._lock:
+            for username, provider_id in usernames:
+                self._usernames[(account_id, username)] = provider_id
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO chat_index_usernames (account_id, username, provider_id) "
+                        "VALUES (?, ?, ?)",
+                        [(account_id, username, provider_id) for username, provider_id in usernames]
+                    )
+
+    def add_relations(self, account_id: str, relations: Iterable[RelationData]) -> None:
+
+        self.add_usernames(account_id, [(relation.public_identifier, relation.member_id) for relation in relations])
+
+    def mark_refreshed(self, account_id: str, latest_timestamp: Optional[str]) -> None:
+
+        with self._lock:
+            # an empty string marks an account that was swept but has no chats yet
+            timestamps = [timestamp for timestamp in (self._latest.get(account_id), latest_timestamp) if timestamp]
+            self._latest[account_id] = max(timestamps) if len(timestamps) > 0 else ""
+            if self._connection is not None:
+                with self._connection:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO chat_index_accounts (account_id, latest_timestamp) VALUES (?, ?)",
+                        (account_id, self._latest[account_id])
+                    )
+
+    def is_indexed(self, account_id: str) -> bool:
+
+        return account_id in self._latest
+
+    def latest_timestamp(self, account_id: str) -> Optional[str]:
+
+        latest_timestamp = self._latest.get(account_id)
+        return latest_timestamp if latest_timestamp != "" else None
+
+    def provider_id(self, account_id: str, username: str) -> Optional[str]:
+
+        return self._usernames.get((account_id, username))
+
+    def chat_ids(self, account_id: str, attendee_provider_id: str) -> List[str]:
+
+        with self._lock:
+            chats = list(self._by_attendee.get((account_id, attendee_provider_id), {}).items())
+        chats.sort(key=lambda chat: chat[1] if chat[1] is not None else "", reverse=True)
+        return [chat_id for chat_id, _ in chats]
+
+    def chats(self, account_id: str, attendee_provider_id: str) -> List[ChatItem]:
+
+        return [self._chats[chat_id] for chat_id in self.chat_ids(account_id, attendee_provider_id)]
+
+    def has_chat(self, account_id: str, attendee_provider_id: str) -> bool:
+
+        return len(self._by_attendee.get((account_id, attendee_provider_id), {})) > 0
+
+    def chat_ids_for_username(self, account_id: str, username: str) -> Optional[List[str]]:
+
+        provider_id = self.provider_id(account_id, username)
+        if provider_id is None:
+            return None
+        return self.chat_ids(account_id, provider_id)
+
+    def __len__(self) -> int:
+
+        return len(self._chats)
+
+    def close(self) -> None:
+
+        if self._connection is not None:
+            self._connection.close()
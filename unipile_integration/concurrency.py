@@ -0,0 +1,31 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Awaitable, Any
+
+
+def map_bounded(func: Callable[[Any], Any], items: Iterable, max_concurrency: int) -> List[Any]:
+
+    items = list(items)
+    if max_concurrency is None or max_concurrency <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+async def gather_bounded(func: Callable[[Any], Awaitable[Any]], items: Iterable, max_concurrency: int) -> List[Any]:
+
+    semaphore = asyncio.Semaphore(max_concurrency if max_concurrency is not None and max_concurrency > 0 else 1)
+
+    async def run(item):
+        async with semaphore:
+            return await func(item)
+
+    return list(await asyncio.gather(*[run(item) for item in items]))
+
+
+def describe_error(error: BaseException) -> str:
+
+    message = str(error)
+    return f"{type(error).__name__}: {message}" if message else type(error).__name__
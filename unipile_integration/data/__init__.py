@@ -1,3 +1,4 @@
+from .record import Record
 from .integration_data import IntegrationAccountData
 from .message_data import MessageData
 from .account_data import AccountData
@@ -6,3 +7,11 @@ from .connection_check import ConnectionCheck
 from .message_chat import MessageChat
 from .chat import ChatItem
 from .relation_data import RelationData
+from .relation_sync_state import RelationSyncState
+from .webhook_event import WebhookEvent
+from .job_post_result import JobPostResult
+from .work_result import WorkResult
+from .onboarding_result import OnboardingResult
+from .export_result import ExportResult
+from .invitation_result import InvitationResult
+from .candidate import Candidate
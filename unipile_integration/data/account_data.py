@@ -1,9 +1,16 @@
-class AccountData:
+from .record import Record, set_field
+
+
+class AccountData(Record):
+
+    __slots__ = ("user_id", "username", "has_connection")
 
     user_id: str
     username: str
     has_connection: bool
 
-    def __init__(self, **kwargs):
-        self.user_id, self.username, self.has_connection = kwargs.get("provider_id"), kwargs.get(
-            "public_identifier"), kwargs.get("is_relationship")
+    def _load(self, data: dict) -> None:
+
+        set_field(self, "user_id", data.get("provider_id"))
+        set_field(self, "username", data.get("public_identifier"))
+        set_field(self, "has_connection", data.get("is_relationship"))
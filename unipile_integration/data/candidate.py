@@ -0,0 +1,40 @@
+from typing import Optional
+
+from .record import Record, set_field
+
+
+class Candidate(Record):
+
+    __slots__ = ("candidate_id", "public_identifier", "first_name", "last_name", "headline", "location",
+                 "network_distance", "profile_url", "current_company", "current_role")
+
+    candidate_id: str
+    public_identifier: Optional[str]
+    first_name: Optional[str]
+    last_name: Optional[str]
+    headline: Optional[str]
+    location: Optional[str]
+    network_distance: Optional[str]
+    profile_url: Optional[str]
+    current_company: Optional[str]
+    current_role: Optional[str]
+
+    def _load(self, data: dict) -> None:
+
+        set_field(self, "candidate_id", data.get("id"))
+        set_field(self, "public_identifier", data.get("public_identifier"))
+        set_field(self, "first_name", data.get("first_name"))
+        set_field(self, "last_name", data.get("last_name"))
+        set_field(self, "headline", data.get("headline"))
+        set_field(self, "location", data.get("location"))
+        set_field(self, "network_distance", data.get("network_distance"))
+        set_field(self, "profile_url", data.get("public_profile_url", data.get("profile_url")))
+        positions = data.get("current_positions") or []
+        current_position = positions[0] if len(positions) > 0 and isinstance(positions[0], dict) else {}
+        set_field(self, "current_company", current_position.get("company"))
+        set_field(self, "current_role", current_position.get("role"))
+
+    @property
+    def key(self) -> Optional[str]:
+
+        return self.candidate_id if self.candidate_id is not None else self.public_identifier
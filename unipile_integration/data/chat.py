@@ -1,16 +1,37 @@
 from datetime import datetime
+from typing import Optional
 
+from .record import Record, parse_timestamp, set_field
+
+
+class ChatItem(Record):
+
+    __slots__ = ("chat_id", "attendee_provider_id", "_timestamp_raw", "_timestamp", "folder", "provider_id")
 
-class ChatItem:
     chat_id: str
     attendee_provider_id: str
-    timestamp: datetime
     folder: list
     provider_id: str
 
-    def __init__(self, **kwargs):
-        self.chat_id = kwargs.get("id")
-        self.attendee_provider_id = kwargs.get("attendee_provider_id")
-        self.timestamp = datetime.strptime(kwargs.get('timestamp').split('.')[0], "%Y-%m-%dT%H:%M:%S")
-        self.folder = kwargs.get("folder", [])
-        self.provider_id = kwargs.get("provider_id")
+    def _load(self, data: dict) -> None:
+
+        set_field(self, "chat_id", data.get("id"))
+        set_field(self, "attendee_provider_id", data.get("attendee_provider_id"))
+        set_field(self, "_timestamp_raw", data.get("timestamp"))
+        set_field(self, "_timestamp", None)
+        set_field(self, "folder", data.get("folder", []))
+        set_field(self, "provider_id", data.get("provider_id"))
+
+    @property
+    def raw_timestamp(self) -> Optional[str]:
+
+        return self._timestamp_raw
+
+    @property
+    def timestamp(self) -> datetime:
+
+        value = self._timestamp
+        if value is None and self._timestamp_raw is not None:
+            value = parse_timestamp(self._timestamp_raw)
+            set_field(self, "_timestamp", value)
+        return value
@@ -1,9 +1,18 @@
-class ConnectionCheck:
+from typing import Optional
+
+from .record import Record, set_field
+
+
+class ConnectionCheck(Record):
+
+    __slots__ = ("username", "has_accepted", "error")
 
     username: str
     has_accepted: bool
+    error: Optional[str]
 
-    def __init__(self, **kwargs):
+    def _load(self, data: dict) -> None:
 
-        self.username = kwargs.get("username")
-        self.has_accepted = kwargs.get("has_accepted")
+        set_field(self, "username", data.get("username"))
+        set_field(self, "has_accepted", data.get("has_accepted"))
+        set_field(self, "error", data.get("error"))
@@ -0,0 +1,31 @@
+from typing import Dict, List
+
+from .record import Record, set_field
+
+
+class ExportResult(Record):
+
+    __slots__ = ("account_id", "chats", "messages", "skipped", "failed", "files", "elapsed")
+
+    account_id: str
+    chats: int
+    messages: int
+    skipped: int
+    failed: Dict[str, str]
+    files: List[str]
+    elapsed: float
+
+    def _load(self, data: dict) -> None:
+
+        set_field(self, "account_id", data.get("account_id"))
+        set_field(self, "chats", data.get("chats", 0))
+        set_field(self, "messages", data.get("messages", 0))
+        set_field(self, "skipped", data.get("skipped", 0))
+        set_field(self, "failed", data.get("failed", {}))
+        set_field(self, "files", data.get("files", []))
+        set_field(self, "elapsed", data.get("elapsed"))
+
+    @property
+    def succeeded(self) -> bool:
+
+        return len(self.failed) == 0
@@ -1,7 +1,12 @@
 from typing import Optional
 
+from .record import Record, set_field
 
-class IntegrationAccountData:
+
+class IntegrationAccountData(Record):
+
+    __slots__ = ("account_id", "full_name", "first_name", "last_name", "linkedin_username", "avatar_pic",
+                 "owner_id", "is_recruiter", "is_sales_navigator", "contract_id", "seats_id", "private_premium_id")
 
     account_id: str
     full_name: str
@@ -16,18 +21,20 @@ class IntegrationAccountData:
     seats_id: Optional[str]
     private_premium_id: Optional[str]
 
-    def __init__(self, **kwargs):
+    def _load(self, data: dict) -> None:
 
-        self.account_id = kwargs.get("provider_id")
-        self.first_name = kwargs.get("first_name")
-        self.last_name = kwargs.get("last_name")
-        self.full_name = f"{self.first_name} {self.last_name}"
-        self.linkedin_username = kwargs.get("public_identifier")
-        self.avatar_pic = kwargs.get("profile_picture_url")
-        self.owner_id = kwargs.get("owner_id")
-        sales_navigator = kwargs.get("sales_navigator") if kwargs.get("sales_navigator") is not None else {}
-        recruiter = kwargs.get("recruiter") if kwargs.get("recruiter") is not None else {}
-        self.is_recruiter, self.is_sales_navigator = len(recruiter) > 0, len(sales_navigator) > 0
+        set_field(self, "account_id", data.get("provider_id"))
+        set_field(self, "first_name", data.get("first_name"))
+        set_field(self, "last_name", data.get("last_name"))
+        set_field(self, "full_name", f"{self.first_name} {self.last_name}")
+        set_field(self, "linkedin_username", data.get("public_identifier"))
+        set_field(self, "avatar_pic", data.get("profile_picture_url"))
+        set_field(self, "owner_id", data.get("owner_id"))
+        sales_navigator = data.get("sales_navigator") if data.get("sales_navigator") is not None else {}
+        recruiter = data.get("recruiter") if data.get("recruiter") is not None else {}
+        set_field(self, "is_recruiter", len(recruiter) > 0)
+        set_field(self, "is_sales_navigator", len(sales_navigator) > 0)
         final_premium_data = recruiter if len(recruiter) else (sales_navigator if len(sales_navigator) else {})
-        self.contract_id, self.seats_id = final_premium_data.get("contract_id"), final_premium_data.get("owner_seat_id")
-        self.private_premium_id = None
+        set_field(self, "contract_id", final_premium_data.get("contract_id"))
+        set_field(self, "seats_id", final_premium_data.get("owner_seat_id"))
+        set_field(self, "private_premium_id", None)
@@ -0,0 +1,27 @@
+from typing import Optional
+
+from .record import Record, set_field
+
+
+class InvitationResult(Record):
+
+    ALREADY_CONNECTED = "already_connected"
+    INVITED = "invited"
+    DEFERRED = "quota_deferred"
+    FAILED = "failed"
+
+    __slots__ = ("username", "author_id", "linkedin_id", "status", "error")
+
+    username: str
+    author_id: str
+    linkedin_id: Optional[str]
+    status: str
+    error: Optional[str]
+
+    def _load(self, data: dict) -> None:
+
+        set_field(self, "username", data.get("username"))
+        set_field(self, "author_id", data.get("author_id"))
+        set_field(self, "linkedin_id", data.get("linkedin_id"))
+        set_field(self, "status", data.get("status", self.FAILED))
+        set_field(self, "error", data.get("error"))
@@ -0,0 +1,27 @@
+from typing import Optional
+
+from .record import Record, set_field
+
+
+class JobPostResult(Record):
+
+    __slots__ = ("job_post_id", "job_post", "skills", "error", "cached")
+
+    job_post_id: str
+    job_post: Optional[dict]
+    skills: Optional[list]
+    error: Optional[str]
+    cached: bool
+
+    def _load(self, data: dict) -> None:
+
+        set_field(self, "job_post_id", data.get("job_post_id"))
+        set_field(self, "job_post", data.get("job_post"))
+        set_field(self, "skills", data.get("skills"))
+        set_field(self, "error", data.get("error"))
+        set_field(self, "cached", data.get("cached", False))
+
+    @property
+    def succeeded(self) -> bool:
+
+        return self.error is None
@@ -1,10 +1,16 @@
 from datetime import datetime
+from typing import Optional
 
+from .record import Record, parse_timestamp, set_field
+
+
+class MessageChat(Record):
+
+    __slots__ = ("id", "attachments", "_timestamp_raw", "_timestamp", "sender_id", "chat_id", "chat_provider_id",
+                 "message_text", "seen", "deleted", "delivered", "edited", "hidden")
 
-class MessageChat:
     id: str
     attachments: list
-    timestamp: datetime
     sender_id: str
     chat_id: str
     chat_provider_id: str
@@ -15,16 +21,32 @@ class MessageChat:
     edited: bool
     hidden: bool
 
-    def __init__(self, **kwargs):
-        self.id = kwargs.get("id")
-        self.attachments = kwargs.get("attachments")
-        self.timestamp = datetime.strptime(kwargs.get('timestamp').split('.')[0], "%Y-%m-%dT%H:%M:%S")
-        self.chat_id = kwargs.get("chat_id")
-        self.chat_provider_id = kwargs.get("chat_provider_id")
-        self.sender_id = kwargs.get("sender_id")
-        self.message_text = kwargs.get("text")
-        self.seen = kwargs.get("seen") == 1
-        self.deleted = kwargs.get("deleted") == 1
-        self.delivered = kwargs.get("delivered") == 1
-        self.edited = kwargs.get("edited") == 1
-        self.hidden = kwargs.get("hidden") == 1
+    def _load(self, data: dict) -> None:
+
+        set_field(self, "id", data.get("id"))
+        set_field(self, "attachments", data.get("attachments"))
+        set_field(self, "_timestamp_raw", data.get("timestamp"))
+        set_field(self, "_timestamp", None)
+        set_field(self, "chat_id", data.get("chat_id"))
+        set_field(self, "chat_provider_id", data.get("chat_provider_id"))
+        set_field(self, "sender_id", data.get("sender_id"))
+        set_field(self, "message_text", data.get("text"))
+        set_field(self, "seen", data.get("seen") == 1)
+        set_field(self, "deleted", data.get("deleted") == 1)
+        set_field(self, "delivered", data.get("delivered") == 1)
+        set_field(self, "edited", data.get("edited") == 1)
+        set_field(self, "hidden", data.get("hidden") == 1)
+
+    @property
+    def raw_timestamp(self) -> Optional[str]:
+
+        return self._timestamp_raw
+
+    @property
+    def timestamp(self) -> datetime:
+
+        value = self._timestamp
+        if value is None and self._timestamp_raw is not None:
+            value = parse_timestamp(self._timestamp_raw)
+            set_field(self, "_timestamp", value)
+        return value
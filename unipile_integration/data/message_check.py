@@ -1,15 +1,22 @@
 from typing import Optional
 
+from .record import Record, set_field
 
-class MessageCheck:
+
+class MessageCheck(Record):
+
+    __slots__ = ("username", "message_text", "reply_text", "chat_id", "error")
 
     username: str
     message_text: str
     reply_text: Optional[str]
     chat_id: Optional[str]
+    error: Optional[str]
+
+    def _load(self, data: dict) -> None:
 
-    def __init__(self, **kwargs):
-        self.username = kwargs.get("username")
-        self.message_text = kwargs.get("message_text")
-        self.reply_text = kwargs.get("reply_text")
-        self.chat_id = kwargs.get("chat_id")
+        set_field(self, "username", data.get("username"))
+        set_field(self, "message_text", data.get("message_text"))
+        set_field(self, "reply_text", data.get("reply_text"))
+        set_field(self, "chat_id", data.get("chat_id"))
+        set_field(self, "error", data.get("error"))
@@ -1,13 +1,29 @@
 from typing import Optional
 
+from .record import Record, set_field
 
-class MessageData:
+
+class MessageData(Record):
+
+    SENT = "sent"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+    DEFERRED = "deferred"
+
+    __slots__ = ("chat_id", "author_id", "linkedin_id", "username", "status", "error")
 
     chat_id: Optional[str]
     author_id: str
     linkedin_id: str
+    username: Optional[str]
+    status: str
+    error: Optional[str]
+
+    def _load(self, data: dict) -> None:
 
-    def __init__(self, **kwargs):
-        self.chat_id = kwargs.get("chat_id")
-        self.author_id = kwargs.get("author_id")
-        self.linkedin_id = kwargs.get("linkedin_id")
+        set_field(self, "chat_id", data.get("chat_id"))
+        set_field(self, "author_id", data.get("author_id"))
+        set_field(self, "linkedin_id", data.get("linkedin_id"))
+        set_field(self, "username", data.get("username"))
+        set_field(self, "status", data.get("status", self.SENT if self.chat_id is not None else self.FAILED))
+        set_field(self, "error", data.get("error"))
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from .integration_data import IntegrationAccountData
+from .record import Record, set_field
+
+
+class OnboardingResult(Record):
+
+    __slots__ = ("index", "account", "error", "elapsed")
+
+    index: int
+    account: Optional[IntegrationAccountData]
+    error: Optional[str]
+    elapsed: float
+
+    def _load(self, data: dict) -> None:
+
+        set_field(self, "index", data.get("index"))
+        set_field(self, "account", data.get("account"))
+        set_field(self, "error", data.get("error"))
+        set_field(self, "elapsed", data.get("elapsed", 0))
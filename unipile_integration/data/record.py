@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+from typing import Optional, Iterable, List, Tuple
+
+# records are frozen, _load fills their slots through object.__setattr__
+set_field = object.__setattr__
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+
+    if value is None:
+        return None
+    parsed = datetime.fromisoformat(value.split(".", 1)[0].rstrip("Z"))
+    # timestamps stay naive UTC, as they were before records were introduced
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class Record:
+
+    __slots__ = ()
+
+    def __init__(self, **kwargs):
+
+        self._load(kwargs)
+
+    def _load(self, data: dict) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict]) -> list:
+
+        new = cls.__new__
+        records = []
+        for item in items:
+            record = new(cls)
+            record._load(item)
+            records.append(record)
+        return records
+
+    @classmethod
+    def _all_slots(cls) -> Tuple[str, ...]:
+
+        slots = []
+        for klass in reversed(cls.__mro__):
+            slots.extend(getattr(klass, "__slots__", ()))
+        return tuple(slots)
+
+    def replace(self, **changes) -> "Record":
+
+        record = type(self).__new__(type(self))
+        record.__setstate__({**self.__getstate__(), **changes})
+        return record
+
+    def __getstate__(self) -> dict:
+
+        return {name: getattr(self, name) for name in self._all_slots() if hasattr(self, name)}
+
+    def __setstate__(self, state: dict) -> None:
+
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value) -> None:
+
+        raise AttributeError(f"{type(self).__name__} is immutable, use replace() to build a modified copy")
+
+    def __delattr__(self, name: str) -> None:
+
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+
+        fields: List[str] = [f"{name}={value!r}" for name, value in self.__getstate__().items()
+                             if not name.startswith("_")]
+        return f"{type(self).__name__}({', '.join(fields)})"
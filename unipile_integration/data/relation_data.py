@@ -1,7 +1,9 @@
-from datetime import datetime
+from .record import Record, set_field
 
 
-class RelationData:
+class RelationData(Record):
+
+    __slots__ = ("created_at", "first_name", "last_name", "member_id", "public_identifier", "headline")
 
     created_at: int
     first_name: str
@@ -10,9 +12,11 @@ class RelationData:
     public_identifier: str
     headline: str
 
-    def __init__(self, **kwargs):
+    def _load(self, data: dict) -> None:
 
-        (self.created_at, self.first_name, self.last_name,
-         self.member_id, self.public_identifier, self.headline) = (kwargs.get("created_at"), kwargs.get("first_name"),
-                                                    kwargs.get("last_name"), kwargs.get("member_id"),
-                                                    kwargs.get("public_identifier"), kwargs.get("headline"))
+        set_field(self, "created_at", data.get("created_at"))
+        set_field(self, "first_name", data.get("first_name"))
+        set_field(self, "last_name", data.get("last_name"))
+        set_field(self, "member_id", data.get("member_id"))
+        set_field(self, "public_identifier", data.get("public_identifier"))
+        set_field(self, "headline", data.get("headline"))
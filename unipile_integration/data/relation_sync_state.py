@@ -0,0 +1,23 @@
+from typing import Optional, Tuple
+
+from .record import Record, set_field
+
+
+class RelationSyncState(Record):
+
+    __slots__ = ("account_id", "created_at", "member_id", "member_ids")
+
+    account_id: str
+    created_at: Optional[int]
+    member_id: Optional[str]
+    # every relation at created_at, relations sharing the mark's timestamp are not reported twice
+    member_ids: Tuple[str, ...]
+
+    def _load(self, data: dict) -> None:
+
+        set_field(self, "account_id", data.get("account_id"))
+        set_field(self, "created_at", data.get("created_at"))
+        set_field(self, "member_id", data.get("member_id"))
+        member_ids = data.get("member_ids")
+        set_field(self, "member_ids", tuple(member_ids) if member_ids is not None else
+                  (self.member_id,) if self.member_id is not None else ())
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from .message_chat import MessageChat
+from .record import Record, set_field
+from .relation_data import RelationData
+
+
+class WebhookEvent(Record):
+
+    __slots__ = ("event", "account_id", "message", "relation", "status", "payload")
+
+    event: str
+    account_id: Optional[str]
+    message: Optional[MessageChat]
+    relation: Optional[RelationData]
+    status: Optional[str]
+    payload: dict
+
+    def _load(self, data: dict) -> None:
+
+        set_field(self, "event", data.get("event"))
+        set_field(self, "account_id", data.get("account_id"))
+        set_field(self, "message", data.get("message"))
+        set_field(self, "relation", data.get("relation"))
+        set_field(self, "status", data.get("status"))
+        set_field(self, "payload", data.get("payload", {}))
@@ -0,0 +1,31 @@
+from typing import Optional, Any
+
+from .record import Record, set_field
+
+
+class WorkResult(Record):
+
+    DONE = "done"
+    FAILED = "failed"
+    DEFERRED = "deferred"
+    CANCELLED = "cancelled"
+
+    __slots__ = ("owner_id", "action", "status", "value", "error", "waited", "elapsed")
+
+    owner_id: str
+    action: Optional[str]
+    status: str
+    value: Any
+    error: Optional[str]
+    waited: float
+    elapsed: float
+
+    def _load(self, data: dict) -> None:
+
+        set_field(self, "owner_id", data.get("owner_id"))
+        set_field(self, "action", data.get("action"))
+        set_field(self, "status", data.get("status", self.DONE))
+        set_field(self, "value", data.get("value"))
+        set_field(self, "error", data.get("error"))
+        set_field(self, "waited", data.get("waited", 0))
+        set_field(self, "elapsed", data.get("elapsed", 0))
@@ -0,0 +1,113 @@
+# IMPORTING STANDARD PACKAGES
+import json
+import re
+
+from typing import Iterator, Optional, Union, Tuple
+
+# IMPORTING THIRD PARTY PACKAGES
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON = "json"
+STREAM = "stream"
+ORJSON = "orjson"
+AUTO = "auto"
+DECODERS = (JSON, STREAM, ORJSON, AUTO)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_WHITESPACE_CHARACTERS = frozenset(" \t\n\r")
+_SCAN = json.JSONDecoder().scan_once
+
+
+def resolve_decoder(decoder: Optional[str]) -> str:
+
+    if decoder is None:
+        return JSON
+    if decoder not in DECODERS:
+        raise ValueError(f"unknown JSON decoder {decoder!r}, expected one of {', '.join(DECODERS)}")
+    if decoder == AUTO:
+        return ORJSON if orjson is not None else STREAM
+    if decoder == ORJSON and orjson is None:
+        raise ImportError("the orjson decoder requires orjson, install it with `pip install unipile_integration[fast]`")
+    return decoder
+
+
+def _skip(text: str, index: int) -> int:
+
+    if text[index:index + 1] in _WHITESPACE_CHARACTERS:
+        return _WHITESPACE.match(text, index).end()
+    return index
+
+
+def _scan(text: str, index: int) -> Tuple[object, int]:
+
+    try:
+        return _SCAN(text, index)
+    except StopIteration as e:
+        raise json.JSONDecodeError("Expecting value", text, e.value) from None
+
+
+def _expect(text: str, index: int, characters: str) -> str:
+
+    character = text[index:index + 1]
+    if character == "" or character not in characters:
+        raise json.JSONDecodeError(f"Expecting one of {characters!r}", text, index)
+    return character
+
+
+def iter_stream_items(text: str, meta: dict, key: str = "items") -> Iterator[dict]:
+
+    # the body is already a full str, only the elements of `key` are built one at a time by walking the
+    # top level object with the C scanner, the remaining top level values (cursor, ...) are collected into meta
+    index = _skip(text, 0)
+    _expect(text, index, "{")
+    index = _skip(text, index + 1)
+    if text.startswith("}", index):
+        return
+    while True:
+        name, index = _scan(text, index)
+        index = _skip(text, index)
+        _expect(text, index, ":")
+        index = _skip(text, index + 1)
+        if name == key and text.startswith("[", index):
+            index = _skip(text, index + 1)
+            if text.startswith("]", index):
+                index += 1
+            else:
+                scan, whitespace = _SCAN, _WHITESPACE_CHARACTERS
+                while True:
+                    try:
+                        item, index = scan(text, index)
+                    except StopIteration as e:
+                        raise json.JSONDecodeError("Expecting value", text, e.value) from None
+                    yield item
+                    # compact bodies put the separator right after the item, skip the regex in that case
+                    separator = text[index:index + 1]
+                    if separator in whitespace:
+                        index = _skip(text, index)
+                        separator = _expect(text, index, ",]")
+                    elif separator != "," and separator != "]":
+                        _expect(text, index, ",]")
+                    index = _skip(text, index + 1)
+                    if separator == "]":
+                        break
+        else:
+            meta[name], index = _scan(text, index)
+        index = _skip(text, index)
+        if _expect(text, index, ",}") == "}":
+            return
+        index = _skip(text, index + 1)
+
+
+def iter_page_items(content: Union[bytes, str], meta: dict, decoder: str = JSON,
+                    key: str = "items") -> Iterator[dict]:
+
+    if decoder == STREAM:
+        text = content.decode("utf-8") if isinstance(content, bytes) else content
+        return iter_stream_items(text, meta, key=key)
+    data = orjson.loads(content) if decoder == ORJSON else json.loads(content)
+    items = data.pop(key, None)
+    meta.update(data)
+    return iter(items if items is not None else [])
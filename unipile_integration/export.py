@@ -0,0 +1,348 @@
+# IMPORTING STANDARD PACKAGES
+import json
+import os
+import sqlite3
+
+from itertools import count
+from threading import Lock
+from typing import Optional, Iterable, List, Dict, Set, Tuple, Union
+from uuid import uuid4
+
+# IMPORTING THIRD PARTY PACKAGES
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.concurrency import describe_error
+from unipile_integration.data import ChatItem, MessageChat, ExportResult
+
+PARQUET = "parquet"
+NDJSON = "ndjson"
+AUTO = "auto"
+FORMATS = (PARQUET, NDJSON, AUTO)
+
+MESSAGE_COLUMNS = ("account_id", "chat_id", "chat_provider_id", "attendee_provider_id", "message_id", "sender_id",
+                   "text", "timestamp", "seen", "deleted", "delivered", "edited", "hidden", "attachments")
+UNKNOWN_DATE = "unknown"
+TEMPORARY_SUFFIX = ".tmp"
+
+
+def resolve_format(export_format: Optional[str]) -> str:
+
+    export_format = AUTO if export_format is None else export_format
+    if export_format not in FORMATS:
+        raise ValueError(f"unknown export format {export_format!r}, expected one of {', '.join(FORMATS)}")
+    if export_format == AUTO:
+        return PARQUET if pyarrow is not None else NDJSON
+    if export_format == PARQUET and pyarrow is None:
+        raise ImportError(
+            "the parquet format requires pyarrow, install it with `pip install unipile_integration[export]`"
+        )
+    return export_format
+
+
+def message_date(message: MessageChat) -> str:
+
+    raw_timestamp = message.raw_timestamp
+    return raw_timestamp[:10] if raw_timestamp is not None and len(raw_timestamp) >= 10 else UNKNOWN_DATE
+
+
+class MessageColumns:
+    account_id: str
+    chat: ChatItem
+    partitions: Dict[str, Dict[str, list]]
+    rows: int
+
+    def __init__(self, account_id: str, chat: ChatItem):
+
+        self.account_id = account_id
+        self.chat = chat
+        self.partitions = {}
+        self.rows = 0
+
+    def add(self, message: MessageChat) -> None:
+
+        # messages go straight into per date column lists, the record is dropped right after
+        date = message_date(message)
+        columns = self.partitions.get(date)
+        if columns is None:
+            columns = self.partitions[date] = {column: [] for column in MESSAGE_COLUMNS}
+        columns["account_id"].append(self.account_id)
+        columns["chat_id"].append(self.chat.chat_id)
+        columns["chat_provider_id"].append(self.chat.provider_id)
+        columns["attendee_provider_id"].append(self.chat.attendee_provider_id)
+        columns["message_id"].append(message.id)
+        columns["sender_id"].append(message.sender_id)
+        columns["text"].append(message.message_text)
+        columns["timestamp"].append(message.raw_timestamp)
+        columns["seen"].append(message.seen)
+        columns["deleted"].append(message.deleted)
+        columns["delivered"].append(message.delivered)
+        columns["edited"].append(message.edited)
+        columns["hidden"].append(message.hidden)
+        columns["attachments"].append(json.dumps(message.attachments) if message.attachments else None)
+        self.rows += 1
+
+    def extend(self, messages: Iterable[MessageChat]) -> "MessageColumns":
+
+        for message in messages:
+            self.add(message)
+        return self
+
+
+class ChatExportWriter:
+    directory: str
+    export_format: str
+    chunk_size: int
+    max_buffered_rows: int
+    files: List[str]
+    rows: int
+    _buffers: Dict[Tuple[str, str], Dict[str, list]]
+    _buffered: int
+    _pending: List[Tuple[str, str]]
+    _run_id: str
+    _sequence: count
+
+    def __init__(self, directory: str, export_format: str = AUTO, chunk_size: int = 50000,
+                 max_buffered_rows: int = 200000):
+
+        self.directory = directory
+        self.export_format = resolve_format(export_format)
+        self.chunk_size = chunk_size
+        self.max_buffered_rows = max_buffered_rows
+        self.files = []
+        self.rows = 0
+        self._buffers = {}
+        self._buffered = 0
+        self._pending = []
+        # every run writes its own part names so a resumed export never overwrites committed files
+        self._run_id = uuid4().hex[:8]
+        self._sequence = count()
+
+    @property
+    def extension(self) -> str:
+
+        return "parquet" if self.export_format == PARQUET else "ndjson"
+
+    def partition_path(self, account_id: str, date: str) -> str:
+
+        return os.path.join(self.directory, f"account_id={account_id}", f"date={date}")
+
+    def discard_uncommitted(self, account_id: str) -> int:
+
+        # leftovers of an interrupted run, their chats are not in the checkpoint and get exported again
+        removed = 0
+        for root, _, names in os.walk(os.path.join(self.directory, f"account_id={account_id}")):
+            for name in names:
+                if name.endswith(TEMPORARY_SUFFIX):
+                    os.remove(os.path.join(root, name))
+                    removed += 1
+        return removed
+
+    def add(self, columns: MessageColumns) -> None:
+
+        for date, partition in columns.partitions.items():
+            key = (columns.account_id, date)
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = self._buffers[key] = partition
+            else:
+                for column in MESSAGE_COLUMNS:
+                    buffer[column].extend(partition[column])
+            self._buffered += len(partition["message_id"])
+            if len(buffer["message_id"]) >= self.chunk_size:
+                self._flush(key)
+        if self._buffered >= self.max_buffered_rows:
+            for key in list(self._buffers):
+                self._flush(key)
+
+    def _write(self, path: str, columns: Dict[str, list]) -> None:
+
+        if self.export_format == PARQUET:
+            pyarrow.parquet.write_table(pyarrow.table(columns), path, compression="zstd")
+            return
+        with open(path, "w", encoding="utf-8") as file:
+            for row in zip(*(columns[column] for column in MESSAGE_COLUMNS)):
+                file.write(json.dumps(dict(zip(MESSAGE_COLUMNS, row)), ensure_ascii=False))
+                file.write("\n")
+
+    def _flush(self, key: Tuple[str, str]) -> None:
+
+        columns = self._buffers.pop(key)
+        rows = len(columns["message_id"])
+        self._buffered -= rows
+        if rows == 0:
+            return
+        directory = self.partition_path(*key)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"part-{self._run_id}-{next(self._sequence):05d}.{self.extension}")
+        # chunks stay temporary until commit so an interruption never leaves rows of unfinished batches behind
+        self._write(path + TEMPORARY_SUFFIX, columns)
+        self._pending.append((path + TEMPORARY_SUFFIX, path))
+        self.rows += rows
+
+    def commit(self) -> List[str]:
+
+        for key in list(self._buffers):
+            self._flush(key)
+        files = []
+        for temporary_path, path in self._pending:
+            os.replace(temporary_path, path)
+            files.append(path)
+        self._pending = []
+        self.files.extend(files)
+        return files
+
+
+class ExportCheckpointStore:
+
+    def completed_chats(self, account_id: str) -> Set[str]:
+        raise NotImplementedError
+
+    def mark_completed(self, account_id: str, chat_ids: Iterable[str]) -> None:
+        raise NotImplementedError
+
+
+class InMemoryExportCheckpointStore(ExportCheckpointStore):
+    _completed: Dict[str, Set[str]]
+
+    def __init__(self):
+
+        self._completed = {}
+
+    def completed_chats(self, account_id: str) -> Set[str]:
+
+        return set(self._completed.get(account_id, ()))
+
+    def mark_completed(self, account_id: str, chat_ids: Iterable[str]) -> None:
+
+        self._completed.setdefault(account_id, set()).update(chat_ids)
+
+
+class SQLiteExportCheckpointStore(ExportCheckpointStore):
+    _connection: sqlite3.Connection
+    _lock: Lock
+
+    def __init__(self, path: str):
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS export_checkpoint ("
+                "account_id TEXT NOT NULL, chat_id TEXT NOT NULL, PRIMARY KEY (account_id, chat_id))"
+            )
+
+    def completed_chats(self, account_id: str) -> Set[str]:
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT chat_id FROM export_checkpoint WHERE account_id = ?", (account_id,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark_completed(self, account_id: str, chat_ids: Iterable[str]) -> None:
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO export_checkpoint (account_id, chat_id) VALUES (?, ?)",
+                [(account_id, chat_id) for chat_id in chat_ids]
+            )
+
+    def close(self) -> None:
+
+        self._connection.close()
+
+
+class ChatExport:
+    account_id: str
+    writer: ChatExportWriter
+    checkpoint: Optional[ExportCheckpointStore]
+    commit_every: int
+    chats: int
+    messages: int
+    skipped: int
+    failed: Dict[str, str]
+    files: List[str]
+    pending: List[ChatItem]
+    _completed: Set[str]
+    _uncommitted: List[str]
+
+    def __init__(self, account_id: str, writer: ChatExportWriter, checkpoint: ExportCheckpointStore = None,
+                 commit_every: int = 100):
+
+        self.account_id = account_id
+        self.writer = writer
+        self.checkpoint = checkpoint
+        self.commit_every = commit_every
+        self.chats = 0
+        self.messages = 0
+        self.skipped = 0
+        self.failed = {}
+        self.files = []
+        self.pending = []
+        self._completed = checkpoint.completed_chats(account_id) if checkpoint is not None else set()
+        self._uncommitted = []
+        if checkpoint is not None:
+            writer.discard_uncommitted(account_id)
+
+    def should_export(self, chat: ChatItem) -> bool:
+
+        if chat.chat_id in self._completed:
+            self.skipped += 1
+            return False
+        return True
+
+    def select(self, chat: ChatItem) -> None:
+
+        if self.should_export(chat):
+            self.pending.append(chat)
+
+    def add(self, columns: MessageColumns) -> None:
+
+        self.writer.add(columns)
+        self.chats += 1
+        self.messages += columns.rows
+        self._uncommitted.append(columns.chat.chat_id)
+        if len(self._uncommitted) >= self.commit_every:
+            self.commit()
+
+    def fail(self, chat: ChatItem, error: str) -> None:
+
+        self.failed[chat.chat_id] = error
+
+    @staticmethod
+    def on_error(chat: ChatItem, error: BaseException) -> Tuple[ChatItem, str]:
+
+        return chat, describe_error(error)
+
+    def handle(self, result: Union[MessageColumns, Tuple[ChatItem, str]]) -> None:
+
+        # pipeline results are either the columns of an exported chat or the (chat, error) of on_error
+        if isinstance(result, MessageColumns):
+            self.add(result)
+        else:
+            self.fail(*result)
+
+    def commit(self) -> None:
+
+        self.files.extend(self.writer.commit())
+        if self.checkpoint is not None and len(self._uncommitted) > 0:
+            self.checkpoint.mark_completed(self.account_id, self._uncommitted)
+        self._completed.update(self._uncommitted)
+        self._uncommitted = []
+
+    def result(self, elapsed: float) -> ExportResult:
+
+        return ExportResult(**{
+            "account_id": self.account_id,
+            "chats": self.chats,
+            "messages": self.messages,
+            "skipped": self.skipped,
+            "failed": dict(self.failed),
+            "files": list(self.files),
+            "elapsed": elapsed
+        })
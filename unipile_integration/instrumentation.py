@@ -0,0 +1,248 @@
+# IMPORTING STANDARD PACKAGES
+from bisect import bisect_left
+from collections import defaultdict
+from threading import Lock
+from time import perf_counter
+from typing import Optional, Dict, List, Tuple, Iterable
+
+STATIC_SEGMENTS = frozenset({
+    "accounts", "users", "me", "relations", "invite", "chats", "messages", "chat_attendees", "linkedin",
+    "search", "attendees", "webhooks", "hosted", "checkpoint", "reconnect", "restart", "posts", "comments",
+    "invitations", "sent", "received", "profile", "company", "jobs"
+})
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+def endpoint_template(path: str) -> str:
+
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    return "/".join(segment if segment in STATIC_SEGMENTS else "{id}" for segment in segments if segment != "")
+
+
+class RequestContext:
+
+    __slots__ = ("method", "path", "endpoint", "account_id", "attempt", "started_at", "elapsed", "status_code",
+                 "bytes_sent", "bytes_received", "error")
+
+    def __init__(self, method: str, path: str, account_id: Optional[str] = None, attempt: int = 0):
+
+        self.method = method
+        self.path = path
+        self.endpoint = endpoint_template(path)
+        self.account_id = account_id
+        self.attempt = attempt
+        self.started_at = perf_counter()
+        self.elapsed = None
+        self.status_code = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.error = None
+
+    def finish(self, status_code: Optional[int] = None, bytes_sent: int = 0, bytes_received: int = 0,
+               error: Optional[str] = None) -> "RequestContext":
+
+        self.elapsed = perf_counter() - self.started_at
+        self.status_code = status_code
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.error = error
+        return self
+
+
+class Instrumentation:
+
+    enabled: bool = False
+
+    def before_request(self, context: RequestContext) -> None:
+        pass
+
+    def after_request(self, context: RequestContext) -> None:
+        pass
+
+    def on_retry(self, context: RequestContext, delay: float) -> None:
+        pass
+
+    def on_pagination(self, endpoint: str, pages: int, items: int) -> None:
+        pass
+
+    def on_fallback(self, operation: str, account_id: Optional[str], error: BaseException) -> None:
+        pass
+
+
+NOOP_INSTRUMENTATION = Instrumentation()
+
+
+class CompositeInstrumentation(Instrumentation):
+    _children: List[Instrumentation]
+
+    def __init__(self, children: Iterable[Instrumentation]):
+
+        self._children = [child for child in children if child.enabled]
+        self.enabled = len(self._children) > 0
+
+    def before_request(self, context: RequestContext) -> None:
+
+        for child in self._children:
+            child.before_request(context)
+
+    def after_request(self, context: RequestContext) -> None:
+
+        for child in self._children:
+            child.after_request(context)
+
+    def on_retry(self, context: RequestContext, delay: float) -> None:
+
+        for child in self._children:
+            child.on_retry(context, delay)
+
+    def on_pagination(self, endpoint: str, pages: int, items: int) -> None:
+
+        for child in self._children:
+            child.on_pagination(endpoint, pages, items)
+
+    def on_fallback(self, operation: str, account_id: Optional[str], error: BaseException) -> None:
+
+        for child in self._children:
+            child.on_fallback(operation, account_id, error)
+
+
+class LatencyHistogram:
+    buckets: Tuple[float, ...]
+    counts: List[int]
+    count: int
+    total: float
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0
+
+    def observe(self, value: float) -> None:
+
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> Optional[float]:
+
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else float("inf")
+        return float("inf")
+
+    def to_dict(self) -> dict:
+
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "buckets": dict(zip([str(bucket) for bucket in self.buckets] + ["+Inf"], self.counts)),
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99)
+        }
+
+
+class MetricsRecorder(Instrumentation):
+
+    enabled = True
+
+    _buckets: Tuple[float, ...]
+    _lock: Lock
+    latency: Dict[Tuple[str, str], LatencyHistogram]
+    status_codes: Dict[Tuple[str, str, Optional[int]], int]
+    errors: Dict[Tuple[str, str], int]
+    retries: Dict[Tuple[str, str], int]
+    bytes_sent: Dict[Tuple[str, str], int]
+    bytes_received: Dict[Tuple[str, str], int]
+    pagination_runs: Dict[str, int]
+    pagination_pages: Dict[str, int]
+    pagination_items: Dict[str, int]
+    fallbacks: Dict[Tuple[str, str], int]
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+
+        self._buckets = buckets
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+
+        with self._lock:
+            self.latency = {}
+            self.status_codes = defaultdict(int)
+            self.errors = defaultdict(int)
+            self.retries = defaultdict(int)
+            self.bytes_sent = defaultdict(int)
+            self.bytes_received = defaultdict(int)
+            self.pagination_runs = defaultdict(int)
+            self.pagination_pages = defaultdict(int)
+            self.pagination_items = defaultdict(int)
+            self.fallbacks = defaultdict(int)
+
+    def after_request(self, context: RequestContext) -> None:
+
+        key = (context.method, context.endpoint)
+        with self._lock:
+            histogram = self.latency.get(key)
+            if histogram is None:
+                histogram = self.latency[key] = LatencyHistogram(self._buckets)
+            histogram.observe(context.elapsed)
+            self.status_codes[(context.method, context.endpoint, context.status_code)] += 1
+            if context.error is not None:
+                self.errors[key] += 1
+            self.bytes_sent[key] += context.bytes_sent
+            self.bytes_received[key] += context.bytes_received
+
+    def on_retry(self, context: RequestContext, delay: float) -> None:
+
+        with self._lock:
+            self.retries[(context.method, context.endpoint)] += 1
+
+    def on_pagination(self, endpoint: str, pages: int, items: int) -> None:
+
+        with self._lock:
+            self.pagination_runs[endpoint] += 1
+            self.pagination_pages[endpoint] += pages
+            self.pagination_items[endpoint] += items
+
+    def on_fallback(self, operation: str, account_id: Optional[str], error: BaseException) -> None:
+
+        with self._lock:
+            self.fallbacks[(operation, type(error).__name__)] += 1
+
+    def snapshot(self) -> dict:
+
+        with self._lock:
+            endpoints = {}
+            for (method, endpoint), histogram in self.latency.items():
+                endpoints[f"{method.upper()} {endpoint}"] = {
+                    "latency": histogram.to_dict(),
+                    "status_codes": {str(status): count for (m, e, status), count in self.status_codes.items()
+                                     if m == method and e == endpoint},
+                    "errors": self.errors.get((method, endpoint), 0),
+                    "retries": self.retries.get((method, endpoint), 0),
+                    "bytes_sent": self.bytes_sent.get((method, endpoint), 0),
+                    "bytes_received": self.bytes_received.get((method, endpoint), 0)
+                }
+            pagination = {
+                endpoint: {
+                    "runs": runs,
+                    "pages": self.pagination_pages[endpoint],
+                    "items": self.pagination_items[endpoint]
+                } for endpoint, runs in self.pagination_runs.items()
+            }
+            fallbacks = {}
+            for (operation, error), count in self.fallbacks.items():
+                fallbacks.setdefault(operation, {})[error] = count
+        return {
+            "endpoints": endpoints,
+            "pagination": pagination,
+            "fallbacks": fallbacks
+        }
@@ -0,0 +1,81 @@
+# IMPORTING STANDARD PACKAGES
+from typing import Optional, Iterable, List, Dict
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import AccountData, InvitationResult, RelationData
+from unipile_integration.parsing import invitation_result, connected_users
+from unipile_integration.quota import QuotaTracker, INVITATION
+
+
+class InvitationBatch:
+    owner_id: str
+    usernames: List[str]
+    unknown: List[str]
+    _results: Dict[str, InvitationResult]
+
+    def __init__(self, owner_id: str, usernames: Iterable[str], relations: Iterable[RelationData]):
+
+        self.owner_id = owner_id
+        self.usernames = list(dict.fromkeys(usernames))
+        # usernames found in the network are answered without a users/{username} round trip
+        connected = connected_users(relations.values() if isinstance(relations, dict) else relations)
+        self._results = {
+            username: invitation_result(owner_id, username, connected[username], InvitationResult.ALREADY_CONNECTED)
+            for username in self.usernames if username in connected
+        }
+        self.unknown = [username for username in self.usernames if username not in self._results]
+
+    def complete(self, results: Iterable[InvitationResult]) -> List[InvitationResult]:
+
+        self._results.update(zip(self.unknown, results))
+        return [self._results[username] for username in self.usernames]
+
+
+class InvitationAttempt:
+    owner_id: str
+    username: str
+    user_id: Optional[str]
+    _quota: Optional[QuotaTracker]
+    _acquired: bool
+
+    def __init__(self, owner_id: str, username: str, quota: QuotaTracker = None):
+
+        self.owner_id = owner_id
+        self.username = username
+        self.user_id = None
+        self._quota = quota
+        self._acquired = False
+
+    def _release(self) -> None:
+
+        if self._acquired:
+            self._quota.release(self.owner_id, INVITATION)
+            self._acquired = False
+
+    def resolve(self, account_data: Optional[AccountData]) -> Optional[InvitationResult]:
+
+        # a result here is final, None means the invitation should be sent to user_id
+        if account_data is None or account_data.user_id is None:
+            return invitation_result(self.owner_id, self.username, error="profile not found")
+        self.user_id = account_data.user_id
+        if account_data.has_connection:
+            return invitation_result(self.owner_id, self.username, self.user_id, InvitationResult.ALREADY_CONNECTED)
+        if self._quota is not None:
+            self._acquired = self._quota.try_acquire(self.owner_id, INVITATION)
+            if not self._acquired:
+                return invitation_result(self.owner_id, self.username, self.user_id, InvitationResult.DEFERRED,
+                                         error="quota exceeded")
+        return None
+
+    def sent(self, status_code: int) -> InvitationResult:
+
+        if status_code != 201:
+            self._release()
+            return invitation_result(self.owner_id, self.username, self.user_id,
+                                     error=f"unexpected status code {status_code}")
+        return invitation_result(self.owner_id, self.username, self.user_id, InvitationResult.INVITED)
+
+    def failed(self, error: str) -> InvitationResult:
+
+        self._release()
+        return invitation_result(self.owner_id, self.username, self.user_id, error=error)
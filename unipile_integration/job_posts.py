@@ -0,0 +1,45 @@
+# IMPORTING STANDARD PACKAGES
+from typing import Optional, Iterable, List, Dict, Tuple, Any
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.cache import JobPostCache
+from unipile_integration.data import JobPostResult
+from unipile_integration.parsing import JOB_POST, JOB_POST_SKILLS, job_post_result
+
+JobPostCall = Tuple[str, str]
+PartOutcome = Tuple[Any, Optional[str]]
+
+
+class JobPostBatch:
+    job_post_ids: List[str]
+    calls: List[JobPostCall]
+    _include_skills: bool
+    _cache: Optional[JobPostCache]
+    _results: Dict[str, JobPostResult]
+
+    def __init__(self, job_post_ids: Iterable[str], include_skills: bool = True, cache: JobPostCache = None):
+
+        self.job_post_ids = list(dict.fromkeys(job_post_ids))
+        self._include_skills = include_skills
+        self._cache = cache
+        self._results = {}
+        if cache is not None:
+            for job_post_id in self.job_post_ids:
+                cached = cache.get(job_post_id)
+                if cached is not None:
+                    self._results[job_post_id] = cached
+        parts = (JOB_POST, JOB_POST_SKILLS) if include_skills else (JOB_POST,)
+        self.calls = [(job_post_id, part) for job_post_id in self.job_post_ids if job_post_id not in self._results
+                      for part in parts]
+
+    def complete(self, outcomes: Iterable[PartOutcome]) -> List[JobPostResult]:
+
+        fetched = {}
+        for (job_post_id, part), outcome in zip(self.calls, outcomes):
+            fetched.setdefault(job_post_id, {})[part] = outcome
+        for job_post_id, job_post_parts in fetched.items():
+            result = job_post_result(job_post_id, job_post_parts)
+            if result.succeeded and self._include_skills and self._cache is not None:
+                self._cache.set(result)
+            self._results[job_post_id] = result
+        return [self._results[job_post_id] for job_post_id in self.job_post_ids]
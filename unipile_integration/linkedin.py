@@ -1,405 +1,269 @@
 # IMPORTING STANDARD PACKAGES
-from time import sleep
-from datetime import datetime
-from typing import Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Tuple, Dict, Iterable, Iterator, Any
 
 # IMPORTING THIRD PARTY PACKAGES
-import requests
-
 from requests import Response
 
 # IMPORTING LOCAL PACKAGES
-from unipile_integration.data import IntegrationAccountData, MessageData, \
-    AccountData, MessageCheck, ConnectionCheck, ChatItem, MessageChat, RelationData
-
-
-class LinkedinUniPileIntegration:
-    _auth_token: str
-    _base_endpoint_path: str
-
-    def __init__(self, auth_token: str, base_endpoint_path: str):
-
-        self._auth_token = auth_token
-        self._base_endpoint_path = base_endpoint_path
-
-    def _base_call(self, path: str, data: dict, method_name: str = "post", body_type: str = "json") -> Response:
-        if method_name == "post":
-            kwargs = {
-                "json": data
-            } if body_type == "json" else {
-                "data": data
-            }
-            return requests.post(f"{self._base_endpoint_path}/{path}", headers={
-                "X-API-KEY": self._auth_token
-            }, **kwargs)
-        elif method_name == "delete":
-            return requests.delete(
-                f"{self._base_endpoint_path}/{path}", headers={
-                    "X-API-KEY": self._auth_token
-                }
-            )
-        return requests.get(f"{self._base_endpoint_path}/{path}", headers={
-            "X-API-KEY": self._auth_token
-        })
-
-    def _add_linkedin_integration(self, li_at_cookie: str, user_agent: str, li_a_cookie: str = None,
-                                  recruiter_contract_id: str = None) -> Optional[str]:
-
-        payload = {
-            "provider": "LINKEDIN",
-            "access_token": li_at_cookie,
-            "user_agent": user_agent,
-            "premium_token": li_a_cookie,
-            "recruiter_contract_id": recruiter_contract_id
-        }
-        response = self._base_call("accounts", self._parse_payload(payload))
-        if response.status_code == 201:
-            data = response.json()
-            return data.get("account_id")
-
-    def _read_full_items(self, url: str, max_items: int, item_type: type) -> list:
-
-        items = []
-        check = len(items) < max_items
-        while check:
-            response = self._base_call(url, {}, method_name="get")
-            if response.status_code == 200:
-                data = response.json()
-                cursor = data.get("cursor")
-                items.extend([item_type(**item) for item in data.get("items", [])])
-                check = cursor is not None and len(items) < max_items
-            else:
-                break
-        return items
+from unipile_integration.base_linkedin import BaseLinkedinIntegration, Flow, Request, Walk, FanOut, Pipeline, \
+    Poll, step
+from unipile_integration.data import IntegrationAccountData, MessageData, MessageCheck, ConnectionCheck, ChatItem, \
+    MessageChat, RelationData, JobPostResult, OnboardingResult, ExportResult, InvitationResult
+from unipile_integration.cache import ProfileCache, JobPostCache
+from unipile_integration.chat_index import ChatIndex
+from unipile_integration.concurrency import map_bounded
+from unipile_integration.decoding import JSON
+from unipile_integration.export import ChatExportWriter, ExportCheckpointStore
+from unipile_integration.instrumentation import Instrumentation
+from unipile_integration.message_store import MessageStore
+from unipile_integration.pagination import iter_items
+from unipile_integration.parsing import parse_payload
+from unipile_integration.pipeline import iter_pipeline
+from unipile_integration.quota import QuotaTracker
+from unipile_integration.readiness import ReadinessPolicy, AccountReadiness, poll_until
+from unipile_integration.rate_limit import RateLimiter, RetryPolicy
+from unipile_integration.relation_sync import RelationSyncStateStore
+from unipile_integration.response_cache import ResponseCache
+from unipile_integration.transport import HttpTransport
+
+
+class LinkedinUniPileIntegration(BaseLinkedinIntegration):
+    _transport: HttpTransport
+
+    def __init__(self, auth_token: str, base_endpoint_path: str, transport: HttpTransport = None,
+                 pool_size: int = 10, timeout: Optional[float] = 30, max_concurrency: int = 10,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None,
+                 profile_cache: ProfileCache = None, message_store: MessageStore = None,
+                 instrumentation: Instrumentation = None, job_post_cache: JobPostCache = None,
+                 json_decoder: str = JSON, chat_index: ChatIndex = None, response_cache: ResponseCache = None):
+
+        super().__init__(
+            auth_token, base_endpoint_path, transport if transport is not None else HttpTransport(
+                auth_token, base_endpoint_path, pool_size=pool_size, timeout=timeout, rate_limiter=rate_limiter,
+                retry_policy=retry_policy, instrumentation=instrumentation, response_cache=response_cache
+            ), transport is None, max_concurrency=max_concurrency, profile_cache=profile_cache,
+            message_store=message_store, job_post_cache=job_post_cache, json_decoder=json_decoder,
+            chat_index=chat_index
+        )
+
+    def _base_call(self, path: str, data: dict, method_name: str = "post", body_type: str = "json",
+                   timeout: Optional[float] = None) -> Response:
+
+        return self._transport.request(path, data, method_name=method_name, body_type=body_type, timeout=timeout)
+
+    def close(self) -> None:
+
+        if self._owns_transport:
+            self._transport.close()
+
+    def __enter__(self) -> "LinkedinUniPileIntegration":
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+
+        self.close()
+
+    def _fetch(self, url: str) -> Response:
+
+        return self._base_call(url, {}, method_name="get")
+
+    def _iter_items(self, url: str, item_type: type, max_items: Optional[int] = None,
+                    prefetch: bool = False, strict: bool = False) -> Iterator:
+
+        return iter_items(self._fetch, url, item_type, max_items=max_items, prefetch=prefetch,
+                          instrumentation=self._transport.instrumentation, decoder=self._json_decoder,
+                          strict=strict)
+
+    def _run(self, flow: Flow) -> Any:
+
+        done, effect = step(flow)
+        while not done:
+            try:
+                value, error = self._perform(effect), None
+            except Exception as e:
+                value, error = None, e
+            done, effect = step(flow, value, error)
+        return effect
+
+    def _perform(self, effect: Any) -> Any:
+
+        if isinstance(effect, Request):
+            return self._base_call(effect.path, effect.data, method_name=effect.method_name,
+                                   body_type=effect.body_type)
+        if isinstance(effect, Walk):
+            pages = effect.iterate()
+            try:
+                for item in pages:
+                    if effect.add(item) is False:
+                        break
+            finally:
+                pages.close()
+            return None
+        if isinstance(effect, FanOut):
+            return map_bounded(lambda item: self._run(effect.flow(item)), effect.items, effect.max_concurrency)
+        if isinstance(effect, Pipeline):
+            results = self._stream(effect)
+            try:
+                for result in results:
+                    effect.consume(result)
+            finally:
+                results.close()
+            return None
+        if isinstance(effect, Poll):
+            return self._poll(effect)
+        raise TypeError(f"unknown effect {type(effect).__name__}")
+
+    def _stream(self, pipeline: Pipeline) -> Iterator:
+
+        if pipeline.prepare is not None:
+            self._run(pipeline.prepare)
+        stages = [(lambda item, flow=flow: self._run(flow(item)), workers) for flow, workers in pipeline.stages]
+        yield from iter_pipeline(pipeline.items, stages, pipeline.on_error, queue_size=pipeline.queue_size,
+                                 max_pending=pipeline.max_pending)
+
+    def _poll(self, effect: Poll) -> Any:
+
+        account_readiness, owner_id = effect.account_readiness, effect.owner_id
+        check = lambda: self._run(effect.check())
+        if account_readiness is None:
+            return poll_until(check, effect.readiness, failed=effect.failed)
+        return poll_until(check, effect.readiness, wait=lambda delay: account_readiness.wait(owner_id, delay),
+                          failed=effect.failed)
 
     def read_all_chats(self, account_id: str, max_number_of_chats: int = 100) -> List[ChatItem]:
 
-        limit = max_number_of_chats if max_number_of_chats is not None and max_number_of_chats <= 250 else 100
-        url = f"chats?limit={limit}&account_type=LINKEDIN&account_id={account_id}"
-        return self._read_full_items(url, max_number_of_chats, ChatItem)
+        return self._run(self._read_all_chats_flow(account_id, max_number_of_chats))
 
-    def read_full_chat(self, chat_id: str, max_number_of_messages: int = None) -> List[MessageChat]:
+    def refresh_chat_index(self, account_id: str, page_size: int = 100) -> List[ChatItem]:
 
-        limit = max_number_of_messages if max_number_of_messages is not None and max_number_of_messages <= 250 else 100
-        url = f"chats/{chat_id}/messages?limit={limit}"
-        return self._read_full_items(url, max_number_of_messages, MessageChat)
+        return self._run(self._refresh_chat_index_flow(account_id, page_size))
 
-    def _retrieve_current_user_data(self, owner_id: str) -> Optional[IntegrationAccountData]:
+    def read_full_chat(self, chat_id: str, max_number_of_messages: int = None) -> List[MessageChat]:
 
-        response = self._base_call(f"users/me?account_id={owner_id}", {}, method_name="get")
-        if response.status_code == 200:
-            data = response.json()
-            return IntegrationAccountData(**data, **{
-                "owner_id": owner_id
-            })
+        return self._run(self._read_full_chat_flow(chat_id, max_number_of_messages))
 
-    def _get_user_info(self, linkedin_username: str, owner_id: str, custom_api: str = None) -> Optional[AccountData]:
+    def sync_chat_messages(self, chat_id: str, page_size: int = 100) -> List[MessageChat]:
 
-        additional_params = ""
-        if custom_api is not None and custom_api.strip() != "":
-            additional_params = f"&linkedin_api={custom_api}"
-        response = self._base_call(f"users/{linkedin_username}?account_id={owner_id}{additional_params}", {},
-                                   method_name="get")
-        if response.status_code == 200:
-            data = response.json()
-            return AccountData(**data)
+        return self._run(self._sync_chat_messages_flow(chat_id, page_size))
 
-    def _has_conversation_started(self, owner_id: str, provider_id: str) -> bool:
+    def export_chats(self, account_id: str, writer: ChatExportWriter, checkpoint: ExportCheckpointStore = None,
+                     max_concurrency: int = None, page_size: int = 100, commit_every: int = 100) -> ExportResult:
 
-        response = self._base_call(f"chat_attendees/{provider_id}/chats?account_id={owner_id}", {}, method_name="get")
-        return response.status_code == 200
+        return self._run(self._export_chats_flow(account_id, writer, checkpoint=checkpoint,
+                                                 max_concurrency=max_concurrency, page_size=page_size,
+                                                 commit_every=commit_every))
 
     def list_all_chats_between(self, owner_id: str, public_attendee_slug: str) -> List[ChatItem]:
-        attendee: AccountData | None = self._get_user_info(linkedin_username=public_attendee_slug, owner_id=owner_id)
-        if attendee is None:
-            return []
-
-        response = self._base_call(
-            f"chat_attendees/{attendee.user_id}/chats?account_id={owner_id}",
-            {},
-            method_name="get"
-        )
-        if response.status_code != 200:
-            return []
-
-        data = response.json()
-        return [ChatItem(**item) for item in data.get("items")]
-
-    def _get_reply_to_message_id(self, chat_id: str, owner_id: str, message_text: str, receiver_id: str) -> Optional[
-        str]:
-
-        response = self._base_call(f"chats/{chat_id}/messages?sender_id={owner_id}", {}, method_name="get")
-        if response.status_code == 200:
-            items = response.json()
-            message_items = items.get("items", [])
-            collecting = False
-            replies = []
-            for item in reversed(message_items):
-                if item["text"].strip() == message_text.strip() and item["sender_id"] != receiver_id:
-                    collecting = True
-                    continue
-                if collecting:
-                    if item["sender_id"] == receiver_id:
-                        replies.append(item["text"])
-                    else:
-                        break
-            return "\n".join(replies)
-        return None
-
-    def _get_chat_by_username(self, linkedin_username: str, owner_id: str, message_text: str) -> Optional[
-        Tuple[str, str]]:
-
-        account_data = self._get_user_info(linkedin_username, owner_id)
-        has_connection, user_id = account_data.has_connection, account_data.user_id
-        if has_connection and user_id is not None:
-            response = self._base_call(f"chat_attendees/{user_id}/chats?account_id={owner_id}", {},
-                                       method_name="get")
-            if response.status_code == 200:
-                data = response.json()
-                items = data.get("items", [])
-                if len(items) > 0:
-                    chat_id = items[0].get("id")
-                    return self._get_reply_to_message_id(
-                        chat_id=chat_id,
-                        owner_id=owner_id,
-                        message_text=message_text,
-                        receiver_id=user_id
-                    ), chat_id
+
+        return self._run(self._list_all_chats_between_flow(owner_id, public_attendee_slug))
 
     def has_accepted_connection(self, linkedin_username: str, owner_id: str) -> Tuple[bool, Optional[str]]:
 
-        response = self._get_user_info(linkedin_username, owner_id)
-        return response is not None and response.has_connection, \
-            response.user_id if response is not None else None
+        return self._run(self._has_accepted_connection_flow(linkedin_username, owner_id))
 
     def send_connection(self, linkedin_username: str, owner_id: str) -> bool:
 
-        accepted_connection, user_id = self.has_accepted_connection(linkedin_username, owner_id)
-        if accepted_connection is False and user_id is not None:
-            response = self._base_call(f"users/invite", {
-                "provider_id": user_id,
-                "account_id": owner_id
-            })
-            return response.status_code == 201
-        return False
+        return self._run(self._send_connection_flow(linkedin_username, owner_id))
+
+    def send_connections(self, owner_id: str, usernames: Iterable[str],
+                         relations: Iterable[RelationData] = None, quota: QuotaTracker = None,
+                         max_concurrency: int = None) -> List[InvitationResult]:
+
+        return self._run(self._send_connections_flow(owner_id, usernames, relations=relations, quota=quota,
+                                                     max_concurrency=max_concurrency))
 
     def get_chat_url(self, chat_id: str) -> str:
 
-        response = self._base_call(f"chats/{chat_id}", {},
-                                   method_name="get")
-        if response.status_code == 200:
-            data = response.json()
-            return f"https://www.linkedin.com/messaging/thread/{data.get('provider_id')}/"
+        return self._run(self._get_chat_url_flow(chat_id))
 
     def send_message_to_chat(self, chat_id: str, message: str) -> bool:
 
-        if message is not None and message.strip() != "":
-            response = self._base_call(f"chats/{chat_id}/messages/", {
-                "text": message,
-            }, body_type="json")
-            return response.status_code == 201
-        return False
+        return self._run(self._send_message_to_chat_flow(chat_id, message))
 
     def send_message(self, attendees_username: list, owner_id: str, message: str,
                      check_message_not_sent: bool = True, inmail_message: bool = False,
                      subject: str = None, is_sales: bool = False) -> List[MessageData]:
 
-        codes_status = []
-        if message is not None and message.strip() != "":
-            final_users = [self._get_user_info(
-                item, owner_id
-            ) for item in attendees_username]
-            final_users = [item.user_id for item in final_users if item is not None]
-            for attendee in final_users:
-                could_send_message = self._has_conversation_started(owner_id,
-                                                                    attendee) is False if check_message_not_sent \
-                    else True
-                if could_send_message:
-                    kwargs = {}
-                    if inmail_message:
-                        kwargs = {
-                            "linkedin": {
-                                "api": 'recruiter' if is_sales is False else "sales_navigator",
-                                "inmail": True,
-                            },
-                        }
-                        if subject is not None and subject.strip() != "":
-                            kwargs["subject"] = subject
-                    response = self._base_call("chats", {
-                        "attendees_ids": attendee,
-                        "account_id": owner_id,
-                        "text": message,
-                        **kwargs
-                    }, body_type="json")
-                    chat_id = None
-                    if response.status_code == 201:
-                        data = response.json()
-                        chat_id = data.get("chat_id")
-                    codes_status.append(
-                        MessageData(**{
-                            "chat_id": chat_id,
-                            "author_id": owner_id,
-                            "linkedin_id": attendee
-                        })
-                    )
-        return codes_status
-
-    def _find_personal_private_id(self, is_sales_api: bool, provider_id: str, owner_id: str) -> str:
-
-        account_data = self._get_user_info(provider_id, owner_id, "sales_navigator" if is_sales_api else "recruiter")
-        if account_data is not None:
-            return account_data.user_id
+        return self._run(self._send_message_flow(attendees_username, owner_id, message,
+                                                 check_message_not_sent=check_message_not_sent,
+                                                 inmail_message=inmail_message, subject=subject, is_sales=is_sales))
+
+    def iter_send_messages(self, attendees_username: Iterable[str], owner_id: str, message: str,
+                           check_message_not_sent: bool = True, inmail_message: bool = False, subject: str = None,
+                           is_sales: bool = False, quota: QuotaTracker = None, max_concurrency: int = None,
+                           queue_size: int = 100) -> Iterator[MessageData]:
+
+        return self._stream(self._send_messages_pipeline(
+            attendees_username, owner_id, message, check_message_not_sent=check_message_not_sent,
+            inmail_message=inmail_message, subject=subject, is_sales=is_sales, quota=quota,
+            max_concurrency=max_concurrency, queue_size=queue_size
+        ))
 
     def auth_user(self, li_at_cookie: str, user_agent: str, li_a_cookie: str = None,
-                  recruiter_contract_id: str = None) -> Optional[IntegrationAccountData]:
-
-        owner_id = self._add_linkedin_integration(li_at_cookie, user_agent, li_a_cookie=li_a_cookie,
-                                                  recruiter_contract_id=recruiter_contract_id)
-        if owner_id is not None:
-            sleep(2)
-            account_data = self._retrieve_current_user_data(owner_id)
-            if account_data is not None and (account_data.is_recruiter or account_data.is_sales_navigator):
-                is_sales = account_data.is_sales_navigator
-                sleep(1)
-                provider_id = self._find_personal_private_id(is_sales, account_data.account_id, owner_id)
-                account_data.private_premium_id = provider_id
-            return account_data
+                  recruiter_contract_id: str = None, readiness: ReadinessPolicy = None,
+                  account_readiness: AccountReadiness = None) -> Optional[IntegrationAccountData]:
+
+        return self._run(self._auth_user_flow(li_at_cookie, user_agent, li_a_cookie=li_a_cookie,
+                                              recruiter_contract_id=recruiter_contract_id, readiness=readiness,
+                                              account_readiness=account_readiness))
+
+    def auth_users(self, credentials: Iterable[dict], max_concurrency: int = None, readiness: ReadinessPolicy = None,
+                   account_readiness: AccountReadiness = None) -> Iterator[OnboardingResult]:
+
+        credentials = list(credentials)
+        workers = self._workers(max_concurrency)
+        if len(credentials) == 0:
+            return
+        executor = ThreadPoolExecutor(max_workers=max(min(workers, len(credentials)), 1))
+        futures = [executor.submit(self._run, self._onboard_flow(index, item, readiness, account_readiness))
+                   for index, item in enumerate(credentials)]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def delete_linkedin_connection(self, owner_id: str) -> bool:
 
-        response = self._base_call(f"accounts/{owner_id}", {}, method_name="delete")
-        return response.status_code == 200
-
-    def check_replies(self, owner_id: str, messages_data: List[MessageCheck]) -> List[MessageCheck]:
-
-        finals = []
-        for message in messages_data:
-            reply_text, chat_id = self._get_chat_by_username(message.username, owner_id, message.message_text)
-            finals.append(
-                MessageCheck(
-                    **{
-                        "username": message.username,
-                        "message_text": message.message_text,
-                        "reply_text": reply_text,
-                        "chat_id": chat_id
-                    }
-                )
-            )
-        return finals
-
-    def check_connections(self, owner_id: str, usernames: list) -> List[ConnectionCheck]:
-
-        finals = []
-        for username in usernames:
-            check, _ = self.has_accepted_connection(username, owner_id)
-            finals.append(
-                ConnectionCheck(
-                    **{
-                        "username": username,
-                        "has_accepted": check
-                    }
-                )
-            )
-        return finals
+        return self._run(self._delete_linkedin_connection_flow(owner_id))
+
+    def check_replies(self, owner_id: str, messages_data: List[MessageCheck],
+                      max_concurrency: int = None) -> List[MessageCheck]:
+
+        return self._run(self._check_replies_flow(owner_id, messages_data, max_concurrency=max_concurrency))
+
+    def check_connections(self, owner_id: str, usernames: list,
+                          max_concurrency: int = None) -> List[ConnectionCheck]:
+
+        return self._run(self._check_connections_flow(owner_id, usernames, max_concurrency=max_concurrency))
 
     def scrape_job_post_skills(self, account_id: str, job_post_id: str) -> list:
 
-        payload = {
-            "query_params": {"decorationId": "com.linkedin.voyager.dash.deco.assessments.FullJobSkillMatchInsight-16"},
-            "request_url": f"https://www.linkedin.com/voyager/api/voyagerAssessmentsDashJobSkillMatchInsight/urn:li:fsd_jobSkillMatchInsight:{job_post_id}/",
-            "method": "GET",
-            "account_id": account_id,
-            "encoding": False
-        }
-        response = self._base_call("linkedin", data=payload, method_name="post")
-        if response.status_code == 200:
-            data = response.json().get("data", {})
-            skills = data["skillMatchStatuses"]
-            return [item["localizedSkillDisplayName"] for item in skills]
-        return []
+        return self._run(self._scrape_job_post_skills_flow(account_id, job_post_id))
 
     def scrape_job_post_by_linkedin(self, account_id: str, job_post_id: str):
 
-        payload = {
-            "query_params": {"decorationId": "com.linkedin.voyager.deco.jobs.web.shared.WebFullJobPosting-65"},
-            "request_url": f"https://www.linkedin.com/voyager/api/jobs/jobPostings/{job_post_id}/",
-            "method": "GET",
-            "account_id": account_id,
-            "encoding": False
-        }
-        response = self._base_call("linkedin", data=payload, method_name="post")
-        if response.status_code == 200:
-            job_data = response.json().get("data", {})
-            key_name = list(job_data.get("companyDetails").keys())[0]
-            work_place_type = job_data["workplaceTypes"][0] if len(job_data["workplaceTypes"]) else None,
-            work_place_type = None if work_place_type is None else (
-                "hybrid" if "3" in work_place_type else (
-                    "fully_remote" if "2" in work_place_type else "physical"))
-            job_post_url = f"https://www.linkedin.com/jobs/search/?currentJobId={job_data['jobPostingId']}"
-            timestamp_seconds = job_data["listedAt"] / 1000
-            dt_object = datetime.utcfromtimestamp(timestamp_seconds)
-            listed_at = dt_object.strftime('%d %B %Y, %H:%M:%S UTC')
-            timing_mode = job_data.get("employmentStatusResolutionResult", {}).get("entityUrn", "")
-            timing_mode = self.get_timing_mode(timing_mode)
-            return {
-                "job_title": job_data["title"],
-                "company_id": job_data.get("companyDetails", {}).get(key_name, {})
-                .get("companyResolutionResult", {}).get("entityUrn", None),
-                "company_name": job_data.get("companyDetails", {}).get(key_name, {})
-                .get("companyResolutionResult", {}).get("name", None),
-                "company_linkedin": job_data.get("companyDetails", {}).get(key_name, {})
-                .get("companyResolutionResult", {}).get("url", None),
-                "description": job_data["description"]["text"],
-                "work_mode_type": work_place_type,
-                "location_name": job_data["formattedLocation"],
-                "listed_at": listed_at,
-                "job_post_url": job_post_url,
-                "timing": timing_mode,
-            }
-
-    def list_all_relations(self, account_id: str) -> dict:
-
-        cursor = None
-        relations = {}
-        check = True
-        while check:
-            additional_params = ""
-            if cursor is not None:
-                additional_params = f"&cursor={cursor}"
-            response = self._base_call(f"users/relations?account_id={account_id}&limit=250{additional_params}", {},
-                                       method_name="get")
-            sleep(1)
-            if response.status_code == 200:
-                data = response.json()
-                cursor = data.get("cursor")
-                relations = {
-                    **{
-                        item.member_id: item for
-                        item in [RelationData(**tmp) for tmp in data.get("items", [])]
-                    },
-                    **relations
-                }
-                check = cursor is not None
-                print(len(relations))
-        return relations
+        return self._run(self._scrape_job_post_by_linkedin_flow(account_id, job_post_id))
 
-    @staticmethod
-    def get_timing_mode(timing_urn: str) -> str:
-
-        if "CONTRACT" in timing_urn:
-            return "contract"
-        elif "FULL_TIME" in timing_urn:
-            return "full_time"
-        elif "PART_TIME" in timing_urn:
-            return "part_time"
-        elif "TEMPORARY" in timing_urn:
-            return "temporary"
-        elif "VOLUNTEER" in timing_urn:
-            return "other"
-        elif "INTERNSHIP" in timing_urn:
-            return "other"
-        else:
-            return "other"
+    def scrape_job_posts(self, account_id: str, job_post_ids: Iterable[str], include_skills: bool = True,
+                         max_concurrency: int = None) -> List[JobPostResult]:
+
+        return self._run(self._scrape_job_posts_flow(account_id, job_post_ids, include_skills=include_skills,
+                                                     max_concurrency=max_concurrency))
+
+    def list_all_relations(self, account_id: str, prefetch: bool = False,
+                           max_number_of_relations: Optional[int] = None, strict: bool = False) -> dict:
+
+        return self._run(self._list_all_relations_flow(account_id, prefetch=prefetch,
+                                                       max_number_of_relations=max_number_of_relations,
+                                                       strict=strict))
+
+    def sync_relations(self, account_id: str, state_store: RelationSyncStateStore, page_size: int = 250,
+                       prefetch: bool = False) -> Dict[str, RelationData]:
+
+        return self._run(self._sync_relations_flow(account_id, state_store, page_size=page_size, prefetch=prefetch))
 
     def auth_user_with_credentials(self, username: str, password) -> None:
         pass
@@ -410,8 +274,4 @@ class LinkedinUniPileIntegration:
     @staticmethod
     def _parse_payload(data: dict) -> dict:
 
-        finals = {}
-        for item in data:
-            if data[item] is not None:
-                finals[item] = data[item]
-        return finals
+        return parse_payload(data)
@@ -0,0 +1,2 @@
+from .parsing import RECRUITER, SALES_NAVIGATOR
+from .search import RecruiterSearchClient, AsyncRecruiterSearchClient
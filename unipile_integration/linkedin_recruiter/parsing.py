@@ -0,0 +1,35 @@
+# IMPORTING STANDARD PACKAGES
+from typing import Union
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import IntegrationAccountData
+
+RECRUITER = "recruiter"
+SALES_NAVIGATOR = "sales_navigator"
+PEOPLE = "people"
+MAX_PAGE_SIZE = 100
+
+
+def search_api(account: IntegrationAccountData) -> str:
+
+    # the contract is bound to the account when it is connected, the seat decides which search API it can use
+    if account.is_recruiter and account.contract_id is not None:
+        return RECRUITER
+    if account.is_sales_navigator and account.contract_id is not None:
+        return SALES_NAVIGATOR
+    raise ValueError(f"account {account.owner_id} has no Recruiter or Sales Navigator contract")
+
+
+def search_path(owner_id: str, limit: int) -> str:
+
+    return f"linkedin/search?account_id={owner_id}&limit={limit}"
+
+
+def search_payload(api: str, query: Union[str, dict]) -> dict:
+
+    query = {"keywords": query} if isinstance(query, str) else dict(query)
+    return {
+        "api": api,
+        "category": PEOPLE,
+        **query
+    }
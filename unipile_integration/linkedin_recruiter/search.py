@@ -0,0 +1,164 @@
+# IMPORTING STANDARD PACKAGES
+from typing import Optional, List, Iterable, Iterator, AsyncIterator, Union, Set, Callable, Any, Awaitable
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.async_linkedin import AsyncLinkedinUniPileIntegration
+from unipile_integration.data import IntegrationAccountData, Candidate
+from unipile_integration.decoding import JSON, resolve_decoder
+from unipile_integration.linkedin import LinkedinUniPileIntegration
+from unipile_integration.linkedin_recruiter.parsing import search_api, search_path, search_payload, MAX_PAGE_SIZE
+from unipile_integration.pagination import iter_pages, aiter_pages, page_limit
+from unipile_integration.transport import HttpTransport, AsyncHttpTransport
+
+SearchQuery = Union[str, dict]
+
+
+def _queries(queries: Union[SearchQuery, Iterable[SearchQuery]]) -> List[SearchQuery]:
+
+    return [queries] if isinstance(queries, (str, dict)) else list(queries)
+
+
+class _Deduplicator:
+    seen: Set[str]
+    duplicates: int
+
+    def __init__(self, exclude: Iterable[str] = None):
+
+        self.seen = set(exclude) if exclude is not None else set()
+        self.duplicates = 0
+
+    def is_new(self, candidate: Candidate) -> bool:
+
+        key = candidate.key
+        if key is None:
+            return True
+        if key in self.seen:
+            self.duplicates += 1
+            return False
+        self.seen.add(key)
+        return True
+
+
+class RecruiterSearchClient:
+    _transport: HttpTransport
+    _account: IntegrationAccountData
+    _api: str
+    _page_size: int
+    _json_decoder: str
+
+    def __init__(self, transport: HttpTransport, account: IntegrationAccountData, page_size: int = 25,
+                 json_decoder: str = JSON):
+
+        self._transport = transport
+        self._account = account
+        self._api = search_api(account)
+        self._page_size = min(page_size, MAX_PAGE_SIZE)
+        self._json_decoder = resolve_decoder(json_decoder)
+
+    @classmethod
+    def from_integration(cls, integration: LinkedinUniPileIntegration, account: IntegrationAccountData,
+                         page_size: int = 25) -> "RecruiterSearchClient":
+
+        return cls(integration.transport, account, page_size=page_size, json_decoder=integration.json_decoder)
+
+    @property
+    def api(self) -> str:
+
+        return self._api
+
+    def _fetch(self, body: dict) -> Callable[[str], Any]:
+
+        # every page repeats the query body, the cursor travels in the query string
+        return lambda url: self._transport.request(url, body, method_name="post")
+
+    def iter_pages(self, query: SearchQuery, max_results: Optional[int] = None,
+                   prefetch: bool = True) -> Iterator[List[Candidate]]:
+
+        url = search_path(self._account.owner_id, page_limit(max_results, self._page_size, MAX_PAGE_SIZE))
+        return iter_pages(self._fetch(search_payload(self._api, query)), url, Candidate, max_items=max_results,
+                          prefetch=prefetch, instrumentation=self._transport.instrumentation,
+                          decoder=self._json_decoder, strict=True)
+
+    def search(self, queries: Union[SearchQuery, Iterable[SearchQuery]], max_results: Optional[int] = None,
+               max_results_per_query: Optional[int] = None, prefetch: bool = True,
+               exclude: Iterable[str] = None) -> Iterator[Candidate]:
+
+        deduplicator = _Deduplicator(exclude)
+        yielded = 0
+        if max_results is not None and max_results <= 0:
+            return
+        for query in _queries(queries):
+            pages = self.iter_pages(query, max_results=max_results_per_query, prefetch=prefetch)
+            try:
+                for page in pages:
+                    for candidate in page:
+                        if not deduplicator.is_new(candidate):
+                            continue
+                        yield candidate
+                        yielded += 1
+                        if max_results is not None and yielded >= max_results:
+                            return
+            finally:
+                pages.close()
+
+
+class AsyncRecruiterSearchClient:
+    _transport: AsyncHttpTransport
+    _account: IntegrationAccountData
+    _api: str
+    _page_size: int
+    _json_decoder: str
+
+    def __init__(self, transport: AsyncHttpTransport, account: IntegrationAccountData, page_size: int = 25,
+                 json_decoder: str = JSON):
+
+        self._transport = transport
+        self._account = account
+        self._api = search_api(account)
+        self._page_size = min(page_size, MAX_PAGE_SIZE)
+        self._json_decoder = resolve_decoder(json_decoder)
+
+    @classmethod
+    def from_integration(cls, integration: AsyncLinkedinUniPileIntegration, account: IntegrationAccountData,
+                         page_size: int = 25) -> "AsyncRecruiterSearchClient":
+
+        return cls(integration.transport, account, page_size=page_size, json_decoder=integration.json_decoder)
+
+    @property
+    def api(self) -> str:
+
+        return self._api
+
+    def _fetch(self, body: dict) -> Callable[[str], Awaitable[Any]]:
+
+        return lambda url: self._transport.request(url, body, method_name="post")
+
+    def iter_pages(self, query: SearchQuery, max_results: Optional[int] = None,
+                   prefetch: bool = True) -> AsyncIterator[List[Candidate]]:
+
+        url = search_path(self._account.owner_id, page_limit(max_results, self._page_size, MAX_PAGE_SIZE))
+        return aiter_pages(self._fetch(search_payload(self._api, query)), url, Candidate, max_items=max_results,
+                           prefetch=prefetch, instrumentation=self._transport.instrumentation,
+                           decoder=self._json_decoder, strict=True)
+
+    async def search(self, queries: Union[SearchQuery, Iterable[SearchQuery]], max_results: Optional[int] = None,
+                     max_results_per_query: Optional[int] = None, prefetch: bool = True,
+                     exclude: Iterable[str] = None) -> AsyncIterator[Candidate]:
+
+        deduplicator = _Deduplicator(exclude)
+        yielded = 0
+        if max_results is not None and max_results <= 0:
+            return
+        for query in _queries(queries):
+            pages = self.iter_pages(query, max_results=max_results_per_query, prefetch=prefetch)
+            try:
+                async for page in pages:
+                    for candidate in page:
+                        if not deduplicator.is_new(candidate):
+                            continue
+                        yield candidate
+                        yielded += 1
+                        if max_results is not None and yielded >= max_results:
+                            return
+            finally:
+                await pages.aclose()
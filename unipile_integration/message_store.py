@@ -0,0 +1,124 @@
+# IMPORTING STANDARD PACKAGES
+import sqlite3
+
+from threading import Lock
+from typing import Optional, Iterable, List
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import ChatItem, MessageChat
+
+
+class MessageStore:
+    _connection: sqlite3.Connection
+    _lock: Lock
+
+    def __init__(self, path: str = ":memory:"):
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS chats (
+                    chat_id TEXT PRIMARY KEY,
+                    account_id TEXT,
+                    attendee_provider_id TEXT,
+                    provider_id TEXT,
+                    timestamp TEXT
+                );
+                CREATE INDEX IF NOT EXISTS chats_attendee ON chats (attendee_provider_id);
+                CREATE INDEX IF NOT EXISTS chats_account_timestamp ON chats (account_id, timestamp);
+                CREATE TABLE IF NOT EXISTS messages (
+                    id TEXT PRIMARY KEY,
+                    chat_id TEXT NOT NULL,
+                    sender_id TEXT,
+                    text TEXT,
+                    text_key TEXT,
+                    timestamp TEXT
+                );
+                CREATE INDEX IF NOT EXISTS messages_chat_timestamp ON messages (chat_id, timestamp);
+                CREATE INDEX IF NOT EXISTS messages_sender ON messages (sender_id);
+                CREATE INDEX IF NOT EXISTS messages_chat_text ON messages (chat_id, text_key);
+                """
+            )
+
+    @staticmethod
+    def _text_key(text: Optional[str]) -> Optional[str]:
+
+        return text.strip() if text is not None else None
+
+    def add_chats(self, chats: Iterable[ChatItem], account_id: str = None) -> None:
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO chats (chat_id, account_id, attendee_provider_id, provider_id, timestamp) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(chat.chat_id, account_id, chat.attendee_provider_id, chat.provider_id, chat.raw_timestamp)
+                 for chat in chats]
+            )
+
+    def add_messages(self, messages: Iterable[MessageChat], chat_id: str = None) -> None:
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO messages (id, chat_id, sender_id, text, text_key, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(message.id, chat_id if chat_id is not None else message.chat_id, message.sender_id,
+                  message.message_text, self._text_key(message.message_text), message.raw_timestamp)
+                 for message in messages]
+            )
+
+    def has_message(self, message_id: str) -> bool:
+
+        with self._lock:
+            row = self._connection.execute("SELECT 1 FROM messages WHERE id = ?", (message_id,)).fetchone()
+        return row is not None
+
+    def latest_message_timestamp(self, chat_id: str) -> Optional[str]:
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT MAX(timestamp) FROM messages WHERE chat_id = ?", (chat_id,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def chat_ids_for_attendee(self, attendee_provider_id: str, account_id: str = None) -> List[str]:
+
+        query = "SELECT chat_id FROM chats WHERE attendee_provider_id = ?"
+        params = [attendee_provider_id]
+        if account_id is not None:
+            query += " AND account_id = ?"
+            params.append(account_id)
+        with self._lock:
+            rows = self._connection.execute(f"{query} ORDER BY timestamp DESC", params).fetchall()
+        return [row[0] for row in rows]
+
+    def find_reply(self, chat_id: str, message_text: str, receiver_id: str) -> str:
+
+        text_key = self._text_key(message_text)
+        with self._lock:
+            sent = self._connection.execute(
+                "SELECT id, timestamp FROM messages WHERE chat_id = ? AND text_key = ? "
+                "AND (sender_id IS NULL OR sender_id != ?) ORDER BY timestamp ASC LIMIT 1",
+                (chat_id, text_key, receiver_id)
+            ).fetchone()
+            if sent is None:
+                return ""
+            # a quick reply can carry the same timestamp as the sent message
+            following = self._connection.execute(
+                "SELECT sender_id, text, text_key FROM messages WHERE chat_id = ? AND timestamp >= ? AND id != ? "
+                "ORDER BY timestamp ASC",
+                (chat_id, sent[1], sent[0])
+            ).fetchall()
+        replies = []
+        for sender_id, text, message_key in following:
+            if message_key == text_key and sender_id != receiver_id:
+                continue
+            if sender_id != receiver_id:
+                break
+            replies.append(text)
+        return "\n".join(replies)
+
+    def close(self) -> None:
+
+        self._connection.close()
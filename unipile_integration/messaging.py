@@ -0,0 +1,81 @@
+# IMPORTING STANDARD PACKAGES
+from threading import Lock
+from typing import Optional, Set
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import MessageData
+from unipile_integration.parsing import message_result
+from unipile_integration.quota import QuotaTracker, MESSAGE
+
+
+class MessageRecipients:
+    owner_id: str
+    _claimed: Set[str]
+    _lock: Lock
+
+    def __init__(self, owner_id: str):
+
+        self.owner_id = owner_id
+        self._claimed = set()
+        self._lock = Lock()
+
+    def claim(self, username: str, user_id: Optional[str]) -> Optional[MessageData]:
+
+        # a result here is final, None means the recipient goes on to the send stages
+        if user_id is None:
+            return message_result(self.owner_id, username, error="profile not found")
+        # two usernames of the same profile must not race through the precheck into two sends
+        with self._lock:
+            duplicate = user_id in self._claimed
+            self._claimed.add(user_id)
+        if duplicate:
+            return message_result(self.owner_id, username, user_id, MessageData.SKIPPED, error="duplicate recipient")
+        return None
+
+
+class MessageAttempt:
+    owner_id: str
+    username: str
+    user_id: str
+    _quota: Optional[QuotaTracker]
+    _action: str
+    _acquired: bool
+
+    def __init__(self, owner_id: str, username: str, user_id: str, quota: QuotaTracker = None,
+                 action: str = MESSAGE):
+
+        self.owner_id = owner_id
+        self.username = username
+        self.user_id = user_id
+        self._quota = quota
+        self._action = action
+        self._acquired = False
+
+    def reserve(self) -> Optional[MessageData]:
+
+        if self._quota is None:
+            return None
+        self._acquired = self._quota.try_acquire(self.owner_id, self._action)
+        if not self._acquired:
+            return message_result(self.owner_id, self.username, self.user_id, MessageData.DEFERRED,
+                                  error="quota exceeded")
+        return None
+
+    def _release(self) -> None:
+
+        if self._acquired:
+            self._quota.release(self.owner_id, self._action)
+            self._acquired = False
+
+    def sent(self, chat_id: Optional[str], status_code: int) -> MessageData:
+
+        if chat_id is None:
+            self._release()
+            return message_result(self.owner_id, self.username, self.user_id,
+                                  error=f"unexpected status code {status_code}")
+        return message_result(self.owner_id, self.username, self.user_id, MessageData.SENT, chat_id)
+
+    def failed(self, error: str) -> MessageData:
+
+        self._release()
+        return message_result(self.owner_id, self.username, self.user_id, error=error)
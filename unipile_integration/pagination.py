@@ -0,0 +1,137 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Iterator, AsyncIterator, Optional, Awaitable, Any
+from urllib.parse import quote
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.decoding import JSON
+from unipile_integration.instrumentation import Instrumentation, NOOP_INSTRUMENTATION, endpoint_template
+from unipile_integration.parsing import parse_page
+
+
+class PageError(Exception):
+    status_code: int
+
+    def __init__(self, url: str, status_code: int):
+
+        super().__init__(f"unexpected status code {status_code} for {url}")
+        self.status_code = status_code
+
+
+def with_cursor(url: str, cursor: Optional[str]) -> str:
+
+    if cursor is None:
+        return url
+    return f"{url}{'&' if '?' in url else '?'}cursor={quote(cursor, safe='')}"
+
+
+def page_limit(max_items: Optional[int], page_size: int, max_page_size: int = 250) -> int:
+
+    return max_items if max_items is not None and 0 < max_items <= max_page_size else page_size
+
+
+def _trim(page: list, max_items: Optional[int], yielded: int) -> list:
+
+    if max_items is None:
+        return page
+    return page[:max(max_items - yielded, 0)]
+
+
+def _record_pagination(instrumentation: Optional[Instrumentation], url: str, pages: int, items: int) -> None:
+
+    if instrumentation is not None and instrumentation.enabled:
+        instrumentation.on_pagination(endpoint_template(url), pages, items)
+
+
+def iter_pages(fetch: Callable[[str], Any], url: str, item_type: type, max_items: Optional[int] = None,
+               prefetch: bool = False, instrumentation: Instrumentation = NOOP_INSTRUMENTATION,
+               decoder: str = JSON, strict: bool = False) -> Iterator[list]:
+
+    executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending: Optional[Future] = None
+    yielded, pages, cursor = 0, 0, None
+    try:
+        response = fetch(url)
+        while True:
+            success, page, cursor = parse_page(response, item_type, decoder=decoder)
+            if not success:
+                if strict:
+                    raise PageError(url, response.status_code)
+                return
+            pages += 1
+            page = _trim(page, max_items, yielded)
+            yielded += len(page)
+            has_next = cursor is not None and (max_items is None or yielded < max_items)
+            if has_next and executor is not None:
+                pending = executor.submit(fetch, with_cursor(url, cursor))
+            if len(page) > 0:
+                yield page
+            if not has_next:
+                return
+            if pending is not None:
+                response, pending = pending.result(), None
+            else:
+                response = fetch(with_cursor(url, cursor))
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+        _record_pagination(instrumentation, url, pages, yielded)
+
+
+def iter_items(fetch: Callable[[str], Any], url: str, item_type: type, max_items: Optional[int] = None,
+               prefetch: bool = False, instrumentation: Instrumentation = NOOP_INSTRUMENTATION,
+               decoder: str = JSON, strict: bool = False) -> Iterator[Any]:
+
+    for page in iter_pages(fetch, url, item_type, max_items=max_items, prefetch=prefetch,
+                           instrumentation=instrumentation, decoder=decoder, strict=strict):
+        yield from page
+
+
+async def aiter_pages(fetch: Callable[[str], Awaitable[Any]], url: str, item_type: type,
+                      max_items: Optional[int] = None, prefetch: bool = False,
+                      instrumentation: Instrumentation = NOOP_INSTRUMENTATION,
+                      decoder: str = JSON, strict: bool = False) -> AsyncIterator[list]:
+
+    pending: Optional[asyncio.Task] = None
+    yielded, pages, cursor = 0, 0, None
+    try:
+        response = await fetch(url)
+        while True:
+            success, page, cursor = parse_page(response, item_type, decoder=decoder)
+            if not success:
+                if strict:
+                    raise PageError(url, response.status_code)
+                return
+            pages += 1
+            page = _trim(page, max_items, yielded)
+            yielded += len(page)
+            has_next = cursor is not None and (max_items is None or yielded < max_items)
+            if has_next and prefetch:
+                pending = asyncio.ensure_future(fetch(with_cursor(url, cursor)))
+            if len(page) > 0:
+                yield page
+            if not has_next:
+                return
+            if pending is not None:
+                response, pending = await pending, None
+            else:
+                response = await fetch(with_cursor(url, cursor))
+    finally:
+        if pending is not None:
+            pending.cancel()
+        _record_pagination(instrumentation, url, pages, yielded)
+
+
+async def aiter_items(fetch: Callable[[str], Awaitable[Any]], url: str, item_type: type,
+                      max_items: Optional[int] = None, prefetch: bool = False,
+                      instrumentation: Instrumentation = NOOP_INSTRUMENTATION,
+                      decoder: str = JSON, strict: bool = False) -> AsyncIterator[Any]:
+
+    async for page in aiter_pages(fetch, url, item_type, max_items=max_items, prefetch=prefetch,
+                                  instrumentation=instrumentation, decoder=decoder, strict=strict):
+        for item in page:
+            yield item
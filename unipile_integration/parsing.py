@@ -0,0 +1,299 @@
+# IMPORTING STANDARD PACKAGES
+from datetime import datetime
+from typing import Optional, List, Tuple, Dict, Any, Iterable
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import IntegrationAccountData, ChatItem, MessageData, JobPostResult, \
+    InvitationResult, RelationData
+from unipile_integration.decoding import JSON, iter_page_items
+
+JOB_POST = "job_post"
+JOB_POST_SKILLS = "skills"
+
+
+def parse_payload(data: dict) -> dict:
+
+    finals = {}
+    for item in data:
+        if data[item] is not None:
+            finals[item] = data[item]
+    return finals
+
+
+def linkedin_integration_payload(li_at_cookie: str, user_agent: str, li_a_cookie: str = None,
+                                 recruiter_contract_id: str = None) -> dict:
+
+    return parse_payload({
+        "provider": "LINKEDIN",
+        "access_token": li_at_cookie,
+        "user_agent": user_agent,
+        "premium_token": li_a_cookie,
+        "recruiter_contract_id": recruiter_contract_id
+    })
+
+
+def user_info_path(linkedin_username: str, owner_id: str, custom_api: str = None) -> str:
+
+    additional_params = ""
+    if custom_api is not None and custom_api.strip() != "":
+        additional_params = f"&linkedin_api={custom_api}"
+    return f"users/{linkedin_username}?account_id={owner_id}{additional_params}"
+
+
+def chat_payload(attendee: str, owner_id: str, message: str, inmail_message: bool = False, subject: str = None,
+                 is_sales: bool = False) -> dict:
+
+    kwargs = {}
+    if inmail_message:
+        kwargs = {
+            "linkedin": {
+                "api": 'recruiter' if is_sales is False else "sales_navigator",
+                "inmail": True,
+            },
+        }
+        if subject is not None and subject.strip() != "":
+            kwargs["subject"] = subject
+    return {
+        "attendees_ids": attendee,
+        "account_id": owner_id,
+        "text": message,
+        **kwargs
+    }
+
+
+def message_result(owner_id: str, username: Optional[str], user_id: Optional[str] = None,
+                   status: str = MessageData.FAILED, chat_id: Optional[str] = None,
+                   error: Optional[str] = None) -> MessageData:
+
+    return MessageData(**{
+        "chat_id": chat_id,
+        "author_id": owner_id,
+        "linkedin_id": user_id,
+        "username": username,
+        "status": status,
+        "error": error
+    })
+
+
+def invitation_result(owner_id: str, username: str, user_id: Optional[str] = None,
+                      status: str = InvitationResult.FAILED, error: Optional[str] = None) -> InvitationResult:
+
+    return InvitationResult(**{
+        "username": username,
+        "author_id": owner_id,
+        "linkedin_id": user_id,
+        "status": status,
+        "error": error
+    })
+
+
+def invitation_payload(owner_id: str, user_id: str) -> dict:
+
+    return {
+        "provider_id": user_id,
+        "account_id": owner_id
+    }
+
+
+def connected_users(relations: Iterable[RelationData]) -> Dict[str, str]:
+
+    # both the public slug and the member id resolve to the member id, callers may pass either
+    connected = {}
+    for relation in relations:
+        if relation.member_id is None:
+            continue
+        connected[relation.member_id] = relation.member_id
+        if relation.public_identifier is not None:
+            connected[relation.public_identifier] = relation.member_id
+    return connected
+
+
+def job_post_skills_payload(account_id: str, job_post_id: str) -> dict:
+
+    return {
+        "query_params": {"decorationId": "com.linkedin.voyager.dash.deco.assessments.FullJobSkillMatchInsight-16"},
+        "request_url": f"https://www.linkedin.com/voyager/api/voyagerAssessmentsDashJobSkillMatchInsight/urn:li:fsd_jobSkillMatchInsight:{job_post_id}/",
+        "method": "GET",
+        "account_id": account_id,
+        "encoding": False
+    }
+
+
+def job_post_payload(account_id: str, job_post_id: str) -> dict:
+
+    return {
+        "query_params": {"decorationId": "com.linkedin.voyager.deco.jobs.web.shared.WebFullJobPosting-65"},
+        "request_url": f"https://www.linkedin.com/voyager/api/jobs/jobPostings/{job_post_id}/",
+        "method": "GET",
+        "account_id": account_id,
+        "encoding": False
+    }
+
+
+def job_post_part_payload(account_id: str, job_post_id: str, part: str) -> dict:
+
+    if part == JOB_POST_SKILLS:
+        return job_post_skills_payload(account_id, job_post_id)
+    return job_post_payload(account_id, job_post_id)
+
+
+def job_post_result(job_post_id: str, parts: Dict[str, Tuple[Any, Optional[str]]]) -> JobPostResult:
+
+    errors = [f"{part}: {error}" for part, (_, error) in parts.items() if error is not None]
+    return JobPostResult(**{
+        "job_post_id": job_post_id,
+        "job_post": parts.get(JOB_POST, (None, None))[0],
+        "skills": parts.get(JOB_POST_SKILLS, (None, None))[0],
+        "error": "; ".join(errors) if len(errors) > 0 else None
+    })
+
+
+def parse_account_id(response) -> Optional[str]:
+
+    if response.status_code == 201:
+        data = response.json()
+        return data.get("account_id")
+
+
+def parse_page(response, item_type: type, decoder: str = JSON) -> Tuple[bool, list, Optional[str]]:
+
+    if response.status_code == 200:
+        if decoder == JSON:
+            data = response.json()
+            return True, item_type.from_items(data.get("items", [])), data.get("cursor")
+        meta = {}
+        items = item_type.from_items(iter_page_items(response.content, meta, decoder=decoder))
+        return True, items, meta.get("cursor")
+    return False, [], None
+
+
+def parse_current_user(response, owner_id: str) -> Optional[IntegrationAccountData]:
+
+    if response.status_code == 200:
+        data = response.json()
+        return IntegrationAccountData(**data, **{
+            "owner_id": owner_id
+        })
+
+
+def parse_user_info_payload(response) -> Optional[dict]:
+
+    if response.status_code == 200:
+        return response.json()
+
+
+def parse_chat_items(response) -> List[ChatItem]:
+
+    if response.status_code != 200:
+        return []
+    data = response.json()
+    return ChatItem.from_items(data.get("items"))
+
+
+def parse_first_chat_id(response) -> Optional[str]:
+
+    if response.status_code == 200:
+        data = response.json()
+        items = data.get("items", [])
+        if len(items) > 0:
+            return items[0].get("id")
+
+
+def parse_reply(response, message_text: str, receiver_id: str) -> Optional[str]:
+
+    if response.status_code == 200:
+        items = response.json()
+        message_items = items.get("items", [])
+        collecting = False
+        replies = []
+        for item in reversed(message_items):
+            if item["text"].strip() == message_text.strip() and item["sender_id"] != receiver_id:
+                collecting = True
+                continue
+            if collecting:
+                if item["sender_id"] == receiver_id:
+                    replies.append(item["text"])
+                else:
+                    break
+        return "\n".join(replies)
+    return None
+
+
+def parse_chat_url(response) -> Optional[str]:
+
+    if response.status_code == 200:
+        data = response.json()
+        return f"https://www.linkedin.com/messaging/thread/{data.get('provider_id')}/"
+
+
+def parse_started_chat_id(response) -> Optional[str]:
+
+    if response.status_code == 201:
+        data = response.json()
+        return data.get("chat_id")
+
+
+def parse_job_post_skills(response) -> list:
+
+    if response.status_code == 200:
+        data = response.json().get("data", {})
+        skills = data["skillMatchStatuses"]
+        return [item["localizedSkillDisplayName"] for item in skills]
+    return []
+
+
+def get_timing_mode(timing_urn: str) -> str:
+
+    if "CONTRACT" in timing_urn:
+        return "contract"
+    elif "FULL_TIME" in timing_urn:
+        return "full_time"
+    elif "PART_TIME" in timing_urn:
+        return "part_time"
+    elif "TEMPORARY" in timing_urn:
+        return "temporary"
+    elif "VOLUNTEER" in timing_urn:
+        return "other"
+    elif "INTERNSHIP" in timing_urn:
+        return "other"
+    else:
+        return "other"
+
+
+def parse_job_post(response) -> Optional[dict]:
+
+    if response.status_code == 200:
+        job_data = response.json().get("data", {})
+        key_name = list(job_data.get("companyDetails").keys())[0]
+        work_place_type = job_data["workplaceTypes"][0] if len(job_data["workplaceTypes"]) else None
+        work_place_type = None if work_place_type is None else (
+            "hybrid" if "3" in work_place_type else (
+                "fully_remote" if "2" in work_place_type else "physical"))
+        job_post_url = f"https://www.linkedin.com/jobs/search/?currentJobId={job_data['jobPostingId']}"
+        timestamp_seconds = job_data["listedAt"] / 1000
+        dt_object = datetime.utcfromtimestamp(timestamp_seconds)
+        listed_at = dt_object.strftime('%d %B %Y, %H:%M:%S UTC')
+        timing_mode = job_data.get("employmentStatusResolutionResult", {}).get("entityUrn", "")
+        timing_mode = get_timing_mode(timing_mode)
+        return {
+            "job_title": job_data["title"],
+            "company_id": job_data.get("companyDetails", {}).get(key_name, {})
+            .get("companyResolutionResult", {}).get("entityUrn", None),
+            "company_name": job_data.get("companyDetails", {}).get(key_name, {})
+            .get("companyResolutionResult", {}).get("name", None),
+            "company_linkedin": job_data.get("companyDetails", {}).get(key_name, {})
+            .get("companyResolutionResult", {}).get("url", None),
+            "description": job_data["description"]["text"],
+            "work_mode_type": work_place_type,
+            "location_name": job_data["formattedLocation"],
+            "listed_at": listed_at,
+            "job_post_url": job_post_url,
+            "timing": timing_mode,
+        }
+
+
+def parse_job_post_part(response, part: str) -> Any:
+
+    if part == JOB_POST_SKILLS:
+        return parse_job_post_skills(response)
+    return parse_job_post(response)
@@ -0,0 +1,185 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+from queue import Queue, Full, Empty
+from threading import Thread, Event, Lock, Semaphore
+from typing import Callable, Iterable, Iterator, AsyncIterator, List, Tuple, Any, Awaitable, Optional
+
+StageResult = Tuple[bool, Any]
+
+_DONE = object()
+
+
+class _StageCounter:
+    _remaining: int
+    _lock: Lock
+
+    def __init__(self, workers: int):
+
+        self._remaining = workers
+        self._lock = Lock()
+
+    def finish(self) -> bool:
+
+        with self._lock:
+            self._remaining -= 1
+            return self._remaining == 0
+
+
+def _put(queue: Queue, value: Any, cancelled: Event) -> bool:
+
+    while not cancelled.is_set():
+        try:
+            queue.put(value, timeout=0.1)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _get(queue: Queue, cancelled: Event) -> Any:
+
+    while not cancelled.is_set():
+        try:
+            return queue.get(timeout=0.1)
+        except Empty:
+            continue
+    return _DONE
+
+
+def _acquire(semaphore: Semaphore, cancelled: Event) -> bool:
+
+    while not cancelled.is_set():
+        if semaphore.acquire(timeout=0.1):
+            return True
+    return False
+
+
+def unique(items: Iterable) -> Iterator:
+
+    seen = set()
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+
+def iter_pipeline(items: Iterable, stages: List[Tuple[Callable[[Any], StageResult], int]],
+                  on_error: Callable[[Any, BaseException], Any], queue_size: int = 100,
+                  max_pending: Optional[int] = None) -> Iterator[Any]:
+
+    cancelled = Event()
+    queues = [Queue(maxsize=queue_size) for _ in stages]
+    output = Queue(maxsize=queue_size)
+    # the last stage may only run max_pending items ahead of the consumer, its side effects are never buffered
+    pending = Semaphore(max_pending) if max_pending is not None else None
+
+    def feed():
+        for item in items:
+            if not _put(queues[0], item, cancelled):
+                return
+        for _ in range(stages[0][1]):
+            _put(queues[0], _DONE, cancelled)
+
+    def work(index: int, counter: _StageCounter):
+        func = stages[index][0]
+        is_last = index == len(stages) - 1
+        gated = is_last and pending is not None
+        while True:
+            item = _get(queues[index], cancelled)
+            if item is _DONE:
+                break
+            if gated and not _acquire(pending, cancelled):
+                return
+            try:
+                finished, value = func(item)
+            except Exception as e:
+                finished, value = True, on_error(item, e)
+            if finished or is_last:
+                target, value = output, (gated, value)
+            else:
+                target = queues[index + 1]
+            if not _put(target, value, cancelled):
+                return
+        if counter.finish():
+            if is_last:
+                _put(output, _DONE, cancelled)
+            else:
+                for _ in range(stages[index + 1][1]):
+                    _put(queues[index + 1], _DONE, cancelled)
+
+    threads = [Thread(target=feed, daemon=True)]
+    for index, (_, workers) in enumerate(stages):
+        counter = _StageCounter(workers)
+        threads.extend(Thread(target=work, args=(index, counter), daemon=True) for _ in range(workers))
+    for thread in threads:
+        thread.start()
+    try:
+        while True:
+            entry = _get(output, cancelled)
+            if entry is _DONE:
+                return
+            gated, value = entry
+            yield value
+            if gated:
+                pending.release()
+    finally:
+        cancelled.set()
+
+
+async def aiter_pipeline(items: Iterable, stages: List[Tuple[Callable[[Any], Awaitable[StageResult]], int]],
+                         on_error: Callable[[Any, BaseException], Any], queue_size: int = 100,
+                         max_pending: Optional[int] = None) -> AsyncIterator[Any]:
+
+    queues = [asyncio.Queue(maxsize=queue_size) for _ in stages]
+    output = asyncio.Queue(maxsize=queue_size)
+    pending = asyncio.Semaphore(max_pending) if max_pending is not None else None
+
+    async def feed():
+        for item in items:
+            await queues[0].put(item)
+        for _ in range(stages[0][1]):
+            await queues[0].put(_DONE)
+
+    async def work(index: int, counter: List[int]):
+        func = stages[index][0]
+        is_last = index == len(stages) - 1
+        gated = is_last and pending is not None
+        while True:
+            item = await queues[index].get()
+            if item is _DONE:
+                break
+            if gated:
+                await pending.acquire()
+            try:
+                finished, value = await func(item)
+            except Exception as e:
+                finished, value = True, on_error(item, e)
+            if finished or is_last:
+                await output.put((gated, value))
+            else:
+                await queues[index + 1].put(value)
+        counter[0] -= 1
+        if counter[0] == 0:
+            if is_last:
+                await output.put(_DONE)
+            else:
+                for _ in range(stages[index + 1][1]):
+                    await queues[index + 1].put(_DONE)
+
+    tasks = [asyncio.ensure_future(feed())]
+    for index, (_, workers) in enumerate(stages):
+        counter = [workers]
+        tasks.extend(asyncio.ensure_future(work(index, counter)) for _ in range(workers))
+    try:
+        while True:
+            entry = await output.get()
+            if entry is _DONE:
+                return
+            gated, value = entry
+            yield value
+            if gated:
+                pending.release()
+    finally:
+        for task in tasks:
+            task.cancel()
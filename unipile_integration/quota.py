@@ -0,0 +1,195 @@
+# IMPORTING STANDARD PACKAGES
+import sqlite3
+
+from bisect import insort
+from collections import deque
+from threading import Lock
+from time import time
+from typing import Dict, Optional, Tuple, Deque
+
+DAY = 24 * 60 * 60
+WEEK = 7 * DAY
+
+INVITATION = "invitation"
+MESSAGE = "message"
+INMAIL = "inmail"
+
+
+class Quota:
+    limit: int
+    window: float
+
+    def __init__(self, limit: int, window: float = DAY):
+
+        self.limit = limit
+        self.window = window
+
+
+class QuotaBackend:
+
+    def acquire(self, owner_id: str, action: str, now: float, window_start: float, limit: int) -> bool:
+        raise NotImplementedError
+
+    def release(self, owner_id: str, action: str) -> None:
+        raise NotImplementedError
+
+    def count(self, owner_id: str, action: str, window_start: float) -> int:
+        raise NotImplementedError
+
+    def record(self, owner_id: str, action: str, timestamp: float) -> None:
+        raise NotImplementedError
+
+
+class InMemoryQuotaBackend(QuotaBackend):
+    _usage: Dict[Tuple[str, str], Deque[float]]
+    _lock: Lock
+
+    def __init__(self):
+
+        self._usage = {}
+        self._lock = Lock()
+
+    def _window_usage(self, owner_id: str, action: str, window_start: float) -> Deque[float]:
+
+        usage = self._usage.setdefault((owner_id, action), deque())
+        while usage and usage[0] <= window_start:
+            usage.popleft()
+        return usage
+
+    def acquire(self, owner_id: str, action: str, now: float, window_start: float, limit: int) -> bool:
+
+        with self._lock:
+            usage = self._window_usage(owner_id, action, window_start)
+            if len(usage) >= limit:
+                return False
+            usage.append(now)
+            return True
+
+    def release(self, owner_id: str, action: str) -> None:
+
+        with self._lock:
+            usage = self._usage.get((owner_id, action))
+            if usage:
+                usage.pop()
+
+    def count(self, owner_id: str, action: str, window_start: float) -> int:
+
+        with self._lock:
+            return len(self._window_usage(owner_id, action, window_start))
+
+    def record(self, owner_id: str, action: str, timestamp: float) -> None:
+
+        with self._lock:
+            insort(self._usage.setdefault((owner_id, action), deque()), timestamp)
+
+
+class SQLiteQuotaBackend(QuotaBackend):
+    _connection: sqlite3.Connection
+    _lock: Lock
+
+    def __init__(self, path: str):
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS quota_usage (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    owner_id TEXT NOT NULL,
+                    action TEXT NOT NULL,
+                    timestamp REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS quota_usage_window ON quota_usage (owner_id, action, timestamp);
+                """
+            )
+
+    def acquire(self, owner_id: str, action: str, now: float, window_start: float, limit: int) -> bool:
+
+        # the write lock is taken up front so processes sharing the file cannot both take the last slot
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._connection.execute(
+                "DELETE FROM quota_usage WHERE owner_id = ? AND action = ? AND timestamp <= ?",
+                (owner_id, action, window_start)
+            )
+            used = self._connection.execute(
+                "SELECT COUNT(*) FROM quota_usage WHERE owner_id = ? AND action = ?", (owner_id, action)
+            ).fetchone()[0]
+            if used >= limit:
+                return False
+            self._connection.execute(
+                "INSERT INTO quota_usage (owner_id, action, timestamp) VALUES (?, ?, ?)", (owner_id, action, now)
+            )
+            return True
+
+    def release(self, owner_id: str, action: str) -> None:
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM quota_usage WHERE id = (SELECT id FROM quota_usage WHERE owner_id = ? AND action = ? "
+                "ORDER BY timestamp DESC, id DESC LIMIT 1)",
+                (owner_id, action)
+            )
+
+    def count(self, owner_id: str, action: str, window_start: float) -> int:
+
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM quota_usage WHERE owner_id = ? AND action = ? AND timestamp > ?",
+                (owner_id, action, window_start)
+            ).fetchone()[0]
+
+    def record(self, owner_id: str, action: str, timestamp: float) -> None:
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO quota_usage (owner_id, action, timestamp) VALUES (?, ?, ?)",
+                (owner_id, action, timestamp)
+            )
+
+    def close(self) -> None:
+
+        self._connection.close()
+
+
+class QuotaTracker:
+    _quotas: Dict[str, Quota]
+    _backend: QuotaBackend
+
+    def __init__(self, quotas: Dict[str, Quota], backend: QuotaBackend = None):
+
+        self._quotas = dict(quotas)
+        self._backend = backend if backend is not None else InMemoryQuotaBackend()
+
+    @property
+    def backend(self) -> QuotaBackend:
+
+        return self._backend
+
+    def try_acquire(self, owner_id: str, action: str) -> bool:
+
+        quota = self._quotas.get(action)
+        if quota is None:
+            return True
+        now = time()
+        return self._backend.acquire(owner_id, action, now, now - quota.window, quota.limit)
+
+    def release(self, owner_id: str, action: str) -> None:
+
+        if action not in self._quotas:
+            return
+        self._backend.release(owner_id, action)
+
+    def remaining(self, owner_id: str, action: str) -> Optional[int]:
+
+        quota = self._quotas.get(action)
+        if quota is None:
+            return None
+        return max(quota.limit - self._backend.count(owner_id, action, time() - quota.window), 0)
+
+    def record(self, owner_id: str, action: str, timestamp: float = None) -> None:
+
+        if action not in self._quotas:
+            return
+        self._backend.record(owner_id, action, timestamp if timestamp is not None else time())
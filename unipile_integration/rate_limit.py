@@ -0,0 +1,174 @@
+# IMPORTING STANDARD PACKAGES
+import random
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import monotonic
+from typing import Optional, Dict, Iterable
+from urllib.parse import urlparse, parse_qs
+
+
+class TokenBucket:
+    _max_rate: Optional[float]
+    _rate: Optional[float]
+    _min_rate: Optional[float]
+    _capacity: float
+    _tokens: float
+    _updated_at: float
+    _blocked_until: float
+    _lock: Lock
+
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None, min_rate: Optional[float] = None,
+                 decrease_factor: float = 0.5, increase_step: float = 0.05):
+
+        self._max_rate = rate
+        self._rate = rate
+        self._min_rate = min_rate if min_rate is not None else (rate / 10 if rate is not None else None)
+        self._capacity = capacity if capacity is not None else max(rate if rate is not None else 1, 1)
+        self._decrease_factor = decrease_factor
+        self._increase_step = increase_step
+        self._tokens = self._capacity
+        self._updated_at = monotonic()
+        self._blocked_until = 0
+        self._lock = Lock()
+
+    @property
+    def rate(self) -> Optional[float]:
+
+        return self._rate
+
+    def reserve(self) -> float:
+
+        with self._lock:
+            now = monotonic()
+            wait = max(self._blocked_until - now, 0)
+            if self._rate is not None:
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+                self._updated_at = now
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self._rate)
+            return wait
+
+    def penalize(self, retry_after: Optional[float] = None) -> None:
+
+        with self._lock:
+            if self._rate is not None:
+                self._rate = max(self._min_rate, self._rate * self._decrease_factor)
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, monotonic() + retry_after)
+
+    def reward(self) -> None:
+
+        with self._lock:
+            if self._rate is not None and self._rate < self._max_rate:
+                self._rate = min(self._max_rate, self._rate + self._max_rate * self._increase_step)
+
+
+class RateLimiter:
+    _global_bucket: TokenBucket
+    _account_buckets: Dict[str, TokenBucket]
+    _account_rate: Optional[float]
+    _account_capacity: Optional[float]
+    _lock: Lock
+
+    def __init__(self, global_rate: Optional[float] = None, account_rate: Optional[float] = None,
+                 global_capacity: Optional[float] = None, account_capacity: Optional[float] = None):
+
+        self._global_bucket = TokenBucket(global_rate, capacity=global_capacity)
+        self._account_rate = account_rate
+        self._account_capacity = account_capacity
+        self._account_buckets = {}
+        self._lock = Lock()
+
+    def bucket(self, account_id: Optional[str]) -> TokenBucket:
+
+        if account_id is None:
+            return self._global_bucket
+        with self._lock:
+            bucket = self._account_buckets.get(account_id)
+            if bucket is None:
+                bucket = TokenBucket(self._account_rate, capacity=self._account_capacity)
+                self._account_buckets[account_id] = bucket
+            return bucket
+
+    def reserve(self, account_id: Optional[str] = None) -> float:
+
+        wait = self._global_bucket.reserve()
+        if account_id is not None:
+            wait = max(wait, self.bucket(account_id).reserve())
+        return wait
+
+    def penalize(self, account_id: Optional[str] = None, retry_after: Optional[float] = None) -> None:
+
+        self.bucket(account_id).penalize(retry_after)
+
+    def reward(self, account_id: Optional[str] = None) -> None:
+
+        self.bucket(account_id).reward()
+
+
+class RetryPolicy:
+    max_retries: int
+    backoff_factor: float
+    max_backoff: float
+    retry_statuses: frozenset
+    idempotent_only_statuses: frozenset
+
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 0.5, max_backoff: float = 30,
+                 retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+                 idempotent_only_statuses: Iterable[int] = (500, 502, 503, 504)):
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_only_statuses = frozenset(idempotent_only_statuses)
+
+    def should_retry(self, method_name: str, status_code: int, attempt: int) -> bool:
+
+        if attempt >= self.max_retries or status_code not in self.retry_statuses:
+            return False
+        return method_name in ("get", "delete") or status_code not in self.idempotent_only_statuses
+
+    def should_retry_error(self, method_name: str, attempt: int) -> bool:
+
+        return attempt < self.max_retries and method_name in ("get", "delete")
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+
+    if value is None or value.strip() == "":
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+def extract_account_id(path: str, data: Optional[dict] = None) -> Optional[str]:
+
+    parsed = urlparse(path)
+    account_ids = parse_qs(parsed.query).get("account_id")
+    if account_ids:
+        return account_ids[0]
+    if isinstance(data, dict) and data.get("account_id") is not None:
+        return data.get("account_id")
+    parts = parsed.path.strip("/").split("/")
+    if len(parts) == 2 and parts[0] == "accounts":
+        return parts[1]
+    return None
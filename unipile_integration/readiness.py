@@ -0,0 +1,164 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+from threading import Event, Lock
+from time import sleep, monotonic
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any, Awaitable
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import WebhookEvent
+from unipile_integration.webhooks import WebhookDispatcher
+
+READY_STATUSES = ("OK", "CREATION_SUCCESS", "RECONNECTED", "SYNC_SUCCESS")
+FAILED_STATUSES = ("ERROR", "STOPPED", "CREDENTIALS", "DELETED")
+# users/me answers these for an account that will never become ready, anything else may still change
+REJECTED_STATUS_CODES = frozenset({401, 403, 404})
+
+
+class ReadinessPolicy:
+    initial_delay: float
+    multiplier: float
+    max_delay: float
+    timeout: float
+
+    def __init__(self, initial_delay: float = 0.5, multiplier: float = 1.5, max_delay: float = 5,
+                 timeout: float = 60):
+
+        self.initial_delay = initial_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.timeout = timeout
+
+    def delays(self) -> Iterator[float]:
+
+        deadline = monotonic() + self.timeout
+        delay = self.initial_delay
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return
+            yield min(delay, remaining)
+            delay = min(delay * self.multiplier, self.max_delay)
+
+
+def _wake(waiter: asyncio.Future) -> None:
+
+    if not waiter.done():
+        waiter.set_result(True)
+
+
+class AccountReadiness:
+    _events: Dict[str, Event]
+    _waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]]
+    _statuses: Dict[str, str]
+    _lock: Lock
+
+    def __init__(self, dispatcher: WebhookDispatcher = None):
+
+        self._events = {}
+        self._waiters = {}
+        self._statuses = {}
+        self._lock = Lock()
+        if dispatcher is not None:
+            self.attach(dispatcher)
+
+    def attach(self, dispatcher: WebhookDispatcher) -> None:
+
+        dispatcher.on_account_status(self.handle)
+
+    def _event(self, account_id: str) -> Event:
+
+        # callers hold the lock so a status change can never slip between a check and a waiter registration
+        event = self._events.get(account_id)
+        if event is None:
+            event = self._events[account_id] = Event()
+        return event
+
+    def handle(self, event: WebhookEvent) -> None:
+
+        if event.account_id is None:
+            return
+        with self._lock:
+            self._statuses[event.account_id] = event.status
+            if event.status not in READY_STATUSES and event.status not in FAILED_STATUSES:
+                return
+            self._event(event.account_id).set()
+            waiters = self._waiters.pop(event.account_id, [])
+        # webhooks arrive on the receiver threads, async waiters are woken on their own loops
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    def status(self, account_id: str) -> Optional[str]:
+
+        return self._statuses.get(account_id)
+
+    def has_failed(self, account_id: str) -> bool:
+
+        return self._statuses.get(account_id) in FAILED_STATUSES
+
+    def wait(self, account_id: str, timeout: float) -> bool:
+
+        # a status change wakes the waiter once, later waits fall back to the full backoff delay
+        with self._lock:
+            event = self._event(account_id)
+        woken = event.wait(timeout)
+        event.clear()
+        return woken
+
+    async def async_wait(self, account_id: str, timeout: float) -> bool:
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            event = self._event(account_id)
+            if event.is_set():
+                event.clear()
+                return True
+            waiter = loop.create_future()
+            self._waiters.setdefault(account_id, []).append((loop, waiter))
+        try:
+            await asyncio.wait({waiter}, timeout=timeout)
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(account_id, [])
+                if (loop, waiter) in waiters:
+                    waiters.remove((loop, waiter))
+                if len(waiters) == 0:
+                    self._waiters.pop(account_id, None)
+                event.clear()
+        woken = waiter.done() and not waiter.cancelled()
+        waiter.cancel()
+        return woken
+
+    def forget(self, account_id: str) -> None:
+
+        with self._lock:
+            self._events.pop(account_id, None)
+            self._statuses.pop(account_id, None)
+            waiters = self._waiters.pop(account_id, [])
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(waiter.cancel)
+
+
+def poll_until(check: Callable[[], Optional[Any]], policy: ReadinessPolicy,
+               wait: Callable[[float], Any] = sleep, failed: Callable[[], bool] = None) -> Optional[Any]:
+
+    value = check()
+    for delay in policy.delays():
+        if value is not None or (failed is not None and failed()):
+            break
+        wait(delay)
+        value = check()
+    return value
+
+
+async def apoll_until(check: Callable[[], Awaitable[Optional[Any]]], policy: ReadinessPolicy,
+                      wait: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+                      failed: Callable[[], bool] = None) -> Optional[Any]:
+
+    value = await check()
+    for delay in policy.delays():
+        if value is not None or (failed is not None and failed()):
+            break
+        await wait(delay)
+        value = await check()
+    return value
@@ -0,0 +1,129 @@
+# IMPORTING STANDARD PACKAGES
+import json
+import sqlite3
+
+from threading import Lock
+from typing import Optional, Dict
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import RelationData, RelationSyncState
+
+
+class RelationSyncStateStore:
+
+    def get(self, account_id: str) -> Optional[RelationSyncState]:
+        raise NotImplementedError
+
+    def set(self, state: RelationSyncState) -> None:
+        raise NotImplementedError
+
+
+class InMemoryRelationSyncStateStore(RelationSyncStateStore):
+    _states: Dict[str, RelationSyncState]
+
+    def __init__(self):
+
+        self._states = {}
+
+    def get(self, account_id: str) -> Optional[RelationSyncState]:
+
+        return self._states.get(account_id)
+
+    def set(self, state: RelationSyncState) -> None:
+
+        self._states[state.account_id] = state
+
+
+class SQLiteRelationSyncStateStore(RelationSyncStateStore):
+    _connection: sqlite3.Connection
+    _lock: Lock
+
+    def __init__(self, path: str):
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS relation_sync_state ("
+                "account_id TEXT PRIMARY KEY, created_at INTEGER, member_id TEXT, member_ids TEXT)"
+            )
+            columns = [row[1] for row in self._connection.execute("PRAGMA table_info(relation_sync_state)")]
+            if "member_ids" not in columns:
+                self._connection.execute("ALTER TABLE relation_sync_state ADD COLUMN member_ids TEXT")
+
+    def get(self, account_id: str) -> Optional[RelationSyncState]:
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT account_id, created_at, member_id, member_ids FROM relation_sync_state WHERE account_id = ?",
+                (account_id,)
+            ).fetchone()
+        if row is not None:
+            return RelationSyncState(account_id=row[0], created_at=row[1], member_id=row[2],
+                                     member_ids=json.loads(row[3]) if row[3] is not None else None)
+
+    def set(self, state: RelationSyncState) -> None:
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO relation_sync_state (account_id, created_at, member_id, member_ids) "
+                "VALUES (?, ?, ?, ?)",
+                (state.account_id, state.created_at, state.member_id, json.dumps(list(state.member_ids)))
+            )
+
+    def close(self) -> None:
+
+        self._connection.close()
+
+
+class RelationSyncRun:
+    account_id: str
+    added: Dict[str, RelationData]
+    _state: Optional[RelationSyncState]
+    _newest: Optional[RelationData]
+
+    def __init__(self, account_id: str, state: Optional[RelationSyncState]):
+
+        self.account_id = account_id
+        self.added = {}
+        self._state = state
+        self._newest = None
+
+    def _is_past_mark(self, relation: RelationData) -> bool:
+
+        if self._state is None:
+            return False
+        if relation.created_at is None or self._state.created_at is None:
+            return relation.member_id is not None and relation.member_id == self._state.member_id
+        return relation.created_at < self._state.created_at
+
+    def _is_known(self, relation: RelationData) -> bool:
+
+        return self._state is not None and relation.member_id in self._state.member_ids
+
+    def add(self, relation: RelationData) -> bool:
+
+        # the walk stops past the mark, relations tied with it are skipped and the walk goes on
+        if self._is_past_mark(relation):
+            return False
+        if self._is_known(relation):
+            return True
+        if self._newest is None or (relation.created_at is not None and (
+                self._newest.created_at is None or relation.created_at > self._newest.created_at)):
+            self._newest = relation
+        self.added.setdefault(relation.member_id, relation)
+        return True
+
+    def state(self) -> Optional[RelationSyncState]:
+
+        if self._newest is None:
+            return self._state
+        created_at = self._newest.created_at
+        if created_at is None:
+            member_ids = [self._newest.member_id]
+        else:
+            member_ids = [member_id for member_id, relation in self.added.items() if relation.created_at == created_at]
+            if self._state is not None and self._state.created_at == created_at:
+                member_ids = list(self._state.member_ids) + member_ids
+        return RelationSyncState(account_id=self.account_id, created_at=created_at, member_id=self._newest.member_id,
+                                 member_ids=member_ids)
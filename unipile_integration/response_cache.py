@@ -0,0 +1,345 @@
+# IMPORTING STANDARD PACKAGES
+import hashlib
+import json
+import sqlite3
+
+from collections import OrderedDict
+from threading import Lock
+from time import time
+from typing import Optional, Dict, Tuple
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.instrumentation import endpoint_template
+
+HIT = "hit"
+MISS = "miss"
+REVALIDATED = "revalidated"
+STORED = "stored"
+
+_ENTRY_COLUMNS = ("status_code", "headers", "content", "stored_at", "expires_at", "etag", "last_modified")
+
+
+class CachePolicy:
+    ttl: float
+    revalidate: bool
+
+    def __init__(self, ttl: float, revalidate: bool = True):
+
+        self.ttl = ttl
+        self.revalidate = revalidate
+
+
+# keyed like the MetricsRecorder endpoints so policies can be tuned from its snapshot
+DEFAULT_POLICIES = {
+    "GET chats/{id}": CachePolicy(10 * 60),
+    "GET users/me": CachePolicy(60),
+    "POST linkedin": CachePolicy(60 * 60, revalidate=False)
+}
+
+
+def entry_size(entry: dict) -> int:
+
+    return len(entry["content"])
+
+
+class ResponseCacheBackend:
+
+    def get(self, key: str) -> Optional[dict]:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: dict) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class InMemoryResponseCacheBackend(ResponseCacheBackend):
+    _max_entries: int
+    _max_bytes: int
+    _entries: "OrderedDict[str, dict]"
+    _size: int
+    _lock: Lock
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 32 * 1024 * 1024):
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: dict) -> None:
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= entry_size(previous)
+            self._entries[key] = entry
+            self._size += entry_size(entry)
+            while len(self._entries) > 0 and (len(self._entries) > self._max_entries or self._size > self._max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= entry_size(evicted)
+
+    def delete(self, key: str) -> None:
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry_size(entry)
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def size(self) -> int:
+
+        return self._size
+
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+
+class SQLiteResponseCacheBackend(ResponseCacheBackend):
+    _max_entries: int
+    _max_bytes: int
+    _connection: sqlite3.Connection
+    _lock: Lock
+
+    def __init__(self, path: str, max_entries: int = 10000, max_bytes: int = 256 * 1024 * 1024):
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS response_cache (
+                    key TEXT PRIMARY KEY,
+                    status_code INTEGER,
+                    headers TEXT,
+                    content BLOB,
+                    stored_at REAL,
+                    expires_at REAL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    size INTEGER,
+                    accessed_at REAL
+                );
+                CREATE INDEX IF NOT EXISTS response_cache_accessed ON response_cache (accessed_at);
+                """
+            )
+
+    def get(self, key: str) -> Optional[dict]:
+
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                f"SELECT {', '.join(_ENTRY_COLUMNS)} FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE response_cache SET accessed_at = ? WHERE key = ?", (time(), key))
+        entry = dict(zip(_ENTRY_COLUMNS, row))
+        entry["headers"] = json.loads(entry["headers"])
+        return entry
+
+    def set(self, key: str, entry: dict) -> None:
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO response_cache "
+                f"(key, {', '.join(_ENTRY_COLUMNS)}, size, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, entry["status_code"], json.dumps(entry["headers"]), entry["content"], entry["stored_at"],
+                 entry["expires_at"], entry["etag"], entry["last_modified"], entry_size(entry), time())
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+
+        entries, size = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM response_cache"
+        ).fetchone()
+        if entries <= self._max_entries and size <= self._max_bytes:
+            return
+        evicted = []
+        for key, entry_bytes in self._connection.execute(
+                "SELECT key, size FROM response_cache ORDER BY accessed_at"):
+            if entries <= self._max_entries and size <= self._max_bytes:
+                break
+            evicted.append((key,))
+            entries -= 1
+            size -= entry_bytes
+        self._connection.executemany("DELETE FROM response_cache WHERE key = ?", evicted)
+
+    def delete(self, key: str) -> None:
+
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM response_cache")
+
+    def __len__(self) -> int:
+
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+
+    def close(self) -> None:
+
+        self._connection.close()
+
+
+class ResponseCache:
+    _backend: ResponseCacheBackend
+    _policies: Dict[str, CachePolicy]
+    _stats: Dict[str, Dict[str, int]]
+    _lock: Lock
+
+    def __init__(self, backend: ResponseCacheBackend = None, policies: Dict[str, CachePolicy] = None):
+
+        self._backend = backend if backend is not None else InMemoryResponseCacheBackend()
+        self._policies = dict(policies) if policies is not None else dict(DEFAULT_POLICIES)
+        self._stats = {}
+        self._lock = Lock()
+
+    @property
+    def backend(self) -> ResponseCacheBackend:
+
+        return self._backend
+
+    def set_policy(self, endpoint: str, policy: Optional[CachePolicy]) -> None:
+
+        if policy is None:
+            self._policies.pop(endpoint, None)
+        else:
+            self._policies[endpoint] = policy
+
+    @staticmethod
+    def endpoint(method_name: str, path: str) -> str:
+
+        return f"{method_name.upper()} {endpoint_template(path)}"
+
+    def policy(self, method_name: str, path: str, data: Optional[dict] = None) -> Optional[CachePolicy]:
+
+        # POSTs are only cacheable when they proxy a read, like the `linkedin` passthrough with method GET
+        if method_name == "post" and (not isinstance(data, dict) or str(data.get("method", "")).upper() != "GET"):
+            return None
+        if method_name not in ("get", "post"):
+            return None
+        return self._policies.get(self.endpoint(method_name, path))
+
+    @staticmethod
+    def key(scope: str, method_name: str, path: str, data: Optional[dict] = None) -> str:
+
+        key = f"{scope} {method_name.upper()} {path}"
+        if method_name == "post":
+            body = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+            key = f"{key} {hashlib.sha1(body.encode('utf-8')).hexdigest()}"
+        return key
+
+    def _count(self, endpoint: str, outcome: str) -> None:
+
+        with self._lock:
+            counters = self._stats.get(endpoint)
+            if counters is None:
+                counters = self._stats[endpoint] = {HIT: 0, MISS: 0, REVALIDATED: 0, STORED: 0}
+            counters[outcome] += 1
+
+    def lookup(self, endpoint: str, key: str, policy: CachePolicy) -> Tuple[Optional[dict], bool]:
+
+        entry = self._backend.get(key)
+        if entry is not None and entry["expires_at"] > time():
+            self._count(endpoint, HIT)
+            return entry, True
+        self._count(endpoint, MISS)
+        if entry is None:
+            return None, False
+        if not policy.revalidate or (entry["etag"] is None and entry["last_modified"] is None):
+            # a stale entry without validators is of no further use
+            self._backend.delete(key)
+            return None, False
+        return entry, False
+
+    @staticmethod
+    def conditional_headers(entry: Optional[dict]) -> dict:
+
+        headers = {}
+        if entry is None:
+            return headers
+        if entry["etag"] is not None:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"] is not None:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, endpoint: str, key: str, policy: CachePolicy, status_code: int, headers,
+              content: bytes) -> None:
+
+        if "no-store" in headers.get("Cache-Control", "").lower():
+            return
+        now = time()
+        self._backend.set(key, {
+            "status_code": status_code,
+            "headers": {"Content-Type": headers.get("Content-Type", "application/json")},
+            "content": content,
+            "stored_at": now,
+            "expires_at": now + policy.ttl,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified")
+        })
+        self._count(endpoint, STORED)
+
+    def refresh(self, endpoint: str, key: str, policy: CachePolicy, entry: dict, headers) -> dict:
+
+        now = time()
+        entry = {
+            **entry,
+            "stored_at": now,
+            "expires_at": now + policy.ttl,
+            "etag": headers.get("ETag", entry["etag"]),
+            "last_modified": headers.get("Last-Modified", entry["last_modified"])
+        }
+        self._backend.set(key, entry)
+        self._count(endpoint, REVALIDATED)
+        return entry
+
+    def invalidate(self, scope: str, method_name: str, path: str, data: Optional[dict] = None) -> None:
+
+        self._backend.delete(self.key(scope, method_name, path, data))
+
+    def clear(self) -> None:
+
+        self._backend.clear()
+        with self._lock:
+            self._stats.clear()
+
+    def stats(self) -> dict:
+
+        with self._lock:
+            endpoints = {endpoint: dict(counters) for endpoint, counters in self._stats.items()}
+        totals = {outcome: sum(counters[outcome] for counters in endpoints.values())
+                  for outcome in (HIT, MISS, REVALIDATED, STORED)}
+        lookups = totals[HIT] + totals[MISS]
+        return {
+            **totals,
+            "hit_ratio": totals[HIT] / lookups if lookups > 0 else None,
+            "endpoints": endpoints
+        }
@@ -0,0 +1,238 @@
+# IMPORTING STANDARD PACKAGES
+import heapq
+
+from collections import deque, defaultdict
+from concurrent.futures import Future
+from itertools import count
+from threading import Thread, Condition
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Any, Deque
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.concurrency import describe_error
+from unipile_integration.data import WorkResult
+from unipile_integration.quota import QuotaTracker
+
+
+class WorkItem:
+
+    __slots__ = ("owner_id", "func", "args", "kwargs", "action", "priority", "future", "submitted_at")
+
+    def __init__(self, owner_id: str, func: Callable[..., Any], args: tuple, kwargs: dict,
+                 action: Optional[str] = None, priority: int = 0):
+
+        self.owner_id = owner_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.action = action
+        self.priority = priority
+        self.future = Future()
+        self.submitted_at = perf_counter()
+
+
+class AccountScheduler:
+    _workers: int
+    _account_concurrency: int
+    _quota: Optional[QuotaTracker]
+    _weights: Dict[str, int]
+    _default_weight: int
+    _pending: Dict[str, list]
+    _ring: Deque[str]
+    _credits: Dict[str, int]
+    _in_flight: Dict[str, int]
+    _sequence: count
+    _condition: Condition
+    _threads: List[Thread]
+    _stopped: bool
+    _queued: int
+    _running: int
+    completed: Dict[str, int]
+    failed: int
+    deferred: int
+
+    def __init__(self, workers: int = 10, account_concurrency: int = 2, quota: QuotaTracker = None,
+                 weights: Dict[str, int] = None, default_weight: int = 1):
+
+        self._workers = workers
+        self._account_concurrency = account_concurrency
+        self._quota = quota
+        self._weights = dict(weights) if weights is not None else {}
+        self._default_weight = default_weight
+        self._pending = {}
+        self._ring = deque()
+        self._credits = {}
+        self._in_flight = defaultdict(int)
+        self._sequence = count()
+        self._condition = Condition()
+        self._threads = []
+        self._stopped = False
+        self._queued = 0
+        self._running = 0
+        self.completed = defaultdict(int)
+        self.failed = 0
+        self.deferred = 0
+
+    def _weight(self, owner_id: str) -> int:
+
+        return max(self._weights.get(owner_id, self._default_weight), 1)
+
+    def set_weight(self, owner_id: str, weight: int) -> None:
+
+        with self._condition:
+            self._weights[owner_id] = weight
+
+    def submit(self, owner_id: str, func: Callable[..., Any], *args, action: str = None, priority: int = 0,
+               **kwargs) -> "Future[WorkResult]":
+
+        item = WorkItem(owner_id, func, args, kwargs, action=action, priority=priority)
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("the scheduler is stopped")
+            pending = self._pending.get(owner_id)
+            if pending is None:
+                pending = self._pending[owner_id] = []
+                self._ring.append(owner_id)
+                self._credits[owner_id] = self._weight(owner_id)
+            # higher priority first, FIFO within the same priority
+            heapq.heappush(pending, (-priority, next(self._sequence), item))
+            self._queued += 1
+            self._condition.notify()
+        return item.future
+
+    def _next_item(self) -> Optional[WorkItem]:
+
+        # the first account in ring order below its concurrency limit wins and keeps the turn for `weight`
+        # items, priority only orders an account's own queue so a busy account cannot starve the others
+        best_owner = next((owner_id for owner_id in self._ring
+                           if self._in_flight[owner_id] < self._account_concurrency), None)
+        if best_owner is None:
+            return None
+        pending = self._pending[best_owner]
+        _, _, item = heapq.heappop(pending)
+        self._credits[best_owner] -= 1
+        if len(pending) == 0:
+            self._ring.remove(best_owner)
+            del self._pending[best_owner]
+            del self._credits[best_owner]
+        elif self._credits[best_owner] <= 0:
+            self._ring.remove(best_owner)
+            self._ring.append(best_owner)
+            self._credits[best_owner] = self._weight(best_owner)
+        self._in_flight[best_owner] += 1
+        self._queued -= 1
+        self._running += 1
+        return item
+
+    def _run(self, item: WorkItem) -> WorkResult:
+
+        started_at = perf_counter()
+        result = {
+            "owner_id": item.owner_id,
+            "action": item.action,
+            "waited": started_at - item.submitted_at
+        }
+        if self._quota is not None and item.action is not None \
+                and not self._quota.try_acquire(item.owner_id, item.action):
+            return WorkResult(**result, **{
+                "status": WorkResult.DEFERRED,
+                "error": "quota exceeded"
+            })
+        try:
+            value = item.func(*item.args, **item.kwargs)
+        except Exception as e:
+            if self._quota is not None and item.action is not None:
+                self._quota.release(item.owner_id, item.action)
+            return WorkResult(**result, **{
+                "status": WorkResult.FAILED,
+                "error": describe_error(e),
+                "elapsed": perf_counter() - started_at
+            })
+        return WorkResult(**result, **{
+            "value": value,
+            "elapsed": perf_counter() - started_at
+        })
+
+    def _work(self) -> None:
+
+        while True:
+            with self._condition:
+                item = self._next_item()
+                while item is None:
+                    if self._stopped:
+                        return
+                    self._condition.wait()
+                    item = self._next_item()
+            result = self._run(item)
+            item.future.set_result(result)
+            with self._condition:
+                self._in_flight[item.owner_id] -= 1
+                self._running -= 1
+                if result.status == WorkResult.DEFERRED:
+                    self.deferred += 1
+                elif result.status == WorkResult.FAILED:
+                    self.failed += 1
+                self.completed[item.owner_id] += 1
+                # the account may be runnable again and join() may be waiting for the last item
+                self._condition.notify_all()
+
+    def start(self) -> "AccountScheduler":
+
+        with self._condition:
+            self._stopped = False
+        self._threads = [Thread(target=self._work, daemon=True) for _ in range(self._workers)]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def join(self) -> None:
+
+        with self._condition:
+            while self._queued > 0 or self._running > 0:
+                self._condition.wait()
+
+    def _cancel_pending(self) -> None:
+
+        for owner_id, pending in self._pending.items():
+            for _, _, item in pending:
+                item.future.set_result(WorkResult(**{
+                    "owner_id": owner_id,
+                    "action": item.action,
+                    "status": WorkResult.CANCELLED,
+                    "waited": perf_counter() - item.submitted_at
+                }))
+        self._pending.clear()
+        self._ring.clear()
+        self._credits.clear()
+        self._queued = 0
+
+    def stop(self, drain: bool = True) -> None:
+
+        if drain:
+            self.join()
+        with self._condition:
+            self._stopped = True
+            self._cancel_pending()
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def stats(self) -> dict:
+
+        with self._condition:
+            return {
+                "queued": self._queued,
+                "running": self._running,
+                "completed": dict(self.completed),
+                "failed": self.failed,
+                "deferred": self.deferred
+            }
+
+    def __enter__(self) -> "AccountScheduler":
+
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+
+        self.stop()
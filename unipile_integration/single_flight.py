@@ -0,0 +1,96 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Dict, Hashable, Optional, Any, Awaitable
+
+
+class SingleFlight:
+    _calls: Dict[Hashable, Future]
+    _lock: Lock
+    executed: int
+    saved: int
+
+    def __init__(self):
+
+        self._calls = {}
+        self._lock = Lock()
+        self.executed = 0
+        self.saved = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any], share: Optional[Callable[[Any], Any]] = None) -> Any:
+
+        # share hands every waiter its own copy of a mutable result
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self.executed += 1
+            else:
+                self.saved += 1
+        if not leader:
+            result = future.result()
+            return share(result) if share is not None else result
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return share(result) if share is not None else result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def stats(self) -> dict:
+
+        return {
+            "executed": self.executed,
+            "saved": self.saved
+        }
+
+
+class AsyncSingleFlight:
+    _calls: Dict[Hashable, asyncio.Future]
+    executed: int
+    saved: int
+
+    def __init__(self):
+
+        self._calls = {}
+        self.executed = 0
+        self.saved = 0
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # mark the exception as retrieved when every waiter went away
+            task.exception()
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]],
+                 share: Optional[Callable[[Any], Any]] = None) -> Any:
+
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            self.executed += 1
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.saved += 1
+        # the shared call keeps running for the other waiters if this caller is cancelled
+        result = await asyncio.shield(task)
+        return share(result) if share is not None else result
+
+    def stats(self) -> dict:
+
+        return {
+            "executed": self.executed,
+            "saved": self.saved
+        }
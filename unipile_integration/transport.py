@@ -0,0 +1,396 @@
+# IMPORTING STANDARD PACKAGES
+import asyncio
+import hashlib
+
+from time import sleep
+from typing import Optional, Tuple
+
+# IMPORTING THIRD PARTY PACKAGES
+import requests
+
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.instrumentation import Instrumentation, RequestContext, NOOP_INSTRUMENTATION
+from unipile_integration.rate_limit import RateLimiter, RetryPolicy, parse_retry_after, extract_account_id
+from unipile_integration.response_cache import ResponseCache, CachePolicy
+from unipile_integration.single_flight import SingleFlight, AsyncSingleFlight
+
+
+class BaseTransport:
+
+    # the errors a request raises once its retries are spent
+    transport_errors: Tuple[type, ...] = ()
+
+    _base_endpoint_path: str
+    _timeout: Optional[float]
+    _headers: dict
+    _rate_limiter: RateLimiter
+    _retry_policy: RetryPolicy
+    _instrumentation: Instrumentation
+    _response_cache: Optional[ResponseCache]
+    _cache_scope: str
+
+    def __init__(self, auth_token: str, base_endpoint_path: str, timeout: Optional[float] = 30,
+                 headers: dict = None, rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None,
+                 instrumentation: Instrumentation = None, response_cache: ResponseCache = None):
+
+        self._base_endpoint_path = base_endpoint_path
+        self._timeout = timeout
+        self._headers = {
+            "X-API-KEY": auth_token,
+            **(headers if headers is not None else {})
+        }
+        self._rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._instrumentation = instrumentation if instrumentation is not None else NOOP_INSTRUMENTATION
+        self._response_cache = response_cache
+        # a cache may be shared between transports, entries never leak across API keys or base paths
+        self._cache_scope = f"{base_endpoint_path}#{hashlib.sha1(auth_token.encode('utf-8')).hexdigest()[:16]}"
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+
+        return self._retry_policy
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+
+        return self._instrumentation
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+
+        return self._response_cache
+
+    def _cache_policy(self, method_name: str, path: str, data: dict) -> Optional[CachePolicy]:
+
+        if self._response_cache is None:
+            return None
+        return self._response_cache.policy(method_name, path, data)
+
+    def _cache_lookup(self, method_name: str, path: str, data: dict,
+                      policy: CachePolicy) -> Tuple[str, str, Optional[dict], bool]:
+
+        endpoint = self._response_cache.endpoint(method_name, path)
+        key = self._response_cache.key(self._cache_scope, method_name, path, data)
+        entry, fresh = self._response_cache.lookup(endpoint, key, policy)
+        return endpoint, key, entry, fresh
+
+    def _cache_update(self, lookup: Tuple[str, str, Optional[dict], bool], policy: CachePolicy, method_name: str,
+                      path: str, response):
+
+        endpoint, key, entry, _ = lookup
+        if response.status_code == 304 and entry is not None:
+            entry = self._response_cache.refresh(endpoint, key, policy, entry, response.headers)
+            return self._cached_response(entry, method_name, path)
+        if response.status_code == 200:
+            self._response_cache.store(endpoint, key, policy, response.status_code, response.headers,
+                                       response.content)
+        return response
+
+    def _cached_response(self, entry: dict, method_name: str, path: str):
+        raise NotImplementedError
+
+    def _flight_key(self, method_name: str, path: str, timeout: Optional[float]) -> Tuple[str, str, Optional[float]]:
+
+        # session headers are fixed per transport, only the URL and the timeout tell two calls apart
+        return method_name, self._url(path), timeout if timeout is not None else self._timeout
+
+    def _share_response(self, response, method_name: str, path: str):
+
+        return self._cached_response({
+            "status_code": response.status_code,
+            "headers": response.headers,
+            "content": response.content
+        }, method_name, path)
+
+    @staticmethod
+    def _method_name(method_name: str) -> str:
+
+        return method_name if method_name in ("post", "delete") else "get"
+
+    @staticmethod
+    def _body_kwargs(method_name: str, data: dict, body_type: str) -> dict:
+
+        if method_name == "post":
+            return {
+                "json": data
+            } if body_type == "json" else {
+                "data": data
+            }
+        return {}
+
+    def _url(self, path: str) -> str:
+
+        return f"{self._base_endpoint_path}/{path}"
+
+    def _start_request(self, method_name: str, path: str, account_id: Optional[str],
+                       attempt: int) -> Optional[RequestContext]:
+
+        if not self._instrumentation.enabled:
+            return None
+        context = RequestContext(method_name, path, account_id=account_id, attempt=attempt)
+        self._instrumentation.before_request(context)
+        return context
+
+    def _finish_request(self, context: Optional[RequestContext], response=None, bytes_sent: int = 0,
+                        error: Optional[BaseException] = None) -> None:
+
+        if context is None:
+            return
+        if response is None:
+            context.finish(bytes_sent=bytes_sent, error=type(error).__name__)
+        else:
+            context.finish(status_code=response.status_code, bytes_sent=bytes_sent,
+                           bytes_received=len(response.content))
+        self._instrumentation.after_request(context)
+
+    def _record_retry(self, context: Optional[RequestContext], delay: float) -> None:
+
+        if context is not None:
+            self._instrumentation.on_retry(context, delay)
+
+    def _retry_delay(self, method_name: str, account_id: Optional[str], response, attempt: int) -> Optional[float]:
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if response.status_code == 429:
+            self._rate_limiter.penalize(account_id, retry_after)
+        elif response.status_code < 400:
+            self._rate_limiter.reward(account_id)
+        if self._retry_policy.should_retry(method_name, response.status_code, attempt):
+            return self._retry_policy.backoff(attempt, retry_after)
+        return None
+
+
+class HttpTransport(BaseTransport):
+
+    transport_errors = (requests.RequestException,)
+
+    _session: requests.Session
+    _single_flight: Optional[SingleFlight]
+
+    def __init__(self, auth_token: str, base_endpoint_path: str, pool_size: int = 10,
+                 timeout: Optional[float] = 30, headers: dict = None, rate_limiter: RateLimiter = None,
+                 retry_policy: RetryPolicy = None, coalesce_gets: bool = True,
+                 instrumentation: Instrumentation = None, response_cache: ResponseCache = None):
+
+        super().__init__(auth_token, base_endpoint_path, timeout=timeout, headers=headers,
+                         rate_limiter=rate_limiter, retry_policy=retry_policy, instrumentation=instrumentation,
+                         response_cache=response_cache)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(self._headers)
+        self._single_flight = SingleFlight() if coalesce_gets else None
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+
+        return self._single_flight
+
+    def request(self, path: str, data: dict, method_name: str = "post", body_type: str = "json",
+                timeout: Optional[float] = None) -> Response:
+
+        method_name = self._method_name(method_name)
+        policy = self._cache_policy(method_name, path, data)
+        if policy is not None:
+            send = lambda: self._cached_send(path, data, method_name, body_type, timeout, policy)
+        else:
+            send = lambda: self._send(path, data, method_name, body_type, timeout)
+        if method_name == "get" and self._single_flight is not None:
+            return self._single_flight.do(self._flight_key(method_name, path, timeout), send,
+                                          share=lambda response: self._share_response(response, method_name, path))
+        return send()
+
+    def _cached_response(self, entry: dict, method_name: str, path: str) -> Response:
+
+        response = Response()
+        response.status_code = entry["status_code"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["content"]
+        response.encoding = "utf-8"
+        response.url = self._url(path)
+        return response
+
+    def _cached_send(self, path: str, data: dict, method_name: str, body_type: str, timeout: Optional[float],
+                     policy: CachePolicy) -> Response:
+
+        lookup = self._cache_lookup(method_name, path, data, policy)
+        _, _, entry, fresh = lookup
+        if fresh:
+            return self._cached_response(entry, method_name, path)
+        response = self._send(path, data, method_name, body_type, timeout,
+                              headers=self._response_cache.conditional_headers(entry))
+        return self._cache_update(lookup, policy, method_name, path, response)
+
+    def _send(self, path: str, data: dict, method_name: str, body_type: str, timeout: Optional[float],
+              headers: dict = None) -> Response:
+
+        account_id = extract_account_id(path, data)
+        attempt = 0
+        while True:
+            wait = self._rate_limiter.reserve(account_id)
+            if wait > 0:
+                sleep(wait)
+            context = self._start_request(method_name, path, account_id, attempt)
+            try:
+                response = self._session.request(
+                    method_name.upper(),
+                    self._url(path),
+                    headers=headers,
+                    timeout=timeout if timeout is not None else self._timeout,
+                    **self._body_kwargs(method_name, data, body_type)
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._finish_request(context, error=e)
+                if not self._retry_policy.should_retry_error(method_name, attempt):
+                    raise
+                delay = self._retry_policy.backoff(attempt)
+                self._record_retry(context, delay)
+                sleep(delay)
+                attempt += 1
+                continue
+            if context is not None:
+                self._finish_request(context, response, bytes_sent=len(response.request.body or b""))
+            delay = self._retry_delay(method_name, account_id, response, attempt)
+            if delay is None:
+                return response
+            self._record_retry(context, delay)
+            response.close()
+            sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+
+        self._session.close()
+
+    def __enter__(self) -> "HttpTransport":
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+
+        self.close()
+
+
+class AsyncHttpTransport(BaseTransport):
+
+    transport_errors = (httpx.HTTPError,) if httpx is not None else ()
+
+    _client: "httpx.AsyncClient"
+    _single_flight: Optional[AsyncSingleFlight]
+
+    def __init__(self, auth_token: str, base_endpoint_path: str, pool_size: int = 10,
+                 timeout: Optional[float] = 30, headers: dict = None, rate_limiter: RateLimiter = None,
+                 retry_policy: RetryPolicy = None, coalesce_gets: bool = True,
+                 instrumentation: Instrumentation = None, response_cache: ResponseCache = None):
+
+        if httpx is None:
+            raise ImportError("AsyncHttpTransport requires httpx, "
+                              "install it with `pip install unipile_integration[async]`")
+        super().__init__(auth_token, base_endpoint_path, timeout=timeout, headers=headers,
+                         rate_limiter=rate_limiter, retry_policy=retry_policy, instrumentation=instrumentation,
+                         response_cache=response_cache)
+        self._client = httpx.AsyncClient(
+            headers=self._headers,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            timeout=timeout
+        )
+        self._single_flight = AsyncSingleFlight() if coalesce_gets else None
+
+    @property
+    def single_flight(self) -> Optional[AsyncSingleFlight]:
+
+        return self._single_flight
+
+    async def request(self, path: str, data: dict, method_name: str = "post", body_type: str = "json",
+                      timeout: Optional[float] = None) -> "httpx.Response":
+
+        method_name = self._method_name(method_name)
+        policy = self._cache_policy(method_name, path, data)
+        if policy is not None:
+            send = lambda: self._cached_send(path, data, method_name, body_type, timeout, policy)
+        else:
+            send = lambda: self._send(path, data, method_name, body_type, timeout)
+        if method_name == "get" and self._single_flight is not None:
+            share = lambda response: self._share_response(response, method_name, path)
+            return await self._single_flight.do(self._flight_key(method_name, path, timeout), send, share=share)
+        return await send()
+
+    def _cached_response(self, entry: dict, method_name: str, path: str) -> "httpx.Response":
+
+        return httpx.Response(entry["status_code"], headers=entry["headers"], content=entry["content"],
+                              request=httpx.Request(method_name.upper(), self._url(path)))
+
+    async def _cached_send(self, path: str, data: dict, method_name: str, body_type: str,
+                           timeout: Optional[float], policy: CachePolicy) -> "httpx.Response":
+
+        lookup = self._cache_lookup(method_name, path, data, policy)
+        _, _, entry, fresh = lookup
+        if fresh:
+            return self._cached_response(entry, method_name, path)
+        response = await self._send(path, data, method_name, body_type, timeout,
+                                    headers=self._response_cache.conditional_headers(entry))
+        return self._cache_update(lookup, policy, method_name, path, response)
+
+    async def _send(self, path: str, data: dict, method_name: str, body_type: str,
+                    timeout: Optional[float], headers: dict = None) -> "httpx.Response":
+
+        account_id = extract_account_id(path, data)
+        attempt = 0
+        while True:
+            wait = self._rate_limiter.reserve(account_id)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            context = self._start_request(method_name, path, account_id, attempt)
+            try:
+                response = await self._client.request(
+                    method_name.upper(),
+                    self._url(path),
+                    headers=headers,
+                    timeout=timeout if timeout is not None else self._timeout,
+                    **self._body_kwargs(method_name, data, body_type)
+                )
+            except httpx.TransportError as e:
+                self._finish_request(context, error=e)
+                if not self._retry_policy.should_retry_error(method_name, attempt):
+                    raise
+                delay = self._retry_policy.backoff(attempt)
+                self._record_retry(context, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            if context is not None:
+                self._finish_request(context, response, bytes_sent=len(response.request.content))
+            delay = self._retry_delay(method_name, account_id, response, attempt)
+            if delay is None:
+                return response
+            self._record_retry(context, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncHttpTransport":
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+
+        await self.aclose()
@@ -0,0 +1,349 @@
+# IMPORTING STANDARD PACKAGES
+import hmac
+import ipaddress
+import json
+
+from collections import defaultdict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from queue import Queue, Full, Empty
+from threading import Thread, Event, Lock
+from typing import Callable, Dict, List, Optional, Iterable
+
+# IMPORTING THIRD PARTY PACKAGES
+import requests
+
+# IMPORTING LOCAL PACKAGES
+from unipile_integration.data import MessageChat, RelationData, WebhookEvent
+
+MESSAGE_EVENTS = ("message_received", "message_read", "message_reaction", "message_edited", "message_deleted",
+                  "message_delivered")
+RELATION_EVENTS = ("new_relation",)
+ACCOUNT_STATUS_EVENT = "account_status"
+ANY_EVENT = "*"
+
+WebhookHandler = Callable[[WebhookEvent], None]
+
+LOOPBACK_HOST = "127.0.0.1"
+MAX_BODY_SIZE = 1024 * 1024
+
+
+def _message_from_payload(payload: dict) -> MessageChat:
+
+    sender = payload.get("sender") if payload.get("sender") is not None else {}
+    return MessageChat(**{
+        "id": payload.get("message_id"),
+        "attachments": payload.get("attachments", []),
+        "timestamp": payload.get("timestamp"),
+        "chat_id": payload.get("chat_id"),
+        "chat_provider_id": payload.get("provider_chat_id"),
+        "sender_id": sender.get("attendee_provider_id"),
+        "text": payload.get("message"),
+    })
+
+
+def _relation_from_payload(payload: dict) -> RelationData:
+
+    full_name = (payload.get("user_full_name") or "").strip()
+    first_name, _, last_name = full_name.partition(" ")
+    return RelationData(**{
+        "created_at": payload.get("timestamp"),
+        "first_name": first_name or None,
+        "last_name": last_name or None,
+        "member_id": payload.get("user_provider_id"),
+        "public_identifier": payload.get("user_public_identifier"),
+        "headline": payload.get("user_headline"),
+    })
+
+
+def parse_event(payload: dict) -> Optional[WebhookEvent]:
+
+    if not isinstance(payload, dict):
+        return None
+    account_status = payload.get("AccountStatus")
+    if isinstance(account_status, dict):
+        return WebhookEvent(**{
+            "event": ACCOUNT_STATUS_EVENT,
+            "account_id": account_status.get("account_id"),
+            "status": account_status.get("message"),
+            "payload": payload
+        })
+    event = payload.get("event")
+    if event is None:
+        return None
+    return WebhookEvent(**{
+        "event": event,
+        "account_id": payload.get("account_id"),
+        "message": _message_from_payload(payload) if event in MESSAGE_EVENTS else None,
+        "relation": _relation_from_payload(payload) if event in RELATION_EVENTS else None,
+        "payload": payload
+    })
+
+
+class WebhookDispatcher:
+    _handlers: Dict[str, List[WebhookHandler]]
+    _queue: "Queue[WebhookEvent]"
+    _workers: int
+    _threads: List[Thread]
+    _stopped: Event
+    _lock: Lock
+    dispatched: int
+    rejected: int
+    failed: int
+
+    def __init__(self, queue_size: int = 1000, workers: int = 1):
+
+        self._handlers = defaultdict(list)
+        self._queue = Queue(maxsize=queue_size)
+        self._workers = workers
+        self._threads = []
+        self._stopped = Event()
+        self._lock = Lock()
+        self.dispatched = 0
+        self.rejected = 0
+        self.failed = 0
+
+    def register(self, event: str, handler: WebhookHandler) -> None:
+
+        self._handlers[event].append(handler)
+
+    def on_message(self, handler: WebhookHandler) -> None:
+
+        for event in MESSAGE_EVENTS:
+            self.register(event, handler)
+
+    def on_relation(self, handler: WebhookHandler) -> None:
+
+        for event in RELATION_EVENTS:
+            self.register(event, handler)
+
+    def on_account_status(self, handler: WebhookHandler) -> None:
+
+        self.register(ACCOUNT_STATUS_EVENT, handler)
+
+    def submit(self, event: WebhookEvent, timeout: Optional[float] = None) -> bool:
+
+        try:
+            self._queue.put(event, timeout=timeout)
+            return True
+        except Full:
+            with self._lock:
+                self.rejected += 1
+            return False
+
+    def submit_payload(self, payload: dict, timeout: Optional[float] = None) -> Optional[bool]:
+
+        event = parse_event(payload)
+        if event is None:
+            return None
+        return self.submit(event, timeout=timeout)
+
+    def _handle(self, event: WebhookEvent) -> None:
+
+        for handler in self._handlers.get(event.event, []) + self._handlers.get(ANY_EVENT, []):
+            try:
+                handler(event)
+            except Exception:
+                with self._lock:
+                    self.failed += 1
+        with self._lock:
+            self.dispatched += 1
+
+    def _work(self) -> None:
+
+        while not self._stopped.is_set():
+            try:
+                event = self._queue.get(timeout=0.1)
+            except Empty:
+                continue
+            try:
+                self._handle(event)
+            finally:
+                self._queue.task_done()
+
+    def start(self) -> "WebhookDispatcher":
+
+        self._stopped.clear()
+        self._threads = [Thread(target=self._work, daemon=True) for _ in range(self._workers)]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def join(self) -> None:
+
+        self._queue.join()
+
+    def stop(self, drain: bool = True) -> None:
+
+        # without running workers nothing would ever drain the queue
+        if drain and len(self._threads) > 0:
+            self.join()
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self) -> "WebhookDispatcher":
+
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+
+        self.stop()
+
+
+class _WebhookRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    receiver: "WebhookReceiver"
+
+    def _reply(self, status: int, headers: dict = None) -> None:
+
+        self.send_response(status)
+        for name, value in (headers if headers is not None else {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _reject(self, status: int) -> None:
+
+        # the body is left unread, the connection cannot be reused for another request
+        self.close_connection = True
+        self._reply(status)
+
+    def _content_length(self) -> Optional[int]:
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            return None
+        return length if length >= 0 else None
+
+    def do_POST(self) -> None:
+
+        receiver = self.receiver
+        if receiver.path is not None and self.path.split("?")[0] != receiver.path:
+            return self._reject(404)
+        if not receiver.is_authorized(self.headers.get(receiver.auth_header)):
+            return self._reject(401)
+        length = self._content_length()
+        if length is None:
+            return self._reject(400)
+        if length > receiver.max_body_size:
+            return self._reject(413)
+        body = self.rfile.read(length)
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return self._reply(400)
+        accepted = receiver.dispatcher.submit_payload(payload, timeout=receiver.enqueue_timeout)
+        if accepted is False:
+            return self._reply(503, {"Retry-After": str(receiver.retry_after)})
+        self._reply(200)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def is_loopback(host: str) -> bool:
+
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class WebhookReceiver:
+    dispatcher: WebhookDispatcher
+    path: Optional[str]
+    auth_header: str
+    auth_token: Optional[str]
+    enqueue_timeout: float
+    retry_after: int
+    max_body_size: int
+    _server: ThreadingHTTPServer
+    _thread: Optional[Thread]
+
+    def __init__(self, dispatcher: WebhookDispatcher, host: str = LOOPBACK_HOST, port: int = 8080,
+                 path: Optional[str] = "/unipile/webhook", auth_token: str = None,
+                 auth_header: str = "Unipile-Auth", enqueue_timeout: float = 1, retry_after: int = 5,
+                 max_body_size: int = MAX_BODY_SIZE):
+
+        if auth_token is None and not is_loopback(host):
+            raise ValueError(f"a webhook receiver bound to {host} requires an auth_token")
+        self.dispatcher = dispatcher
+        self.path = path
+        self.auth_header = auth_header
+        self.auth_token = auth_token
+        self.enqueue_timeout = enqueue_timeout
+        self.retry_after = retry_after
+        self.max_body_size = max_body_size
+        handler = type("WebhookRequestHandler", (_WebhookRequestHandler,), {"receiver": self})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def is_authorized(self, token: Optional[str]) -> bool:
+
+        if self.auth_token is None:
+            return True
+        return token is not None and hmac.compare_digest(token.encode(), self.auth_token.encode())
+
+    @property
+    def url(self) -> str:
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.path if self.path is not None else '/'}"
+
+    def start(self) -> "WebhookReceiver":
+
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "WebhookReceiver":
+
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+
+        self.stop()
+
+
+def load_recorded_events(path: str) -> List[dict]:
+
+    with open(path) as f:
+        content = f.read().strip()
+    if content.startswith("["):
+        return json.loads(content)
+    return [json.loads(line) for line in content.splitlines() if line.strip() != ""]
+
+
+def replay_events(payloads: Iterable[dict], dispatcher: WebhookDispatcher, timeout: Optional[float] = None) -> int:
+
+    replayed = 0
+    for payload in payloads:
+        if dispatcher.submit_payload(payload, timeout=timeout):
+            replayed += 1
+    dispatcher.join()
+    return replayed
+
+
+def replay_events_http(payloads: Iterable[dict], url: str, headers: dict = None) -> Dict[int, int]:
+
+    status_codes = defaultdict(int)
+    with requests.Session() as session:
+        for payload in payloads:
+            response = session.post(url, json=payload, headers=headers)
+            status_codes[response.status_code] += 1
+    return dict(status_codes)